@@ -13,14 +13,51 @@
 # This is the CONTROLLER of your backend architecture.
 # ================================================================
 
-from fastapi import FastAPI, UploadFile, File
+import time
+
+_BOOT_STARTED = time.perf_counter()
+
+from fastapi import FastAPI, UploadFile, File, HTTPException, Request
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse, StreamingResponse
+from pydantic import BaseModel
+from typing import List, Optional
+import asyncio
+import hashlib
+import json
+import logging
 import os
+import uuid
 
 # Import service modules (these files we will create next)
 from services.stt_service import speech_to_text
-from nlp.pipeline import process_transcript as run_nlp_pipeline
+from nlp.pipeline import iter_tasks, process_transcripts
 from assingment.assingment_logic import assign_tasks
+from api.jobs import JobManager, QueueFullError
+from core.lazy import load_report, warm_up
+from core.logging_config import configure_logging
+from core.metrics import Gauge, render_prometheus, stage_timer
+from mlmodel import hot_reload
+from mlmodel.registry import RegistryError, activate_version
+from services.feedback_service import (
+    FeedbackQueueFullError,
+    FeedbackWorker,
+    corrections_for,
+)
+from core.pipeline_pool import (
+    run_pipeline,
+    run_pipeline_sync,
+    shutdown_pool,
+    start_pool,
+)
+
+configure_logging()
+logger = logging.getLogger(__name__)
+
+# Heavy artifacts (joblib models, spaCy, STT client) are lazy, so
+# importing this module stays cheap; see the warm-up section below.
+IMPORT_SECONDS = time.perf_counter() - _BOOT_STARTED
 
 
 # ---------------------------------------------------------------
@@ -48,46 +85,469 @@ app.add_middleware(
 TEMP_DIR = "backend/temp/uploaded_audio"
 os.makedirs(TEMP_DIR, exist_ok=True)
 
+# Uploads are streamed to disk in chunks of this size (bytes)
+UPLOAD_CHUNK_SIZE = int(os.getenv("UPLOAD_CHUNK_SIZE", str(1024 * 1024)))
+
+
+def _unique_upload_path(filename: str) -> str:
+    """
+    Per-request temp path. Only the extension of the client filename is
+    kept (MIME detection needs it), so concurrent uploads of the same
+    name never overwrite each other.
+    """
+    _, ext = os.path.splitext(os.path.basename(filename or ""))
+    return os.path.join(TEMP_DIR, f"{uuid.uuid4().hex}{ext.lower()}")
+
+
+def _remove_quietly(path: str):
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+async def _save_upload(file: UploadFile):
+    """
+    Stream an upload to disk chunk by chunk without blocking the event loop.
+
+    Returns ``(file_path, sha256_hex)``; the digest is computed while
+    streaming and keys the transcript cache.
+    """
+    file_path = _unique_upload_path(file.filename)
+    digest = hashlib.sha256()
+    with stage_timer("upload_save"):
+        out = await run_in_threadpool(open, file_path, "wb")
+        try:
+            while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+                digest.update(chunk)
+                await run_in_threadpool(out.write, chunk)
+        except BaseException:
+            await run_in_threadpool(out.close)
+            await run_in_threadpool(_remove_quietly, file_path)
+            raise
+        await run_in_threadpool(out.close)
+    return file_path, digest.hexdigest()
+
 
 # ---------------------------------------------------------------
 # API: Upload Meeting Audio
 #
 # Steps:
 #   1. Receive audio file (.mp3 / .wav)
-#   2. Save to temp directory
-#   3. Convert to text (Speech-to-Text)
-#   4. Extract tasks from text (NLP)
+#   2. Stream to a unique temp file
+#   3. Convert to text (Speech-to-Text) in a worker thread
+#   4. Extract tasks from text (NLP, process pool if configured)
 #   5. Assign tasks to appropriate team member
 #   6. Return JSON response
-def _process_tasks(transcript: str, auto_assign: bool = True):
-    """
-    Run the NLP pipeline and optionally apply assignment logic.
-    """
-    tasks = run_nlp_pipeline(transcript)
-
-    if auto_assign and tasks:
-        return assign_tasks(tasks)
-
-    return tasks
-
-
 @app.post("/upload-audio")
 async def upload_audio(file: UploadFile = File(...)):
-    # Save file
-    file_path = f"{TEMP_DIR}/{file.filename}"
-    with open(file_path, "wb") as f:
-        f.write(await file.read())
+    # Save file (streamed, unique per request)
+    file_path, audio_sha256 = await _save_upload(file)
 
-    # STT → Transcript
-    transcript = speech_to_text(file_path)
+    try:
+        # STT → Transcript (blocking network call, kept off the event loop;
+        # duplicate audio is answered from the transcript cache)
+        transcript = await run_in_threadpool(speech_to_text, file_path, audio_sha256)
 
-    # Process transcript through hybrid pipeline
-    tasks = _process_tasks(transcript, auto_assign=True)
+        # Process transcript through hybrid pipeline (CPU-bound; runs in
+        # the process pool when PIPELINE_WORKERS > 0, else a thread)
+        tasks = await run_pipeline(transcript, True)
+    finally:
+        await run_in_threadpool(_remove_quietly, file_path)
 
     return {
         "transcript": transcript,
         "tasks": tasks
     }
+
+# ---------------------------------------------------------------
+# API: Streaming Transcript → Tasks
+#
+# Tasks are emitted as soon as each sentence batch is processed,
+# as NDJSON (default) or Server-Sent Events (?format=sse or
+# Accept: text/event-stream).
+# ---------------------------------------------------------------
+class TranscriptRequest(BaseModel):
+    transcript: str
+    auto_assign: bool = True
+
+
+def _stream_tasks(transcript: str, auto_assign: bool):
+    for task in iter_tasks(transcript):
+        if auto_assign:
+            task = assign_tasks([task])[0]
+        yield task
+
+
+def _ndjson_events(tasks):
+    for task in tasks:
+        yield json.dumps(task) + "\n"
+
+
+def _sse_events(tasks):
+    count = 0
+    for task in tasks:
+        count += 1
+        yield f"event: task\ndata: {json.dumps(task)}\n\n"
+    yield f"event: done\ndata: {json.dumps({'count': count})}\n\n"
+
+
+@app.post("/transcript/stream")
+def stream_transcript(body: TranscriptRequest, request: Request, format: str = None):
+    # Sync generators are iterated in the threadpool by Starlette,
+    # so the CPU-bound pipeline never blocks the event loop.
+    tasks = _stream_tasks(body.transcript, body.auto_assign)
+
+    wants_sse = format == "sse" or (
+        format is None and "text/event-stream" in request.headers.get("accept", "")
+    )
+    if wants_sse:
+        return StreamingResponse(
+            _sse_events(tasks),
+            media_type="text/event-stream",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        )
+
+    return StreamingResponse(_ndjson_events(tasks), media_type="application/x-ndjson")
+
+
+# ---------------------------------------------------------------
+# API: Bulk Transcripts (backfill)
+#
+# Body: JSON array of transcripts (strings or {"id", "transcript"}),
+# {"transcripts": [...]} or NDJSON, one transcript per line. All transcripts go through
+# one vectorized classification pass and batched nlp.pipe.
+#   BULK_MAX_TRANSCRIPTS  transcripts per request
+#   BULK_MAX_PROCESSES    upper bound for ?n_process=
+# ---------------------------------------------------------------
+BULK_MAX_TRANSCRIPTS = int(os.getenv("BULK_MAX_TRANSCRIPTS", "10000"))
+BULK_MAX_PROCESSES = int(os.getenv("BULK_MAX_PROCESSES", str(os.cpu_count() or 1)))
+
+
+def _parse_bulk_body(raw: bytes, content_type: str):
+    text = raw.decode("utf-8")
+
+    if "ndjson" in content_type or "jsonlines" in content_type:
+        items = [json.loads(line) for line in text.splitlines() if line.strip()]
+    else:
+        items = json.loads(text)
+        if isinstance(items, dict):
+            if "transcripts" not in items:
+                raise ValueError("Expected a JSON array or an object with a 'transcripts' array")
+            items = items["transcripts"]
+
+    if not isinstance(items, list):
+        raise ValueError("Expected a JSON array or NDJSON lines of transcripts")
+
+    ids, transcripts = [], []
+    for index, item in enumerate(items):
+        if isinstance(item, str):
+            ids.append(index)
+            transcripts.append(item)
+        elif isinstance(item, dict) and isinstance(item.get("transcript"), str):
+            ids.append(item.get("id", index))
+            transcripts.append(item["transcript"])
+        else:
+            raise ValueError(f"Item {index} is neither a string nor an object with 'transcript'")
+
+    return ids, transcripts
+
+
+def _process_bulk(transcripts, auto_assign: bool, batch_size: int, n_process: int):
+    results = process_transcripts(transcripts, batch_size=batch_size, n_process=n_process)
+    if auto_assign:
+        results = [assign_tasks(tasks) if tasks else tasks for tasks in results]
+    return results
+
+
+@app.post("/transcripts/bulk")
+async def bulk_transcripts(
+    request: Request,
+    auto_assign: bool = True,
+    batch_size: int = 256,
+    n_process: int = 1,
+):
+    try:
+        ids, transcripts = _parse_bulk_body(
+            await request.body(), request.headers.get("content-type", "")
+        )
+    except (ValueError, UnicodeDecodeError) as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+
+    if len(transcripts) > BULK_MAX_TRANSCRIPTS:
+        raise HTTPException(
+            status_code=413,
+            detail=f"At most {BULK_MAX_TRANSCRIPTS} transcripts per request",
+        )
+
+    results = await run_in_threadpool(
+        _process_bulk,
+        transcripts,
+        auto_assign,
+        max(1, batch_size),
+        min(max(1, n_process), BULK_MAX_PROCESSES),
+    )
+
+    return {
+        "count": len(results),
+        "results": [
+            {"id": item_id, "tasks": tasks}
+            for item_id, tasks in zip(ids, results)
+        ]
+    }
+
+
+# ---------------------------------------------------------------
+# API: Asynchronous Jobs
+#
+# POST /jobs returns a job id immediately; a bounded worker pool
+# runs STT → NLP → assignment in the background and GET /jobs/{id}
+# reports status, stage and the final result.
+#   JOB_WORKERS      concurrent jobs
+#   JOB_QUEUE_DEPTH  queued + running jobs before answering 429
+# ---------------------------------------------------------------
+job_manager = JobManager(
+    max_workers=int(os.getenv("JOB_WORKERS", "2")),
+    queue_depth=int(os.getenv("JOB_QUEUE_DEPTH", "16")),
+)
+
+
+def _run_audio_job(job, file_path: str, audio_sha256: str):
+    try:
+        job.set_stage("transcribing")
+        transcript = speech_to_text(file_path, audio_sha256)
+
+        job.set_stage("extracting")
+        tasks = run_pipeline_sync(transcript, auto_assign=False)
+
+        job.set_stage("assigning")
+        if tasks:
+            tasks = assign_tasks(tasks)
+
+        return {
+            "transcript": transcript,
+            "tasks": tasks
+        }
+    finally:
+        _remove_quietly(file_path)
+
+
+def _queue_full(exc=None):
+    return HTTPException(
+        status_code=429,
+        detail=str(exc) if exc else "Job queue is full, retry later",
+        headers={"Retry-After": "5"},
+    )
+
+
+@app.post("/jobs", status_code=202)
+async def submit_job(file: UploadFile = File(...)):
+    # Reject early so a burst does not pile uploads onto disk
+    if job_manager.is_full():
+        raise _queue_full()
+
+    file_path, audio_sha256 = await _save_upload(file)
+
+    try:
+        job = job_manager.submit(_run_audio_job, file_path, audio_sha256)
+    except QueueFullError as exc:
+        await run_in_threadpool(_remove_quietly, file_path)
+        raise _queue_full(exc)
+
+    return {
+        "job_id": job.id,
+        "status": job.status
+    }
+
+
+@app.get("/jobs/{job_id}")
+def get_job(job_id: str):
+    job = job_manager.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job.to_dict()
+
+
+@app.on_event("shutdown")
+def _shutdown_jobs():
+    job_manager.shutdown(wait=False)
+    shutdown_pool(wait=False)
+    feedback_worker.stop()
+    hot_reload.stop_watcher()
+
+
+# ---------------------------------------------------------------
+# API: Feedback (online learning)
+#
+# POST /feedback records user corrections; a background worker
+# applies them in micro-batches and swaps the updated task / name
+# model in without restarting. Pool workers and reloaded models
+# replay the same log. GET /feedback reports progress.
+# ---------------------------------------------------------------
+class FeedbackItem(BaseModel):
+    kind: str                       # task | name | assignee
+    text: str = ""
+    label: Optional[bool] = None
+    assignee: str = ""
+    previous: str = ""
+
+
+class FeedbackRequest(BaseModel):
+    corrections: List[FeedbackItem]
+
+
+feedback_worker = FeedbackWorker()
+
+
+@app.on_event("startup")
+def _start_feedback_worker():
+    feedback_worker.start()
+
+
+@app.post("/feedback", status_code=202)
+def submit_feedback(body: FeedbackRequest):
+    corrections = []
+    for item in body.corrections:
+        try:
+            corrections.extend(corrections_for(
+                item.kind, item.text, item.label, item.assignee, item.previous
+            ))
+        except ValueError as exc:
+            raise HTTPException(status_code=400, detail=str(exc))
+
+    try:
+        accepted = feedback_worker.submit(corrections)
+    except FeedbackQueueFullError as exc:
+        raise _queue_full(exc)
+
+    return {
+        "accepted": accepted,
+        "pending": feedback_worker.pending
+    }
+
+
+@app.get("/feedback")
+def feedback_status():
+    return feedback_worker.stats()
+
+
+# ---------------------------------------------------------------
+# API: Model versions (registry, hot reload, shadow scoring)
+#
+# GET  /models         live version, registry versions, metrics and
+#                      shadow agreement / latency per model
+# POST /models/reload  activate a version (optional) and swap it in;
+#                      pool workers follow via MODEL_WATCH_S polling
+# ---------------------------------------------------------------
+class ReloadRequest(BaseModel):
+    model: Optional[str] = None     # task | name; default: both
+    version: Optional[str] = None   # activate this version first
+
+
+@app.on_event("startup")
+def _start_model_watcher():
+    hot_reload.start_watcher()
+
+
+@app.get("/models")
+def models():
+    return hot_reload.status()
+
+
+@app.post("/models/reload")
+def reload_models(body: ReloadRequest = None):
+    body = body or ReloadRequest()
+    names = [body.model] if body.model else None
+
+    try:
+        if body.version:
+            if not body.model:
+                raise HTTPException(status_code=400, detail="'version' needs 'model'")
+            activate_version(body.model, body.version)
+        live = hot_reload.reload_models(names)
+    except (ValueError, RegistryError) as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+
+    return {"live": live}
+
+
+# ---------------------------------------------------------------
+# Model warm-up & cold-start budget
+#   WARMUP=startup        load every artifact before serving (default)
+#   WARMUP=first-request  load on the first incoming request
+#   WARMUP=lazy           each artifact loads when first needed
+#   STARTUP_BUDGET_S      cold-start budget reported by /startup
+# ---------------------------------------------------------------
+WARMUP_MODE = os.getenv("WARMUP", "startup").lower()
+STARTUP_BUDGET_S = float(os.getenv("STARTUP_BUDGET_S", "30"))
+
+startup_report = {}
+_warmup_lock = asyncio.Lock()
+
+
+def _warm_up_models():
+    report = warm_up()
+    report["import_seconds"] = IMPORT_SECONDS
+    report["cold_start_seconds"] = IMPORT_SECONDS + report["warm_up_seconds"]
+    report["budget_seconds"] = STARTUP_BUDGET_S
+    report["within_budget"] = report["cold_start_seconds"] <= STARTUP_BUDGET_S
+
+    for name, status in report["artifacts"].items():
+        logger.info("warm-up %-28s %s", name, status)
+    if not report["within_budget"]:
+        logger.warning(
+            "Cold start took %.2fs, over the %.2fs budget",
+            report["cold_start_seconds"], STARTUP_BUDGET_S,
+        )
+
+    startup_report.clear()
+    startup_report.update(report)
+
+
+@app.on_event("startup")
+async def _startup_warm_up():
+    if WARMUP_MODE == "startup":
+        await run_in_threadpool(_warm_up_models)
+        # PIPELINE_WORKERS > 0: spawn the pool now so workers preload models
+        startup_report["pipeline_workers"] = await run_in_threadpool(start_pool)
+
+
+@app.middleware("http")
+async def _first_request_warm_up(request: Request, call_next):
+    if WARMUP_MODE == "first-request" and not startup_report:
+        async with _warmup_lock:
+            if not startup_report:
+                await run_in_threadpool(_warm_up_models)
+    return await call_next(request)
+
+
+@app.get("/startup")
+def startup():
+    """Per-artifact load times and the cold-start budget check."""
+    if startup_report:
+        return startup_report
+    return {"warm_up": WARMUP_MODE, "import_seconds": IMPORT_SECONDS, **load_report()}
+
+
+# ---------------------------------------------------------------
+# Metrics (Prometheus text format)
+#   pipeline_stage_seconds{stage=...}  upload_save, stt, sentence_split,
+#                                      classification, name_scoring,
+#                                      assignment
+#   name_score_cache_{hits,misses}_total{cache=ml_prob|name_score}
+# ---------------------------------------------------------------
+Gauge("jobs_active", "Audio jobs queued or running.", lambda: job_manager.active)
+Gauge("feedback_pending", "Corrections waiting to be applied.", lambda: feedback_worker.pending)
+
+
+@app.get("/metrics", response_class=PlainTextResponse)
+def metrics():
+    return PlainTextResponse(
+        render_prometheus(),
+        media_type="text/plain; version=0.0.4; charset=utf-8",
+    )
+
+
 # ---------------------------------------------------------------
 # Health Check Route
 # Used by developers & frontend to verify backend is running.
@@ -0,0 +1,109 @@
+"""Background job tracking for long-running audio processing."""
+from __future__ import annotations
+
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from threading import Lock
+from typing import Any, Callable, Dict, Optional
+import time
+import uuid
+
+
+class QueueFullError(RuntimeError):
+    """Raised when a job is submitted while the queue is at capacity."""
+
+
+@dataclass
+class Job:
+    """State of one submitted job, as reported by ``GET /jobs/{id}``."""
+
+    id: str
+    status: str = "queued"  # queued | running | succeeded | failed
+    stage: str = "queued"
+    created_at: float = field(default_factory=time.time)
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    result: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+
+    def set_stage(self, stage: str) -> None:
+        self.stage = stage
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+class JobManager:
+    """Run jobs on a bounded worker pool with a bounded queue.
+
+    ``max_workers`` jobs run concurrently; at most ``queue_depth`` jobs may
+    be queued or running at once, after which :meth:`submit` raises
+    :class:`QueueFullError` so the API can answer 429. Finished jobs are
+    kept for lookup, oldest dropped first once ``history`` is exceeded.
+    """
+
+    def __init__(self, max_workers: int = 2, queue_depth: int = 16, history: int = 1000) -> None:
+        if max_workers < 1 or queue_depth < 1:
+            raise ValueError("max_workers and queue_depth must be >= 1")
+        self.max_workers = max_workers
+        self.queue_depth = queue_depth
+        self.history = history
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="job")
+        self._jobs: "OrderedDict[str, Job]" = OrderedDict()
+        self._active = 0
+        self._lock = Lock()
+
+    @property
+    def active(self) -> int:
+        """Jobs currently queued or running."""
+        return self._active
+
+    def is_full(self) -> bool:
+        return self._active >= self.queue_depth
+
+    def submit(self, runner: Callable[..., Dict[str, Any]], *args: Any) -> Job:
+        """Queue ``runner(job, *args)``; its return value becomes ``job.result``."""
+        with self._lock:
+            if self._active >= self.queue_depth:
+                raise QueueFullError(f"Job queue is full ({self.queue_depth} jobs pending)")
+            job = Job(id=uuid.uuid4().hex)
+            self._jobs[job.id] = job
+            self._active += 1
+            self._trim()
+
+        self._executor.submit(self._run, job, runner, args)
+        return job
+
+    def get(self, job_id: str) -> Optional[Job]:
+        return self._jobs.get(job_id)
+
+    def shutdown(self, wait: bool = True) -> None:
+        self._executor.shutdown(wait=wait)
+
+    def _run(self, job: Job, runner: Callable[..., Dict[str, Any]], args: tuple) -> None:
+        job.status = "running"
+        job.started_at = time.time()
+        try:
+            job.result = runner(job, *args)
+            job.status = "succeeded"
+            job.stage = "done"
+        except Exception as exc:
+            job.status = "failed"
+            job.error = str(exc) or exc.__class__.__name__
+        finally:
+            job.finished_at = time.time()
+            with self._lock:
+                self._active -= 1
+
+    def _trim(self) -> None:
+        # Only finished jobs are dropped; active ones are always reachable.
+        excess = len(self._jobs) - self.history
+        if excess <= 0:
+            return
+        for job_id in list(self._jobs):
+            if excess <= 0:
+                break
+            if self._jobs[job_id].finished_at is not None:
+                del self._jobs[job_id]
+                excess -= 1
@@ -8,24 +8,13 @@
 #   ✔ Provide fallback "Unassigned" if no match found
 #
 # NOTE:
-#   For now we use team_members.json to load team data.
+#   Team data comes from services/roster_service.py (JSON or SQLite,
+#   hot-reloaded, skills indexed by token).
 #   Later we can add ML-based assignment for more accuracy.
 # ==============================================================
 
-import json
-import os
-
-# ---------------------------------------------------------------
-# Load team member data from JSON file
-# ---------------------------------------------------------------
-
-TEAM_FILE = "backend/models/team_members.json"
-
-if os.path.exists(TEAM_FILE):
-    with open(TEAM_FILE, "r") as f:
-        team_members = json.load(f)
-else:
-    team_members = []
+from core.metrics import stage_timer
+from services.roster_service import get_roster
 
 
 # ---------------------------------------------------------------
@@ -52,32 +41,20 @@ def assign_tasks(task_list: list):
         list: Tasks with assigned team members.
     """
 
-    for task in task_list:
-        # 1️⃣ Direct assignment already found?
-        if task["assigned_to"]:
-            continue
-
-        task_text = task["task"].lower()
-        best_match = None
-        highest_score = 0
-
-        # ------------------------------------------
-        # 2️⃣ Skill-based assignment
-        # ------------------------------------------
-        for member in team_members:
-            score = 0
-
-            for skill in member.get("skills", []):
-                if skill.lower() in task_text:
-                    score += 1
-
-            if score > highest_score:
-                highest_score = score
-                best_match = member
-
-        # ------------------------------------------
-        # 3️⃣ Fallback assignment
-        # ------------------------------------------
-        task["assigned_to"] = best_match if best_match else "Unassigned"
+    with stage_timer("assignment"):
+        for task in task_list:
+            # 1️⃣ Direct assignment already found?
+            if task["assigned_to"]:
+                continue
+
+            # ------------------------------------------
+            # 2️⃣ Skill-based assignment (inverted skill index)
+            # ------------------------------------------
+            best_match = get_roster().best_for_skills(task["task"])
+
+            # ------------------------------------------
+            # 3️⃣ Fallback assignment
+            # ------------------------------------------
+            task["assigned_to"] = best_match if best_match else "Unassigned"
 
     return task_list
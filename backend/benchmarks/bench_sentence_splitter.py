@@ -0,0 +1,67 @@
+"""Compare SentenceSplitter strategies on synthetic meeting transcripts.
+
+Run from ``backend/``::
+
+    python -m benchmarks.bench_sentence_splitter --transcripts 200 --sentences 50
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import re
+import time
+
+from mlmodel.dataset import generate_action_sentence, generate_non_action_sentence
+from nlp.sentence_splitter import STRATEGIES, SentenceSplitter
+
+
+def build_transcripts(n_transcripts: int, n_sentences: int, punctuated: bool, seed: int = 7):
+    random.seed(seed)
+    transcripts = []
+    for _ in range(n_transcripts):
+        sentences = []
+        for _ in range(n_sentences):
+            s = generate_action_sentence() if random.random() < 0.6 else generate_non_action_sentence()
+            s = s.rstrip(".?!")
+            sentences.append(f"{s}." if punctuated else re.sub(r"[^\w\s]", "", s).lower())
+        transcripts.append(" ".join(sentences))
+    return transcripts
+
+
+def time_strategy(strategy: str, transcripts, repeat: int):
+    splitter = SentenceSplitter(strategy=strategy)
+    best = float("inf")
+    count = 0
+    for _ in range(repeat):
+        started = time.perf_counter()
+        count = len(splitter.split_many(transcripts))
+        best = min(best, time.perf_counter() - started)
+    return {"seconds": best, "sentences": count}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--transcripts", type=int, default=200)
+    parser.add_argument("--sentences", type=int, default=50, help="sentences per transcript")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--json", help="write results to this file")
+    args = parser.parse_args(argv)
+
+    results = {}
+    for style in ("punctuated", "unpunctuated"):
+        transcripts = build_transcripts(args.transcripts, args.sentences, style == "punctuated")
+        results[style] = {s: time_strategy(s, transcripts, args.repeat) for s in STRATEGIES}
+
+    print(f"{'input':<14}{'strategy':<10}{'seconds':>10}{'sentences':>11}")
+    for style, by_strategy in results.items():
+        for strategy, r in by_strategy.items():
+            print(f"{style:<14}{strategy:<10}{r['seconds']:>10.4f}{r['sentences']:>11}")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,177 @@
+"""Microbenchmarks for the extraction hot paths.
+
+Builds synthetic transcripts from the ``mlmodel/dataset.py`` generators,
+times each pipeline stage plus end-to-end ``process_transcript``, writes the
+results as JSON and fails when a stage got slower than the baseline by more
+than ``--threshold``.
+
+Run from ``backend/``::
+
+    python -m benchmarks.run_benchmarks --sizes 10,1000,10000 --output bench.json
+    python -m benchmarks.run_benchmarks --baseline bench.json --threshold 0.25
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import random
+import sys
+import time
+from typing import Callable, Dict, List
+
+from mlmodel.dataset import generate_action_sentence, generate_non_action_sentence
+
+NAMES = ["Sakshi", "Mohit", "Arjun", "Lata", "Priya", "Rahul"]
+
+
+def build_sentences(n: int, seed: int = 42) -> List[str]:
+    """``n`` meeting-like sentences; ~60% tasks, some with an assignee."""
+    random.seed(seed)
+    sentences = []
+    for _ in range(n):
+        if random.random() < 0.6:
+            sentence = generate_action_sentence()
+            if random.random() < 0.5:
+                sentence = f"{random.choice(NAMES)}, {sentence[0].lower()}{sentence[1:]}"
+        else:
+            sentence = generate_non_action_sentence()
+        sentences.append(sentence.rstrip(".?!") + ".")
+    return sentences
+
+
+def _best_of(fn: Callable[[], object], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def build_stages(sentences: List[str]) -> Dict[str, Callable[[], object]]:
+    # Imported here so `--help` works without the models installed.
+    from assingment.assingment_logic import assign_tasks
+    from mlmodel import name_ranker
+    from mlmodel.task_predictor import is_task_batch
+    from nlp.nlp_rules import extract_deadline, extract_priority
+    from nlp.pipeline import process_transcript, split_multi_tasks
+
+    transcript = " ".join(sentences)
+    words = [w for s in sentences for w in s.split()]
+
+    def name_score_cold():
+        name_ranker.clear_cache()
+        for word in words:
+            name_ranker.name_score(word)
+
+    def name_scores_batched():
+        name_ranker.clear_cache()
+        for sentence in sentences:
+            name_ranker.name_scores(sentence)
+
+    def deadline_priority():
+        for sentence in sentences:
+            lower = sentence.lower()
+            extract_deadline(lower)
+            extract_priority(lower)
+
+    def split_fragments():
+        for sentence in sentences:
+            split_multi_tasks(sentence)
+
+    def assignment():
+        # assign_tasks mutates its input, so build fresh task dicts each run
+        assign_tasks([{"task": s, "assigned_to": None} for s in sentences])
+
+    return {
+        "name_score": name_score_cold,
+        "name_scores_batched": name_scores_batched,
+        "is_task_batch": lambda: is_task_batch(sentences),
+        "split_multi_tasks": split_fragments,
+        "extract_deadline_priority": deadline_priority,
+        "assign_tasks": assignment,
+        "process_transcript": lambda: process_transcript(transcript),
+    }
+
+
+def run(sizes: List[int], repeat: int, only: List[str]) -> Dict[str, object]:
+    results: Dict[str, Dict[str, Dict[str, float]]] = {}
+    for size in sizes:
+        sentences = build_sentences(size)
+        stages = build_stages(sentences)
+        results[str(size)] = {}
+        for name, fn in stages.items():
+            if only and name not in only:
+                continue
+            seconds = _best_of(fn, repeat)
+            results[str(size)][name] = {
+                "seconds": seconds,
+                "us_per_sentence": seconds / size * 1e6,
+            }
+            print(f"{size:>8} {name:<28}{seconds:>10.4f}s {seconds / size * 1e6:>10.1f} µs/sentence")
+
+    return {
+        "meta": {
+            "timestamp": time.time(),
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "repeat": repeat,
+        },
+        "results": results,
+    }
+
+
+def find_regressions(current: Dict, baseline: Dict, threshold: float) -> List[str]:
+    """Stages slower than ``baseline * (1 + threshold)`` at the same size."""
+    regressions = []
+    for size, stages in current["results"].items():
+        for name, stat in stages.items():
+            base = baseline.get("results", {}).get(size, {}).get(name)
+            if not base:
+                continue
+            limit = base["seconds"] * (1 + threshold)
+            if stat["seconds"] > limit:
+                regressions.append(
+                    f"{name} @ {size}: {stat['seconds']:.4f}s > {limit:.4f}s "
+                    f"(baseline {base['seconds']:.4f}s +{threshold:.0%})"
+                )
+    return regressions
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the extraction hot paths.")
+    parser.add_argument("--sizes", default="10,1000,10000",
+                        help="comma-separated transcript sizes in sentences (e.g. 10,1000,100000)")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per stage; best time is kept")
+    parser.add_argument("--stages", default="", help="comma-separated subset of stages to run")
+    parser.add_argument("--output", help="write results JSON here")
+    parser.add_argument("--baseline", help="results JSON to compare against")
+    parser.add_argument("--threshold", type=float, default=0.20,
+                        help="allowed slowdown vs. baseline before failing (0.20 = 20%%)")
+    args = parser.parse_args(argv)
+
+    sizes = [int(s) for s in args.sizes.split(",") if s.strip()]
+    only = [s.strip() for s in args.stages.split(",") if s.strip()]
+    current = run(sizes, args.repeat, only)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(current, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = find_regressions(current, baseline, args.threshold)
+        if regressions:
+            print("\nPerformance regressions:")
+            for line in regressions:
+                print("  -", line)
+            return 1
+        print("\nNo regressions beyond threshold.")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,159 @@
+"""Lazily loaded, timed singletons for heavy artifacts (models, pipelines,
+API clients) plus a warm-up hook that loads them all up front."""
+from __future__ import annotations
+
+from threading import Lock, RLock
+from typing import Any, Callable, Dict, Iterable, List, Optional
+import logging
+import os
+import sys
+import time
+
+logger = logging.getLogger(__name__)
+
+_REGISTRY: "Dict[str, LazyArtifact]" = {}
+_REGISTRY_LOCK = Lock()
+
+
+def current_rss_mb() -> Optional[float]:
+    """Resident set size of this process in MiB (None if unavailable)."""
+    try:
+        with open("/proc/self/statm", "r") as f:
+            pages = int(f.read().split()[1])
+        return pages * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+    except (OSError, ValueError, IndexError, AttributeError):
+        pass
+    try:
+        import resource
+
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # Linux reports KiB, macOS bytes; this is the peak, not the current RSS
+        return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+    except (ImportError, OSError):
+        return None
+
+
+class LazyArtifact:
+    """Load ``loader()`` on first :meth:`get` and remember how long it took.
+
+    Every instance is registered by ``name`` so :func:`warm_up` and
+    :func:`load_report` can see all heavy artifacts of the process.
+    """
+
+    def __init__(self, name: str, loader: Callable[[], Any]) -> None:
+        self.name = name
+        self._loader = loader
+        self._value: Any = None
+        self._loaded = False
+        self._lock = RLock()
+        self.load_seconds: Optional[float] = None
+        self.loaded_at: Optional[float] = None
+        self.error: Optional[str] = None
+        self.rss_delta_mb: Optional[float] = None
+        with _REGISTRY_LOCK:
+            _REGISTRY[name] = self
+
+    @property
+    def loaded(self) -> bool:
+        return self._loaded
+
+    def get(self) -> Any:
+        if self._loaded:
+            return self._value
+        with self._lock:
+            if not self._loaded:
+                self._value = self._load()
+                self._loaded = True
+        return self._value
+
+    def reload(self) -> Any:
+        """Load a fresh copy and swap it in; readers never see a half-loaded value."""
+        value = self._load()
+        with self._lock:
+            self._value = value
+            self._loaded = True
+        return value
+
+    def set(self, value: Any) -> None:
+        """Replace the current value (e.g. with an updated in-memory model)."""
+        with self._lock:
+            self._value = value
+            self._loaded = True
+
+    def reset(self) -> None:
+        with self._lock:
+            self._value = None
+            self._loaded = False
+
+    def _load(self) -> Any:
+        rss_before = current_rss_mb()
+        started = time.perf_counter()
+        try:
+            value = self._loader()
+        except Exception as exc:
+            self.error = f"{exc.__class__.__name__}: {exc}"
+            raise
+        self.error = None
+        self.load_seconds = time.perf_counter() - started
+        self.loaded_at = time.time()
+        rss_after = current_rss_mb()
+        if rss_before is not None and rss_after is not None:
+            self.rss_delta_mb = rss_after - rss_before
+        logger.info(
+            "Loaded %s in %.3fs (RSS %+.1f MiB)",
+            self.name, self.load_seconds, self.rss_delta_mb or 0.0,
+        )
+        return value
+
+    def status(self) -> Dict[str, Any]:
+        return {
+            "loaded": self._loaded,
+            "seconds": self.load_seconds,
+            "rss_delta_mb": self.rss_delta_mb,
+            "error": self.error,
+        }
+
+
+def warm_up(names: Optional[Iterable[str]] = None) -> Dict[str, Any]:
+    """Load registered artifacts (all, or only ``names``) and report timings
+    and process RSS before / after.
+
+    Artifacts registered while warming up (e.g. a client created by another
+    artifact's loader) are loaded too. Failures are recorded, not raised, so
+    one missing credential does not keep the API from booting.
+    """
+    wanted = set(names) if names is not None else None
+    rss_before = current_rss_mb()
+    started = time.perf_counter()
+    attempted: List[str] = []
+
+    while True:
+        with _REGISTRY_LOCK:
+            pending = [
+                a for n, a in _REGISTRY.items()
+                if n not in attempted and (wanted is None or n in wanted)
+            ]
+        if not pending:
+            break
+        for artifact in pending:
+            attempted.append(artifact.name)
+            try:
+                artifact.get()
+            except Exception:
+                logger.exception("Warm-up failed for %s", artifact.name)
+
+    total = time.perf_counter() - started
+    report = load_report()
+    report["warm_up_seconds"] = total
+    report["rss_before_warm_up_mb"] = rss_before
+    return report
+
+
+def load_report() -> Dict[str, Any]:
+    with _REGISTRY_LOCK:
+        artifacts = {name: a.status() for name, a in _REGISTRY.items()}
+    return {
+        "artifacts": artifacts,
+        "total_load_seconds": sum(s["seconds"] or 0.0 for s in artifacts.values()),
+        "rss_mb": current_rss_mb(),
+    }
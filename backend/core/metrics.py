@@ -0,0 +1,211 @@
+"""In-process metrics (counters, gauges, histograms) rendered in the
+Prometheus text exposition format, plus per-stage latency timers."""
+from __future__ import annotations
+
+from bisect import bisect_left
+from contextlib import contextmanager
+from threading import Lock, local
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+import time
+
+LATENCY_BUCKETS = (
+    0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5,
+    1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0,
+)
+
+LabelKey = Tuple[Tuple[str, str], ...]
+
+_METRICS: "Dict[str, _Metric]" = {}
+_METRICS_LOCK = Lock()
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(labels: LabelKey, extra: Optional[Tuple[str, str]] = None) -> str:
+    pairs = list(labels) + ([extra] if extra else [])
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in pairs) + "}"
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class _Metric:
+    kind = "untyped"
+
+    def __init__(self, name: str, help: str) -> None:
+        self.name = name
+        self.help = help
+        self._lock = Lock()
+        with _METRICS_LOCK:
+            if name in _METRICS:
+                raise ValueError(f"Metric '{name}' is already registered")
+            _METRICS[name] = self
+
+    def render(self) -> List[str]:
+        return [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}"] + self._samples()
+
+    def _samples(self) -> List[str]:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def __init__(self, name: str, help: str) -> None:
+        super().__init__(name, help)
+        self._values: Dict[LabelKey, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        key = tuple(sorted(labels.items()))
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+        samples = getattr(_capture, "counters", None)
+        if samples is not None:
+            samples.append((self.name, amount, key))
+
+    def value(self, **labels: str) -> float:
+        with self._lock:
+            return self._values.get(tuple(sorted(labels.items())), 0.0)
+
+    def _samples(self) -> List[str]:
+        with self._lock:
+            items = list(self._values.items())
+        return [f"{self.name}{_format_labels(k)} {_format_value(v)}" for k, v in items]
+
+
+class Gauge(_Metric):
+    """Value read from a callback at scrape time."""
+
+    kind = "gauge"
+
+    def __init__(self, name: str, help: str, fn: Callable[[], float]) -> None:
+        super().__init__(name, help)
+        self._fn = fn
+
+    def _samples(self) -> List[str]:
+        try:
+            value = float(self._fn())
+        except Exception:
+            return []
+        return [f"{self.name} {_format_value(value)}"]
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(self, name: str, help: str, buckets: Sequence[float] = LATENCY_BUCKETS) -> None:
+        super().__init__(name, help)
+        self.buckets = tuple(sorted(buckets))
+        # per label set: [bucket counts..., +Inf count], sum
+        self._series: Dict[LabelKey, Tuple[List[int], float]] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = tuple(sorted(labels.items()))
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            counts, total = self._series.get(key, ([0] * (len(self.buckets) + 1), 0.0))
+            counts[index] += 1
+            self._series[key] = (counts, total + value)
+
+    def _samples(self) -> List[str]:
+        with self._lock:
+            items = [(k, list(c), s) for k, (c, s) in self._series.items()]
+        lines = []
+        for key, counts, total in items:
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += count
+                lines.append(
+                    f"{self.name}_bucket{_format_labels(key, ('le', _format_value(bound)))} {cumulative}"
+                )
+            lines.append(f"{self.name}_sum{_format_labels(key)} {_format_value(total)}")
+            lines.append(f"{self.name}_count{_format_labels(key)} {cumulative}")
+        return lines
+
+
+def render_prometheus() -> str:
+    with _METRICS_LOCK:
+        metrics = list(_METRICS.values())
+    lines: List[str] = []
+    for metric in metrics:
+        lines.extend(metric.render())
+    return "\n".join(lines) + "\n"
+
+
+# ---------------------------------------------------------------
+# Pipeline stage timing
+# ---------------------------------------------------------------
+STAGE_SECONDS = Histogram(
+    "pipeline_stage_seconds",
+    "Latency of each processing stage in seconds.",
+)
+STAGE_ERRORS = Counter(
+    "pipeline_stage_errors_total",
+    "Stage executions that raised an exception.",
+)
+
+_capture = local()
+
+
+def observe_stage(stage: str, seconds: float, ok: bool = True) -> None:
+    STAGE_SECONDS.observe(seconds, stage=stage)
+    if not ok:
+        STAGE_ERRORS.inc(stage=stage)
+    samples = getattr(_capture, "samples", None)
+    if samples is not None:
+        samples.append((stage, seconds, ok))
+
+
+@contextmanager
+def stage_timer(stage: str) -> Iterator[None]:
+    """Time the ``with`` block into ``pipeline_stage_seconds{stage=...}``."""
+    started = time.perf_counter()
+    ok = False
+    try:
+        yield
+        ok = True
+    finally:
+        observe_stage(stage, time.perf_counter() - started, ok)
+
+
+@contextmanager
+def capture_stages() -> Iterator[List[Tuple[str, float, bool]]]:
+    """Collect stage samples recorded by this thread (e.g. in a pool worker)
+    so they can be shipped back and :func:`merge_stages`-ed by the parent."""
+    previous = getattr(_capture, "samples", None)
+    _capture.samples = []
+    try:
+        yield _capture.samples
+    finally:
+        _capture.samples = previous
+
+
+def merge_stages(samples: Sequence[Tuple[str, float, bool]]) -> None:
+    for stage, seconds, ok in samples:
+        observe_stage(stage, seconds, ok)
+
+
+@contextmanager
+def capture_counters() -> Iterator[List[Tuple[str, float, LabelKey]]]:
+    """Like :func:`capture_stages`, for :class:`Counter` increments made by
+    this thread; the parent replays them with :func:`merge_counters`."""
+    previous = getattr(_capture, "counters", None)
+    _capture.counters = []
+    try:
+        yield _capture.counters
+    finally:
+        _capture.counters = previous
+
+
+def merge_counters(samples: Sequence[Tuple[str, float, LabelKey]]) -> None:
+    for name, amount, labels in samples:
+        counter = _METRICS.get(name)
+        if isinstance(counter, Counter):
+            counter.inc(amount, **dict(labels))
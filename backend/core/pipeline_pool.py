@@ -0,0 +1,158 @@
+"""Process-pool execution of the CPU-bound NLP pipeline.
+
+TF-IDF, logistic regression and spaCy all hold the GIL, so a single API
+process only ever uses one core for them. With ``PIPELINE_WORKERS`` > 0,
+transcripts are dispatched to a pool of worker processes instead; each
+worker preloads the models once through :func:`_init_worker`. Workers
+replay the feedback log at startup and catch up on new corrections before
+each transcript, so online updates reach every process.
+"""
+from __future__ import annotations
+
+from concurrent.futures import Executor, ProcessPoolExecutor
+from threading import Lock
+from typing import Any, Dict, List, Optional
+import asyncio
+import logging
+import multiprocessing
+import os
+
+from core.metrics import merge_counters, merge_stages
+
+logger = logging.getLogger(__name__)
+
+# 0 runs the pipeline in the calling process (thread pool), as before.
+PIPELINE_WORKERS = int(os.getenv("PIPELINE_WORKERS", "0"))
+# How long start_pool waits for every worker to come up (model loading included)
+POOL_START_TIMEOUT_S = float(os.getenv("POOL_START_TIMEOUT_S", "300"))
+
+# Artifacts every worker loads before taking work.
+PRELOAD = (
+    "task_model",
+    "name_model",
+    "spacy:en_core_web_sm",
+)
+
+_pool: Optional[Executor] = None
+_pool_lock = Lock()
+
+
+def process_tasks(transcript: str, auto_assign: bool = True) -> List[Dict[str, Any]]:
+    """Run the NLP pipeline and optionally apply assignment logic."""
+    from assingment.assingment_logic import assign_tasks
+    from nlp.pipeline import process_transcript
+
+    tasks = process_transcript(transcript)
+
+    if auto_assign and tasks:
+        return assign_tasks(tasks)
+
+    return tasks
+
+
+def _process_tasks_remote(transcript: str, auto_assign: bool):
+    """Pool entry point: also ships the worker's stage timings, counter
+    increments and finished shadow batches back to the parent, whose
+    /metrics and /models would otherwise never see them."""
+    from core.metrics import capture_counters, capture_stages
+    from mlmodel import shadow
+    from services.feedback_service import feedback_log
+
+    # outside the capture: the parent counts its own feedback updates
+    feedback_log.catch_up()
+    with capture_stages() as samples, capture_counters() as counters:
+        tasks = process_tasks(transcript, auto_assign)
+    return tasks, {"stages": list(samples), "counters": list(counters), "shadow": shadow.drain()}
+
+
+def _merge_telemetry(telemetry: Dict[str, Any]) -> None:
+    from mlmodel import shadow
+
+    merge_stages(telemetry["stages"])
+    merge_counters(telemetry["counters"])
+    shadow.merge(telemetry["shadow"])
+
+
+def _init_worker() -> None:
+    # Importing registers the lazy artifacts; warm_up loads them.
+    import assingment.assingment_logic  # noqa: F401
+    import nlp.pipeline  # noqa: F401
+    from core.lazy import warm_up
+    from mlmodel import shadow
+    from mlmodel.hot_reload import start_watcher
+    from services.feedback_service import feedback_log
+
+    shadow.forward_samples()  # shadow stats travel back with each result
+    report = warm_up(PRELOAD)
+    feedback_log.catch_up()  # online updates made before this worker started
+    start_watcher()  # pick up newly activated model versions
+    logger.info("Pipeline worker %s ready: %s", os.getpid(), report["artifacts"])
+
+
+def _ping(barrier) -> int:
+    # Hold this worker until every worker holds a ping, so no single
+    # process can answer them all.
+    barrier.wait(POOL_START_TIMEOUT_S)
+    return os.getpid()
+
+
+def get_pool() -> Optional[Executor]:
+    """The shared process pool, created on first use (None when disabled)."""
+    global _pool
+    if PIPELINE_WORKERS <= 0:
+        return None
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                # spawn: never fork a process that already runs threads
+                _pool = ProcessPoolExecutor(
+                    max_workers=PIPELINE_WORKERS,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_init_worker,
+                )
+    return _pool
+
+
+def start_pool() -> List[int]:
+    """Start every worker now so model loading happens before traffic.
+
+    Submits one blocking ping per worker; they all wait on a shared
+    barrier, so this returns only once all ``PIPELINE_WORKERS`` processes
+    are spawned and through :func:`_init_worker`. Returns their pids.
+    """
+    pool = get_pool()
+    if pool is None:
+        return []
+    with multiprocessing.get_context("spawn").Manager() as manager:
+        barrier = manager.Barrier(PIPELINE_WORKERS)
+        pings = [pool.submit(_ping, barrier) for _ in range(PIPELINE_WORKERS)]
+        return sorted(ping.result() for ping in pings)
+
+
+def shutdown_pool(wait: bool = True) -> None:
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(wait=wait)
+            _pool = None
+
+
+def run_pipeline_sync(transcript: str, auto_assign: bool = True):
+    """Blocking call; goes through the pool when one is configured."""
+    pool = get_pool()
+    if pool is None:
+        return process_tasks(transcript, auto_assign)
+    tasks, telemetry = pool.submit(_process_tasks_remote, transcript, auto_assign).result()
+    _merge_telemetry(telemetry)
+    return tasks
+
+
+async def run_pipeline(transcript: str, auto_assign: bool = True):
+    """Awaitable call for the API: pool worker if configured, else a thread."""
+    loop = asyncio.get_running_loop()
+    pool = get_pool()
+    if pool is None:
+        return await loop.run_in_executor(None, process_tasks, transcript, auto_assign)
+    tasks, telemetry = await loop.run_in_executor(pool, _process_tasks_remote, transcript, auto_assign)
+    _merge_telemetry(telemetry)
+    return tasks
@@ -0,0 +1,466 @@
+"""Compact, sklearn-free inference format for the text classifiers.
+
+A fitted ``TfidfVectorizer`` / ``CountVectorizer`` / ``HashingVectorizer``
++ linear classifier (``LogisticRegression``, ``SGDClassifier(loss="log_loss")``)
+pair is exported to a directory of plain ``.npy`` arrays plus ``meta.json``::
+
+    task_model.compact/
+        meta.json        analyzer settings, classes, link function
+        terms.npy        vocabulary, sorted (feature i == terms[i]); not
+                         written for hashed features
+        idf.npy          IDF weight per feature (if use_idf)
+        coef.npy         (n_rows, n_features) weights
+        intercept.npy    (n_rows,)
+
+Arrays are opened with ``mmap_mode="r"``, so pool workers share one copy
+of the weights through the page cache, and nothing is unpickled. The
+:class:`CompactVectorizer` / :class:`CompactClassifier` pair reproduces
+``vectorizer.transform`` + ``model.predict_proba`` with NumPy only and
+exposes the same method names, so predictors can use either format.
+
+Export from ``backend/``::
+
+    python -m mlmodel.compact_model            # task + name models
+"""
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Callable, Dict, List, NamedTuple, Optional, Sequence, Tuple
+import argparse
+import json
+import os
+import re
+import unicodedata
+
+import numpy as np
+
+FORMAT_VERSION = 1
+META_FILE = "meta.json"
+
+_WHITE_SPACES = re.compile(r"\s\s+")
+
+
+class SparseRows(NamedTuple):
+    """CSR rows produced by :meth:`CompactVectorizer.transform`."""
+
+    data: np.ndarray
+    indices: np.ndarray
+    indptr: np.ndarray
+    shape: tuple
+
+
+# ---------------------------------------------------------------
+# Analyzers (mirror sklearn.feature_extraction.text)
+# ---------------------------------------------------------------
+def _strip_accents_unicode(s: str) -> str:
+    normalized = unicodedata.normalize("NFKD", s)
+    if normalized == s:
+        return s
+    return "".join(c for c in normalized if not unicodedata.combining(c))
+
+
+def _strip_accents_ascii(s: str) -> str:
+    return unicodedata.normalize("NFKD", s).encode("ASCII", "ignore").decode("ASCII")
+
+
+_ACCENTS = {None: None, "unicode": _strip_accents_unicode, "ascii": _strip_accents_ascii}
+
+
+def _word_ngrams(tokens: List[str], ngram_range, stop_words) -> List[str]:
+    if stop_words:
+        tokens = [t for t in tokens if t not in stop_words]
+    min_n, max_n = ngram_range
+    if max_n == 1:
+        return tokens
+
+    grams = list(tokens) if min_n == 1 else []
+    min_n = max(min_n, 2)
+    for n in range(min_n, min(max_n + 1, len(tokens) + 1)):
+        for i in range(len(tokens) - n + 1):
+            grams.append(" ".join(tokens[i:i + n]))
+    return grams
+
+
+def _char_ngrams(text: str, ngram_range) -> List[str]:
+    text = _WHITE_SPACES.sub(" ", text)
+    min_n, max_n = ngram_range
+    grams = []
+    for n in range(min_n, min(max_n + 1, len(text) + 1)):
+        for i in range(len(text) - n + 1):
+            grams.append(text[i:i + n])
+    return grams
+
+
+def _char_wb_ngrams(text: str, ngram_range) -> List[str]:
+    text = _WHITE_SPACES.sub(" ", text)
+    min_n, max_n = ngram_range
+    grams = []
+    for word in text.split():
+        word = " " + word + " "
+        for n in range(min_n, max_n + 1):
+            offset = 0
+            grams.append(word[offset:offset + n])
+            while offset + n < len(word):
+                offset += 1
+                grams.append(word[offset:offset + n])
+            if offset == 0:  # word shorter than n: count it once
+                break
+    return grams
+
+
+def build_analyzer(meta: Dict) -> Callable[[str], List[str]]:
+    """``doc -> terms`` function equivalent to ``vectorizer.build_analyzer()``."""
+    lowercase = meta["lowercase"]
+    strip = _ACCENTS[meta["strip_accents"]]
+    ngram_range = tuple(meta["ngram_range"])
+
+    def preprocess(doc: str) -> str:
+        if lowercase:
+            doc = doc.lower()
+        if strip is not None:
+            doc = strip(doc)
+        return doc
+
+    kind = meta["analyzer"]
+    if kind == "word":
+        token_re = re.compile(meta["token_pattern"])
+        stop_words = frozenset(meta["stop_words"] or ())
+        return lambda doc: _word_ngrams(token_re.findall(preprocess(doc)), ngram_range, stop_words)
+    if kind == "char":
+        return lambda doc: _char_ngrams(preprocess(doc), ngram_range)
+    if kind == "char_wb":
+        return lambda doc: _char_wb_ngrams(preprocess(doc), ngram_range)
+    raise ValueError(f"Unsupported analyzer '{kind}'")
+
+
+# ---------------------------------------------------------------
+# Feature hashing (mirrors sklearn.feature_extraction.FeatureHasher)
+# ---------------------------------------------------------------
+_MASK = 0xFFFFFFFF
+
+
+def _rotl(x: int, r: int) -> int:
+    return ((x << r) | (x >> (32 - r))) & _MASK
+
+
+def murmurhash3_32(data: bytes, seed: int = 0) -> int:
+    """Signed 32-bit MurmurHash3 (x86), as ``sklearn.utils.murmurhash3_32``."""
+    c1, c2 = 0xCC9E2D51, 0x1B873593
+    h = seed & _MASK
+    n_blocks = len(data) // 4
+    for i in range(n_blocks):
+        k = int.from_bytes(data[4 * i:4 * i + 4], "little")
+        k = _rotl((k * c1) & _MASK, 15) * c2 & _MASK
+        h = (_rotl(h ^ k, 13) * 5 + 0xE6546B64) & _MASK
+
+    tail = data[4 * n_blocks:]
+    if tail:
+        k = int.from_bytes(tail, "little")
+        h ^= _rotl((k * c1) & _MASK, 15) * c2 & _MASK
+
+    h ^= len(data)
+    h ^= h >> 16
+    h = (h * 0x85EBCA6B) & _MASK
+    h ^= h >> 13
+    h = (h * 0xC2B2AE35) & _MASK
+    h ^= h >> 16
+    return h - (1 << 32) if h & 0x80000000 else h
+
+
+@lru_cache(maxsize=1 << 16)
+def _hashed(term: str, n_features: int, alternate_sign: bool) -> Tuple[int, float]:
+    h = murmurhash3_32(term.encode("utf-8"))
+    sign = -1.0 if alternate_sign and h < 0 else 1.0
+    return abs(h) % n_features, sign
+
+
+# ---------------------------------------------------------------
+# Export
+# ---------------------------------------------------------------
+def _is_hashing(vectorizer) -> bool:
+    return hasattr(vectorizer, "n_features") and hasattr(vectorizer, "alternate_sign")
+
+
+def _vectorizer_meta(vectorizer) -> Dict:
+    params = vectorizer.get_params()
+    hashing = _is_hashing(vectorizer)
+    if not hashing and not hasattr(vectorizer, "vocabulary_"):
+        raise ValueError(
+            f"{type(vectorizer).__name__} has no vocabulary_; only fitted "
+            "Count/Tfidf/HashingVectorizer models can be exported"
+        )
+    if callable(params["analyzer"]) or params.get("tokenizer") or params.get("preprocessor"):
+        raise ValueError("Custom analyzer/tokenizer/preprocessor callables cannot be exported")
+    if callable(params.get("strip_accents")):
+        raise ValueError("Custom strip_accents callables cannot be exported")
+
+    token_pattern = params.get("token_pattern")
+    if params["analyzer"] == "word" and re.compile(token_pattern).groups > 1:
+        raise ValueError("token_pattern must have at most one capturing group")
+
+    stop_words = vectorizer.get_stop_words()
+    tfidf = hasattr(vectorizer, "idf_")
+    return {
+        "features": "hashing" if hashing else "vocabulary",
+        "alternate_sign": bool(params["alternate_sign"]) if hashing else False,
+        "analyzer": params["analyzer"],
+        "lowercase": params["lowercase"],
+        "strip_accents": params["strip_accents"],
+        "token_pattern": token_pattern,
+        "ngram_range": list(params["ngram_range"]),
+        "stop_words": sorted(stop_words) if stop_words else None,
+        "binary": params["binary"],
+        "sublinear_tf": bool(tfidf and params.get("sublinear_tf")),
+        "use_idf": tfidf,
+        "norm": params.get("norm") if (tfidf or hashing) else None,
+    }
+
+
+def link_of(model) -> str:
+    """How decision values become probabilities (see predict_proba)."""
+    if isinstance(model, CompactClassifier):
+        return model.link
+    if len(model.classes_) <= 2:
+        return "logistic"
+    if type(model).__name__ == "LogisticRegression" and not (
+        getattr(model, "multi_class", None) == "ovr" or model.solver == "liblinear"
+    ):
+        return "softmax"
+    return "ovr"
+
+
+def export(vectorizer, model, directory: str) -> str:
+    """Write ``vectorizer`` + ``model`` to ``directory`` in the compact format."""
+    if not (hasattr(model, "coef_") and hasattr(model, "predict_proba")):
+        raise ValueError(f"{type(model).__name__} is not a probabilistic linear classifier")
+
+    meta = _vectorizer_meta(vectorizer)
+    coef = np.asarray(model.coef_, dtype=np.float64)
+    os.makedirs(directory, exist_ok=True)
+
+    if meta["features"] == "hashing":
+        n_features = vectorizer.n_features
+        order = slice(None)
+    else:
+        # Re-order features by term so lookups are a binary search over terms.npy
+        vocabulary = vectorizer.vocabulary_
+        terms = sorted(vocabulary)
+        order = np.fromiter((vocabulary[t] for t in terms), dtype=np.intp, count=len(terms))
+        n_features = len(terms)
+        np.save(os.path.join(directory, "terms.npy"), np.array(terms, dtype=str))
+
+    if coef.shape[1] != n_features:
+        raise ValueError(f"Classifier expects {coef.shape[1]} features, vectorizer has {n_features}")
+
+    np.save(os.path.join(directory, "coef.npy"), np.ascontiguousarray(coef[:, order]))
+    np.save(os.path.join(directory, "intercept.npy"),
+            np.asarray(model.intercept_, dtype=np.float64).reshape(-1))
+    if meta["use_idf"]:
+        np.save(os.path.join(directory, "idf.npy"), np.asarray(vectorizer.idf_, dtype=np.float64)[order])
+
+    classes = model.classes_.tolist()
+    meta.update({
+        "format_version": FORMAT_VERSION,
+        "n_features": n_features,
+        "classes": classes,
+        "link": link_of(model),
+        "source": {"vectorizer": type(vectorizer).__name__, "classifier": type(model).__name__},
+    })
+    with open(os.path.join(directory, META_FILE), "w", encoding="utf-8") as f:
+        json.dump(meta, f, indent=2)
+    return directory
+
+
+def _load_meta(directory: str) -> Dict:
+    with open(os.path.join(directory, META_FILE), "r", encoding="utf-8") as f:
+        meta = json.load(f)
+    if meta.get("format_version") != FORMAT_VERSION:
+        raise ValueError(f"Unsupported compact model version {meta.get('format_version')} in {directory}")
+    return meta
+
+
+def is_compact(directory: str) -> bool:
+    return os.path.isfile(os.path.join(directory, META_FILE))
+
+
+# ---------------------------------------------------------------
+# Inference
+# ---------------------------------------------------------------
+class CompactVectorizer:
+    """NumPy re-implementation of a fitted vectorizer's ``transform``."""
+
+    def __init__(self, directory: str, mmap: bool = True) -> None:
+        mode = "r" if mmap else None
+        self.meta = _load_meta(directory)
+        self.hashing = self.meta.get("features") == "hashing"
+        self.n_features = self.meta["n_features"]
+        self.terms = (None if self.hashing
+                      else np.load(os.path.join(directory, "terms.npy"), mmap_mode=mode))
+        self.idf = (np.load(os.path.join(directory, "idf.npy"), mmap_mode=mode)
+                    if self.meta["use_idf"] else None)
+        self.analyzer = build_analyzer(self.meta)
+        self._max_term_len = 0 if self.hashing else self.terms.dtype.itemsize // 4
+
+    def _lookup(self, grams: Sequence[str]) -> np.ndarray:
+        """Feature index of every gram, -1 if out of vocabulary."""
+        found = np.full(len(grams), -1, dtype=np.intp)
+        if not grams or not len(self.terms):
+            return found
+        # Longer grams can't be in the vocabulary (and would be truncated)
+        keep = [i for i, g in enumerate(grams) if len(g) <= self._max_term_len]
+        if not keep:
+            return found
+        query = np.array([grams[i] for i in keep], dtype=self.terms.dtype)
+        pos = np.minimum(np.searchsorted(self.terms, query), len(self.terms) - 1)
+        hit = self.terms[pos] == query
+        found[np.asarray(keep)[hit]] = pos[hit]
+        return found
+
+    def _hash(self, grams: Sequence[str]) -> Tuple[np.ndarray, np.ndarray]:
+        """Hashed feature index and ±1 value of every gram."""
+        alternate_sign = self.meta["alternate_sign"]
+        pairs = [_hashed(g, self.n_features, alternate_sign) for g in grams]
+        features = np.fromiter((p[0] for p in pairs), dtype=np.intp, count=len(pairs))
+        signs = np.fromiter((p[1] for p in pairs), dtype=np.float64, count=len(pairs))
+        return features, signs
+
+    def transform(self, docs: Sequence[str]) -> SparseRows:
+        meta = self.meta
+        per_doc = [self.analyzer(doc) for doc in docs]
+        lengths = np.fromiter((len(g) for g in per_doc), dtype=np.intp, count=len(per_doc))
+        grams = [g for doc_grams in per_doc for g in doc_grams]
+        rows = np.repeat(np.arange(len(docs)), lengths)
+
+        if self.hashing:
+            features, values = self._hash(grams)
+        else:
+            features = self._lookup(grams)
+            known = features >= 0
+            rows, features = rows[known], features[known]
+            values = np.ones(len(features))
+
+        # Sum (row, feature) pairs → CSR with sorted indices per row
+        width = max(self.n_features, 1)
+        keys, inverse = np.unique(rows * width + features, return_inverse=True)
+        rows, indices = np.divmod(keys, width)
+        data = np.bincount(inverse.reshape(-1), weights=values, minlength=len(keys))
+
+        if meta["binary"]:
+            data[:] = 1.0
+        elif meta["sublinear_tf"]:
+            data = np.log(data) + 1.0
+        if self.idf is not None:
+            data = data * self.idf[indices]
+
+        if meta["norm"] in ("l1", "l2"):
+            weights = np.abs(data) if meta["norm"] == "l1" else data ** 2
+            norms = np.bincount(rows, weights=weights, minlength=len(docs))
+            if meta["norm"] == "l2":
+                norms = np.sqrt(norms)
+            norms[norms == 0.0] = 1.0
+            data = data / norms[rows]
+
+        indptr = np.zeros(len(docs) + 1, dtype=np.intp)
+        np.cumsum(np.bincount(rows, minlength=len(docs)), out=indptr[1:])
+        return SparseRows(data, indices, indptr, (len(docs), self.n_features))
+
+
+class CompactClassifier:
+    """``predict_proba`` / ``predict`` over :class:`SparseRows`."""
+
+    def __init__(self, directory: str, mmap: bool = True) -> None:
+        mode = "r" if mmap else None
+        self.meta = _load_meta(directory)
+        self.coef = np.load(os.path.join(directory, "coef.npy"), mmap_mode=mode)
+        self.intercept = np.load(os.path.join(directory, "intercept.npy"), mmap_mode=mode)
+        self.classes_ = np.array(self.meta["classes"])
+        self.link = self.meta["link"]
+
+    def decision_function(self, X: SparseRows) -> np.ndarray:
+        n_rows = X.shape[0]
+        rows = np.repeat(np.arange(n_rows), np.diff(X.indptr))
+        scores = np.empty((n_rows, self.coef.shape[0]))
+        for k in range(self.coef.shape[0]):
+            contrib = self.coef[k, X.indices] * X.data
+            scores[:, k] = np.bincount(rows, weights=contrib, minlength=n_rows) + self.intercept[k]
+        return scores
+
+    def predict_proba(self, X: SparseRows) -> np.ndarray:
+        scores = self.decision_function(X)
+        if self.link == "logistic":
+            positive = 1.0 / (1.0 + np.exp(-scores[:, 0]))
+            return np.column_stack([1.0 - positive, positive])
+        if self.link == "softmax":
+            scores = np.exp(scores - scores.max(axis=1, keepdims=True))
+            return scores / scores.sum(axis=1, keepdims=True)
+        prob = 1.0 / (1.0 + np.exp(-scores))
+        return prob / prob.sum(axis=1, keepdims=True)
+
+    def predict(self, X: SparseRows) -> np.ndarray:
+        scores = self.decision_function(X)
+        if self.link == "logistic":
+            return self.classes_[(scores[:, 0] > 0).astype(int)]
+        return self.classes_[scores.argmax(axis=1)]
+
+
+# ---------------------------------------------------------------
+# Format selection for the predictors
+# ---------------------------------------------------------------
+MODEL_FORMAT = os.getenv("MODEL_FORMAT", "auto").lower()  # auto | compact | joblib
+
+
+def load_artifacts(compact_dir: str, vectorizer_path: str, model_path: str, fmt: Optional[str] = None):
+    """``(vectorizer, model)`` honouring ``MODEL_FORMAT``.
+
+    ``auto`` uses the compact directory when it exists and falls back to the
+    joblib pickles; joblib (and therefore sklearn) is only imported on that
+    fallback path.
+    """
+    fmt = (fmt or MODEL_FORMAT).lower()
+    if fmt not in ("auto", "compact", "joblib"):
+        raise ValueError(f"Unknown MODEL_FORMAT '{fmt}' (expected auto, compact or joblib)")
+
+    if fmt == "compact" or (fmt == "auto" and is_compact(compact_dir)):
+        return CompactVectorizer(compact_dir), CompactClassifier(compact_dir)
+
+    import joblib
+    return joblib.load(vectorizer_path), joblib.load(model_path)
+
+
+def max_difference(vectorizer, model, directory: str, docs: Sequence[str]) -> float:
+    """Largest |p_sklearn - p_compact| over ``docs``; a quick parity check."""
+    expected = model.predict_proba(vectorizer.transform(docs))
+    actual = CompactClassifier(directory).predict_proba(CompactVectorizer(directory).transform(docs))
+    return float(np.abs(expected - actual).max()) if len(docs) else 0.0
+
+
+PARITY_SAMPLES = {
+    "task": ["mohit please fix the login bug by friday", "that was a great demo"],
+    "name": ["Sakshi", "tomorrow", "Arjun", "database"],
+}
+
+
+def main(argv=None) -> int:
+    import joblib
+
+    from mlmodel import name_predictor, task_predictor
+
+    parser = argparse.ArgumentParser(description="Export joblib models to the compact format.")
+    parser.add_argument("models", nargs="*", help="task and/or name (default: both)")
+    args = parser.parse_args(argv)
+    unknown = set(args.models) - set(PARITY_SAMPLES)
+    if unknown:
+        parser.error(f"unknown model(s): {', '.join(sorted(unknown))}")
+
+    for kind in args.models or ["task", "name"]:
+        module = task_predictor if kind == "task" else name_predictor
+        vectorizer = joblib.load(module.VECTORIZER_PATH)
+        model = joblib.load(module.MODEL_PATH)
+        export(vectorizer, model, module.COMPACT_DIR)
+        diff = max_difference(vectorizer, model, module.COMPACT_DIR, PARITY_SAMPLES[kind])
+        print(f"✔ {kind}: {module.COMPACT_DIR} (max |Δp| on samples = {diff:.2e})")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -2,14 +2,34 @@
 # Improved dataset.py (overwrite version)
 # Generates synthetic dataset for task classification
 # Output: backend/mlmodel/custom_500.csv
+#
+#   python -m mlmodel.dataset                                  # 900 + 600 rows
+#   python -m mlmodel.dataset --n-action 6000000 --n-non-action 4000000 \
+#       --seed 7 --shards 16 --output data/tasks     # streamed, sharded
+#
+# Rows are generated lazily from a seeded RNG and written through
+# mlmodel/shard_writer.py, which drops duplicates in two passes. Note the
+# templates below span ~137k distinct task and 140 distinct non-task
+# sentences, so the deduplicated output cannot grow past that: the
+# default 900 + 600 draw keeps ~900 tasks but only ~140 non-tasks. The
+# CLI prints the final class counts and warns when they are skewed;
+# --balance caps the tasks at the achievable number of non-tasks.
 # ===================================================================
 
+import argparse
 import os
 import random
-import pandas as pd
+import sys
+from collections import Counter
 
-# Ensure correct folder exists
-os.makedirs("backend/mlmodel", exist_ok=True)
+from mlmodel.shard_writer import write_deduplicated
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+OUTPUT_PATH = os.path.join(BASE_DIR, "custom_500.csv")
+HEADER = ["sentence", "label"]
+
+# Warn when one class outnumbers the other by more than this after dedup
+IMBALANCE_WARN_RATIO = 1.5
 
 # ---------------------------------------------------------
 # ACTION VERBS & OBJECTS (Tasks)
@@ -90,48 +110,115 @@ NOISE = ["", "uh", "um", "so", "like"]
 # ---------------------------------------------------------
 # Sentence Generators
 # ---------------------------------------------------------
-def generate_action_sentence():
-    verb = random.choice(ACTION_VERBS)
-    obj = random.choice(ACTION_OBJECTS)
-    extra = random.choice(ACTION_EXTRAS)
-    template = random.choice(TASK_VARIANTS)
-    noise = random.choice(NOISE)
+def generate_action_sentence(rng=random):
+    verb = rng.choice(ACTION_VERBS)
+    obj = rng.choice(ACTION_OBJECTS)
+    extra = rng.choice(ACTION_EXTRAS)
+    template = rng.choice(TASK_VARIANTS)
+    noise = rng.choice(NOISE)
 
     sentence = template.format(verb, obj, extra)
     return f"{noise} {sentence}".strip()
 
 
-def generate_non_action_sentence():
-    noise = random.choice(NOISE)
-    base = random.choice(NON_ACTION_SENTENCES + AMBIGUOUS_NON_TASKS)
+NON_TASK_SENTENCES = NON_ACTION_SENTENCES + AMBIGUOUS_NON_TASKS
+
+# Distinct non-task rows the templates can produce
+NON_TASK_CAPACITY = len({f"{noise} {base}".strip() for noise in NOISE for base in NON_TASK_SENTENCES})
+
+
+def generate_non_action_sentence(rng=random):
+    noise = rng.choice(NOISE)
+    base = rng.choice(NON_TASK_SENTENCES)
     return f"{noise} {base}".strip()
 
 
 # ---------------------------------------------------------
 # Create Dataset
 # ---------------------------------------------------------
-def generate_dataset(n_action=900, n_non_action=600):
-    data = []
-
-    for _ in range(n_action):
-        data.append([generate_action_sentence(), 1])
-
-    for _ in range(n_non_action):
-        data.append([generate_non_action_sentence(), 0])
-
-    random.shuffle(data)
-    return pd.DataFrame(data, columns=["sentence", "label"])
+def iter_dataset(n_action=900, n_non_action=600, seed=None):
+    """
+    Yield (sentence, label) rows in random order without materializing them.
+
+    Each row is a task with probability remaining_tasks / remaining_rows,
+    which gives the same uniform interleaving as shuffling the full list.
+    The same seed always yields the same rows.
+    """
+    rng = random.Random(seed)
+    remaining_action, remaining_non_action = n_action, n_non_action
+    while remaining_action or remaining_non_action:
+        if rng.randrange(remaining_action + remaining_non_action) < remaining_action:
+            remaining_action -= 1
+            yield generate_action_sentence(rng), 1
+        else:
+            remaining_non_action -= 1
+            yield generate_non_action_sentence(rng), 0
+
+
+def generate_dataset(n_action=900, n_non_action=600, seed=None):
+    import pandas as pd  # only the in-memory path needs pandas
+
+    return pd.DataFrame(list(iter_dataset(n_action, n_non_action, seed)), columns=HEADER)
+
+
+def balanced_action_count(n_action, n_non_action):
+    """Task rows to draw so they do not outnumber the distinct non-task
+    rows left after dedup."""
+    return min(n_action, n_non_action, NON_TASK_CAPACITY)
+
+
+def write_dataset(output_path=OUTPUT_PATH, n_action=900, n_non_action=600, seed=None,
+                  shards=1, buckets=64, balance=False):
+    """
+    Stream a generated dataset to disk, deduplicated.
+
+    Returns ``(WriteStats, {"task": n, "non_task": n})`` with the class
+    counts of the written rows. ``balance`` caps the task rows with
+    :func:`balanced_action_count` first.
+    """
+    if balance:
+        n_action = balanced_action_count(n_action, n_non_action)
+    labels = Counter()
+    rows = iter_dataset(n_action, n_non_action, seed)
+    stats = write_deduplicated(rows, output_path, HEADER, shards=shards, buckets=buckets,
+                               on_write=lambda row: labels.update((row[1],)))
+    return stats, {"task": labels["1"], "non_task": labels["0"]}
+
+
+def imbalance_warning(counts, ratio=IMBALANCE_WARN_RATIO):
+    """Message when one class outnumbers the other by more than ``ratio``."""
+    low, high = sorted(counts.values())
+    if high <= ratio * low:
+        return None
+    return (f"classes are imbalanced after dedup ({counts['task']} task vs "
+            f"{counts['non_task']} non-task rows); pass --balance to cap the task rows")
 
 
 # ---------------------------------------------------------
 # MAIN
 # ---------------------------------------------------------
 if __name__ == "__main__":
-    df = generate_dataset(900, 600)  # 1,500 rows recommended
-    output_path = "backend/mlmodel/custom_500.csv"
-
-    df.to_csv(output_path, index=False)
+    parser = argparse.ArgumentParser(description="Generate the synthetic task dataset.")
+    parser.add_argument("--n-action", type=int, default=900)
+    parser.add_argument("--n-non-action", type=int, default=600)
+    parser.add_argument("--seed", type=int, default=None, help="RNG seed (same seed, same rows)")
+    parser.add_argument("--output", default=OUTPUT_PATH,
+                        help="CSV file, or a directory of part-*.csv files when --shards > 1")
+    parser.add_argument("--shards", type=int, default=1, help="number of output CSV files")
+    parser.add_argument("--buckets", type=int, default=64,
+                        help="dedup partitions; more buckets, less memory")
+    parser.add_argument("--balance", action="store_true",
+                        help=f"cap task rows at the distinct non-task rows (<= {NON_TASK_CAPACITY})")
+    args = parser.parse_args()
+
+    stats, counts = write_dataset(args.output, args.n_action, args.n_non_action, args.seed,
+                                  args.shards, args.buckets, args.balance)
 
     print("✔ Improved dataset generated!")
-    print(f"✔ Saved to: {output_path}")
-    print(f"✔ Total samples: {len(df)}")
+    print(f"✔ Saved to: {args.output}")
+    print(f"✔ Total samples: {stats.rows_out} ({stats.duplicates} duplicates dropped, "
+          f"{stats.shards} shard(s), {stats.seconds:.1f}s)")
+    print(f"✔ Classes: {counts['task']} task, {counts['non_task']} non-task")
+    warning = imbalance_warning(counts)
+    if warning:
+        print(f"⚠ Warning: {warning}", file=sys.stderr)
@@ -0,0 +1,98 @@
+"""Hot reload of the served models from the registry.
+
+``POST /models/reload`` calls :func:`reload_models` in the API process.
+Every process (API and each pipeline pool worker) also runs a
+:class:`~mlmodel.registry.ModelWatcher` polling the registry's ``CURRENT``
+files every ``MODEL_WATCH_S`` seconds (0 disables it), so activating a
+version reaches all workers without a restart.
+
+Every reload goes through :func:`reload_model`, which runs the
+:func:`add_reload_hook` hooks around it (the feedback service uses one to
+replay its correction log onto the freshly loaded model).
+"""
+from __future__ import annotations
+
+from contextlib import ExitStack
+from typing import Callable, ContextManager, Dict, Iterable, List, Optional
+import os
+
+from mlmodel import name_predictor, registry, shadow, task_predictor
+
+MODEL_WATCH_S = float(os.getenv("MODEL_WATCH_S", "5"))
+
+PREDICTORS = {"task": task_predictor, "name": name_predictor}
+
+_watcher: Optional[registry.ModelWatcher] = None
+_reload_hooks: List[Callable[[str], ContextManager]] = []
+
+
+def add_reload_hook(hook: Callable[[str], ContextManager]) -> None:
+    """Run ``with hook(model):`` around every reload of ``model``."""
+    if hook not in _reload_hooks:
+        _reload_hooks.append(hook)
+
+
+def reload_model(name: str):
+    with ExitStack() as stack:
+        for hook in list(_reload_hooks):
+            stack.enter_context(hook(name))
+        return PREDICTORS[name].reload()
+
+
+def reload_models(models: Optional[Iterable[str]] = None) -> Dict[str, Optional[str]]:
+    """Reload ``models`` (default: all); returns the now-live versions."""
+    names = list(models) if models is not None else list(PREDICTORS)
+    unknown = set(names) - set(PREDICTORS)
+    if unknown:
+        raise ValueError(f"Unknown model(s): {', '.join(sorted(unknown))}")
+    return {name: reload_model(name).version for name in names}
+
+
+def start_watcher(interval: float = MODEL_WATCH_S) -> Optional[registry.ModelWatcher]:
+    global _watcher
+    if interval <= 0:
+        return None
+    if _watcher is None:
+        _watcher = registry.ModelWatcher(
+            {name: (lambda name=name: reload_model(name)) for name in PREDICTORS}, interval
+        )
+    _watcher.start()
+    return _watcher
+
+
+def stop_watcher() -> None:
+    if _watcher is not None:
+        _watcher.stop()
+
+
+def status() -> Dict[str, Dict[str, object]]:
+    """Live version, registry contents and shadow stats per model.
+
+    A broken registry (``CURRENT`` naming a missing version) is reported as
+    ``registry_status: "missing"`` rather than failing the whole call."""
+    report = {}
+    shadows = shadow.stats()
+    for name, predictor in PREDICTORS.items():
+        entry: Dict[str, object] = {}
+        try:
+            bundle = predictor.get_bundle()
+            entry.update(live_version=bundle.version, source=bundle.source)
+        except Exception as exc:
+            entry.update(live_version=None, source=None, live_error=str(exc))
+
+        current = registry.current_version(name)
+        metrics, registry_status = None, "ok" if current else "empty"
+        if current:
+            try:
+                metrics = registry.manifest(name, current)["metrics"]
+            except registry.RegistryError:
+                registry_status = "missing"
+        entry.update(
+            registry_current=current,
+            registry_status=registry_status,
+            versions=registry.versions(name),
+            metrics=metrics,
+            shadow=shadows.get(name),
+        )
+        report[name] = entry
+    return report
@@ -1,9 +1,20 @@
-import pandas as pd
+# Synthetic name / non-name words for the name classifier.
+#
+#   python -m mlmodel.name_dataset                 # append 800 rows, dedup
+#   python -m mlmodel.name_dataset --seed 7 --shards 8 --output data/names
+#
+# Rows are generated lazily and written through mlmodel/shard_writer.py,
+# so existing and new rows are deduplicated without loading either.
+import argparse
 import random
 import os
+from itertools import chain
+
+from mlmodel.shard_writer import iter_csv, write_deduplicated
 
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 output_path = os.path.join(BASE_DIR, "name_dataset.csv")
+HEADER = ["word", "label"]
 
 INDIAN_NAMES = [
     "Aarav","Vivaan","Aditya","Vihaan","Arjun","Reyansh","Muhammad","Sai","Krishna",
@@ -29,40 +40,58 @@ NON_NAMES = [
     "screen", "feature", "task", "priority", "comment", "release"
 ]
 
-def generate_new_data(n_names=400, n_non_names=400):
-    dataset = []
-
-    for _ in range(n_names):
-        dataset.append([random.choice(INDIAN_NAMES + GLOBAL_NAMES), 1])
+NAMES = INDIAN_NAMES + GLOBAL_NAMES
 
-    for _ in range(n_non_names):
-        dataset.append([random.choice(NON_NAMES), 0])
 
-    random.shuffle(dataset)
-    return pd.DataFrame(dataset, columns=["word", "label"])
+def iter_new_data(n_names=400, n_non_names=400, seed=None):
+    """Yield (word, label) rows in random order; same seed, same rows."""
+    rng = random.Random(seed)
+    remaining_names, remaining_non_names = n_names, n_non_names
+    while remaining_names or remaining_non_names:
+        if rng.randrange(remaining_names + remaining_non_names) < remaining_names:
+            remaining_names -= 1
+            yield rng.choice(NAMES), 1
+        else:
+            remaining_non_names -= 1
+            yield rng.choice(NON_NAMES), 0
 
 
-def append_or_create():
-    new_df = generate_new_data()
+def generate_new_data(n_names=400, n_non_names=400, seed=None):
+    import pandas as pd  # only the in-memory path needs pandas
 
-    if os.path.exists(output_path):
-        old_df = pd.read_csv(output_path)
+    return pd.DataFrame(list(iter_new_data(n_names, n_non_names, seed)), columns=HEADER)
 
-        combined = pd.concat([old_df, new_df], ignore_index=True)
 
-        # Remove duplicates
-        # combined.drop_duplicates(inplace=True)
+def append_or_create(path=output_path, n_names=400, n_non_names=400, seed=None, buckets=64):
+    """Add new rows to ``path`` and drop duplicates (old rows included)."""
+    existed = os.path.exists(path)
+    rows = iter_new_data(n_names, n_non_names, seed)
+    if existed:
+        rows = chain(iter_csv(path, HEADER), rows)
 
-        combined.to_csv(output_path, index=False)
+    stats = write_deduplicated(rows, path, HEADER, buckets=buckets)
 
-        print("✔ Appended new rows.")
-        print("Total rows now:", len(combined))
-
-    else:
-        new_df.to_csv(output_path, index=False)
-        print("✔ Created new dataset.")
-        print("Total rows:", len(new_df))
+    print("✔ Appended new rows." if existed else "✔ Created new dataset.")
+    print("Total rows now:", stats.rows_out, f"({stats.duplicates} duplicates dropped)")
+    return stats
 
 
 if __name__ == "__main__":
-    append_or_create()
+    parser = argparse.ArgumentParser(description="Generate the synthetic name dataset.")
+    parser.add_argument("--n-names", type=int, default=400)
+    parser.add_argument("--n-non-names", type=int, default=400)
+    parser.add_argument("--seed", type=int, default=None, help="RNG seed (same seed, same rows)")
+    parser.add_argument("--output", default=output_path,
+                        help="CSV to append to, or a new directory of part-*.csv files with --shards")
+    parser.add_argument("--shards", type=int, default=1,
+                        help="write fresh sharded output instead of appending")
+    parser.add_argument("--buckets", type=int, default=64,
+                        help="dedup partitions; more buckets, less memory")
+    args = parser.parse_args()
+
+    if args.shards > 1:
+        stats = write_deduplicated(iter_new_data(args.n_names, args.n_non_names, args.seed),
+                                   args.output, HEADER, shards=args.shards, buckets=args.buckets)
+        print(f"✔ Wrote {stats.rows_out} rows to {stats.shards} shards in {args.output}")
+    else:
+        append_or_create(args.output, args.n_names, args.n_non_names, args.seed, args.buckets)
@@ -1,15 +1,12 @@
-import re
-from backend.mlmodel.name_ranker import name_score
+from backend.mlmodel.name_ranker import name_scores
 
 def extract_name(sentence: str):
     """Return most likely name in a sentence."""
-    words = re.findall(r"[A-Za-z]+", sentence)
-    if not words:
+    # Score all words (one spaCy parse + one vectorizer call per sentence)
+    scored = name_scores(sentence)
+    if not scored:
         return None
 
-    # Score all words
-    scored = [(w, name_score(w)) for w in words]
-
     # Pick highest-scoring word
     best_word, best_score = max(scored, key=lambda x: x[1])
 
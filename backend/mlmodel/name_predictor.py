@@ -1,14 +1,57 @@
-import joblib
 import os
 import re
+from dataclasses import replace
+from threading import Lock
+
+from core.lazy import LazyArtifact
+from mlmodel import registry, shadow
 
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 
 MODEL_PATH = os.path.join(BASE_DIR, "name_classifier.pkl")
 VECTORIZER_PATH = os.path.join(BASE_DIR, "name_vectorizer.pkl")
+# sklearn-free export of the two pickles (python -m mlmodel.compact_model)
+COMPACT_DIR = os.path.join(BASE_DIR, "name_model.compact")
+
+# Loaded on first use (or during API warm-up): the registry's current
+# version (mlmodel/registry/name), else the legacy files above.
+_bundle = LazyArtifact("name_model", lambda: registry.load_bundle("name", BASE_DIR))
+
+_swap_lock = Lock()
+
+shadow.configure("name", BASE_DIR)
+
+# Bumped on every reload so score caches know their entries are stale.
+model_version = 0
+
+def get_bundle():
+    return _bundle.get()
+
+def get_model():
+    return _bundle.get().model
+
+def get_vectorizer():
+    return _bundle.get().vectorizer
+
+def reload():
+    """Reload the name model from the registry (or legacy files) and swap it in."""
+    global model_version
+    with _swap_lock:
+        bundle = _bundle.reload()
+        model_version += 1
+    return bundle
 
-model = joblib.load(MODEL_PATH)
-vectorizer = joblib.load(VECTORIZER_PATH)
+def swap_model(model, expected=None):
+    """Replace the in-memory classifier (e.g. after an online update);
+    skipped (returns False) if ``expected`` is no longer the live bundle."""
+    global model_version
+    with _swap_lock:
+        current = get_bundle()
+        if expected is not None and current is not expected:
+            return False
+        _bundle.set(replace(current, model=model))
+        model_version += 1
+        return True
 
 def preprocess(word):
     word = re.sub(r"[^A-Za-z]", "", word)
@@ -19,6 +62,6 @@ def is_name(word):
     if not clean:
         return False
 
-    X = vectorizer.transform([clean])
-    pred = model.predict(X)[0]
+    X = get_vectorizer().transform([clean])
+    pred = get_model().predict(X)[0]
     return int(pred) == 1
@@ -1,9 +1,34 @@
+import logging
+import os
 import re
-import spacy
-from mlmodel.name_predictor import model, vectorizer
-
-# Load spaCy model
-nlp = spacy.load("en_core_web_sm")
+import time
+import mlmodel.name_predictor as name_predictor
+from core.metrics import Counter
+from mlmodel import shadow
+from mlmodel.score_cache import LRUCache
+from nlp.spacy_utils import parse
+
+logger = logging.getLogger(__name__)
+
+# spaCy comes from the process-wide shared pipeline; name scoring only
+# needs POS tags and entities, so it runs the "names" profile.
+SPACY_PROFILE = "names"
+
+# ---------------------------------------------------------------
+# Word-score caches
+#   Transcripts repeat the same small vocabulary, so the
+#   context-free parts of scoring are memoized per word.
+#   Capacity: NAME_SCORE_CACHE_SIZE (0 disables caching).
+# ---------------------------------------------------------------
+CACHE_SIZE = int(os.getenv("NAME_SCORE_CACHE_SIZE", "4096"))
+
+_score_cache = LRUCache(CACHE_SIZE)   # word -> name_score(word)
+_ml_cache = LRUCache(CACHE_SIZE)      # word -> classifier probability
+_cache_model_version = name_predictor.model_version
+
+# Monotonic, so they survive cache clears and sum across pool workers
+CACHE_HITS = Counter("name_score_cache_hits_total", "Name scoring cache hits, by cache.")
+CACHE_MISSES = Counter("name_score_cache_misses_total", "Name scoring cache misses, by cache.")
 
 STOPWORDS = {
     "the","a","an","this","that","and","or","but","because","of","to","is","are",
@@ -20,15 +45,77 @@ COMMON_VERBS = {
     "improve","implement","clean","add","remove","patch","test","write"
 }
 
+def _check_model_version():
+    """Drop cached scores once the name model has been reloaded or updated."""
+    global _cache_model_version
+    if _cache_model_version != name_predictor.model_version:
+        _score_cache.clear()
+        _ml_cache.clear()
+        _cache_model_version = name_predictor.model_version
+
+def configure_cache(capacity):
+    """Resize both word caches (evicting least recently used entries)."""
+    _score_cache.resize(capacity)
+    _ml_cache.resize(capacity)
+
+def clear_cache():
+    _score_cache.clear()
+    _ml_cache.clear()
+
+def cache_stats():
+    """Hit/miss/eviction counters for sizing NAME_SCORE_CACHE_SIZE."""
+    return {
+        "name_score": _score_cache.stats(),
+        "ml_prob": _ml_cache.stats(),
+    }
+
+def _count_lookups(cache, hits, misses):
+    if hits:
+        CACHE_HITS.inc(hits, cache=cache)
+    if misses:
+        CACHE_MISSES.inc(misses, cache=cache)
+
 def preprocess(word):
     return re.sub(r"[^A-Za-z]", "", word)
 
-def ml_prob(word):
+def _ml_probs(words):
+    """Classifier probabilities for many words; only cache misses are vectorized."""
+    _check_model_version()
+    probs = [_ml_cache.get(w) for w in words]
+    missing = sorted({w for w, p in zip(words, probs) if p is None})
+    hits = sum(p is not None for p in probs)
+    _count_lookups("ml_prob", hits, len(probs) - hits)
+
+    if missing:
+        try:
+            bundle = name_predictor.get_bundle()
+            started = time.perf_counter()
+            X = bundle.vectorizer.transform(missing)
+            fresh = dict(zip(missing, bundle.model.predict_proba(X)[:, 1]))
+        except Exception:
+            # Score 0.0 for this call only; caching it would pin a transient
+            # failure until the model version changes
+            logger.exception("name model scoring failed", extra={"words": len(missing)})
+            fresh = dict.fromkeys(missing, 0.0)
+        else:
+            for w, p in fresh.items():
+                _ml_cache.put(w, p)
+            _shadow_observe(missing, list(fresh.values()), time.perf_counter() - started)
+        probs = [fresh[w] if p is None else p for w, p in zip(words, probs)]
+
+    return probs
+
+def _shadow_observe(words, probs, seconds):
+    """Hand live scores to the shadow candidate; never affects live results."""
     try:
-        X = vectorizer.transform([word])
-        return model.predict_proba(X)[0][1]
-    except:
-        return 0.0
+        scorer = shadow.get("name")
+        if scorer is not None:
+            scorer.observe(words, probs, seconds, 0.5)
+    except Exception:
+        logger.exception("shadow observe failed", extra={"model": "name"})
+
+def ml_prob(word):
+    return _ml_probs([word])[0]
 
 def pattern_score(word):
     """Light structural rules only."""
@@ -52,28 +139,86 @@ def caps_score(word):
         return -0.3
     return 0.0
 
-def name_score(word):
-    word = preprocess(word)
-    if not word:
-        return 0.0
-
-    doc = nlp(word)
-    token = doc[0]
-
-    ml = ml_prob(word)
+def _combine(word, ml, pos, ent_type, is_stop):
+    """Blend the ML probability with structural and spaCy token signals."""
     pat = pattern_score(word)
     cap = caps_score(word)
 
     # spaCy PROPN detection
-    propn_bonus = 0.6 if token.pos_ == "PROPN" else 0.0
+    propn_bonus = 0.6 if pos == "PROPN" else 0.0
 
     # NER detection (rare but ok)
-    ner_bonus = 1.0 if token.ent_type_ == "PERSON" else 0.0
+    ner_bonus = 1.0 if ent_type == "PERSON" else 0.0
 
     # penalties
-    verb_penalty = 1.0 if token.pos_ == "VERB" or word.lower() in COMMON_VERBS else 0.0
-    stop_penalty = 1.2 if token.is_stop or word.lower() in STOPWORDS else 0.0
+    verb_penalty = 1.0 if pos == "VERB" or word.lower() in COMMON_VERBS else 0.0
+    stop_penalty = 1.2 if is_stop or word.lower() in STOPWORDS else 0.0
     tech_penalty = 1.3 if word.lower() in TECH_WORDS else 0.0
 
     final = ml + pat + cap + propn_bonus + ner_bonus - verb_penalty - stop_penalty - tech_penalty
     return final
+
+def name_score(word):
+    word = preprocess(word)
+    if not word:
+        return 0.0
+
+    _check_model_version()
+    cached = _score_cache.get(word)
+    _count_lookups("name_score", cached is not None, cached is None)
+    if cached is not None:
+        return cached
+
+    doc = parse(word, SPACY_PROFILE)
+    token = doc[0]
+
+    ml = ml_prob(word)
+    score = _combine(word, ml, token.pos_, token.ent_type_, token.is_stop)
+    _score_cache.put(word, score)
+    return score
+
+def _candidates(doc):
+    candidates = []
+    for token in doc:
+        word = preprocess(token.text)
+        if word:
+            candidates.append((word, token))
+    return candidates
+
+def name_scores(sentence_or_doc):
+    """
+    Score every word of a sentence in one pass.
+
+    The sentence is parsed once (so PROPN / PERSON tags see the real
+    context) and all candidate words go through a single
+    ``vectorizer.transform`` + ``predict_proba`` call (words already in
+    the ML cache are skipped).
+
+    Accepts a raw string or an already parsed spaCy ``Doc``.
+    Returns a list of ``(word, score)`` tuples in sentence order.
+    """
+    if isinstance(sentence_or_doc, str):
+        if not sentence_or_doc.strip():
+            return []
+        doc = parse(sentence_or_doc, SPACY_PROFILE)
+    else:
+        doc = sentence_or_doc
+
+    return name_scores_many([doc])[0]
+
+def name_scores_many(docs):
+    """
+    ``name_scores`` for many parsed docs (e.g. from ``nlp.pipe``) with a
+    single classifier call across all of them.
+    """
+    per_doc = [_candidates(doc) for doc in docs]
+    words = [word for candidates in per_doc for word, _ in candidates]
+    probs = iter(_ml_probs(words)) if words else iter(())
+
+    return [
+        [
+            (word, _combine(word, next(probs), token.pos_, token.ent_type_, token.is_stop))
+            for word, token in candidates
+        ]
+        for candidates in per_doc
+    ]
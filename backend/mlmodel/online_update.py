@@ -0,0 +1,109 @@
+"""Incremental (online) updates of a fitted linear text classifier.
+
+:func:`sgd_update` takes a few logistic-loss gradient steps on a small
+batch of labeled rows and returns an updated *copy* of the model; the live
+model is never mutated, so callers can swap the copy in atomically.
+
+It works on the weights directly, so it supports every model the
+predictors can serve – sklearn ``LogisticRegression`` (which has no
+``partial_fit``), ``SGDClassifier`` and :class:`CompactClassifier` – with
+the same link function (logistic, softmax, one-vs-rest) they use for
+``predict_proba``.
+"""
+from __future__ import annotations
+
+from typing import Sequence, Tuple
+import copy
+
+import numpy as np
+
+from mlmodel.compact_model import CompactClassifier, link_of
+
+
+def _weights(model) -> Tuple[np.ndarray, np.ndarray]:
+    if isinstance(model, CompactClassifier):
+        return model.coef, model.intercept
+    return model.coef_, model.intercept_
+
+
+def _with_weights(model, coef: np.ndarray, intercept: np.ndarray):
+    updated = copy.copy(model)
+    if isinstance(model, CompactClassifier):
+        updated.coef, updated.intercept = coef, intercept
+    else:
+        updated.coef_, updated.intercept_ = coef, intercept
+    return updated
+
+
+def class_index(model, label: bool) -> int:
+    """Column of ``model.classes_`` for a boolean label (1/"1" or 0/"0")."""
+    wanted = "1" if label else "0"
+    for i, cls in enumerate(model.classes_):
+        if str(cls) == wanted:
+            return i
+    raise ValueError(f"Model has no class {wanted!r}: {list(model.classes_)}")
+
+
+def _sigmoid(z: np.ndarray) -> np.ndarray:
+    return 1.0 / (1.0 + np.exp(-z))
+
+
+def sgd_update(
+    model,
+    X,
+    y: Sequence[int],
+    learning_rate: float = 0.5,
+    epochs: int = 5,
+    l2: float = 0.0,
+    update_intercept: bool = False,
+):
+    """Return ``model`` after ``epochs`` full-batch gradient steps on ``X``.
+
+    ``X`` is any CSR-like matrix (``data``/``indices``/``indptr``), e.g. the
+    output of the served vectorizer; ``y`` holds indices into
+    ``model.classes_``. The intercept stays fixed unless
+    ``update_intercept``: correction batches are small and rarely
+    class-balanced, and shifting the bias would move every prediction.
+    """
+    y = np.asarray(y, dtype=np.intp)
+    n_rows = len(y)
+    if n_rows == 0:
+        return model
+
+    coef, intercept = _weights(model)
+    coef = np.array(coef, dtype=np.float64)            # private, writable copies
+    intercept = np.array(intercept, dtype=np.float64).reshape(-1)
+    n_outputs, n_features = coef.shape
+
+    link = link_of(model)
+    rows = np.repeat(np.arange(n_rows), np.diff(X.indptr))
+    indices, data = np.asarray(X.indices), np.asarray(X.data, dtype=np.float64)
+
+    if link == "logistic":
+        target = (y == 1).astype(np.float64)[:, None]
+    else:
+        target = np.zeros((n_rows, n_outputs))
+        target[np.arange(n_rows), y] = 1.0
+
+    for _ in range(max(1, epochs)):
+        scores = np.empty((n_rows, n_outputs))
+        for k in range(n_outputs):
+            scores[:, k] = np.bincount(rows, weights=coef[k, indices] * data, minlength=n_rows)
+        scores += intercept
+
+        if link == "softmax":
+            probs = np.exp(scores - scores.max(axis=1, keepdims=True))
+            probs /= probs.sum(axis=1, keepdims=True)
+        else:
+            probs = _sigmoid(scores)
+        error = probs - target
+
+        for k in range(n_outputs):
+            grad = np.bincount(indices, weights=data * error[rows, k], minlength=n_features) / n_rows
+            if l2:
+                grad += l2 * coef[k]
+            coef[k] -= learning_rate * grad
+        if update_intercept:
+            intercept -= learning_rate * error.mean(axis=0)
+
+    return _with_weights(model, coef, intercept)
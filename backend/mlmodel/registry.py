@@ -0,0 +1,380 @@
+"""Versioned model registry.
+
+Layout (``REGISTRY_DIR``, default ``backend/mlmodel/registry``)::
+
+    registry/
+        task/
+            CURRENT              "v3" – the live version
+            v1/ v2/ v3/
+                manifest.json    checksums, metrics, params, created_at
+                task_classifier.pkl
+                task_vectorizer.pkl
+                task_model.compact/...
+        name/
+            ...
+
+Published versions are immutable. A version is staged in a temporary
+directory and renamed into place, and ``CURRENT`` is switched with
+``os.replace``, so readers see either the old or the new version, never a
+mix. Rolling back is just activating an older version.
+
+When a model has no ``CURRENT`` yet, the predictors keep loading the
+legacy files next to them in ``backend/mlmodel/``.
+
+CLI (from ``backend/``)::
+
+    python -m mlmodel.registry list task
+    python -m mlmodel.registry publish task --from mlmodel --metrics '{"test_accuracy": 0.97}'
+    python -m mlmodel.registry activate task v2
+    python -m mlmodel.registry rollback task
+    python -m mlmodel.registry verify task
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from threading import Event, Thread
+from typing import Any, Callable, Dict, List, Optional
+import argparse
+import hashlib
+import json
+import logging
+import os
+import re
+import shutil
+import time
+import uuid
+
+from mlmodel.compact_model import load_artifacts
+
+logger = logging.getLogger(__name__)
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+REGISTRY_DIR = os.getenv("REGISTRY_DIR", os.path.join(BASE_DIR, "registry"))
+REGISTRY_VERIFY = os.getenv("REGISTRY_VERIFY", "1") != "0"
+
+MANIFEST_FILE = "manifest.json"
+CURRENT_FILE = "CURRENT"
+_VERSION_RE = re.compile(r"^v(\d+)$")
+
+
+class RegistryError(RuntimeError):
+    """Missing version, bad checksum or an invalid registry operation."""
+
+
+def artifact_names(model: str) -> Dict[str, str]:
+    """File names of one model's artifacts (same inside and outside the registry)."""
+    return {
+        "classifier": f"{model}_classifier.pkl",
+        "vectorizer": f"{model}_vectorizer.pkl",
+        "compact": f"{model}_model.compact",
+    }
+
+
+# ---------------------------------------------------------------
+# Layout helpers
+# ---------------------------------------------------------------
+def model_dir(model: str, root: Optional[str] = None) -> str:
+    return os.path.join(root or REGISTRY_DIR, model)
+
+
+def version_dir(model: str, version: str, root: Optional[str] = None) -> str:
+    return os.path.join(model_dir(model, root), version)
+
+
+def versions(model: str, root: Optional[str] = None) -> List[str]:
+    """Published versions, oldest first."""
+    try:
+        names = os.listdir(model_dir(model, root))
+    except OSError:
+        return []
+    found = [(int(m.group(1)), n) for n in names if (m := _VERSION_RE.match(n))]
+    return [name for _, name in sorted(found)]
+
+
+def current_path(model: str, root: Optional[str] = None) -> str:
+    return os.path.join(model_dir(model, root), CURRENT_FILE)
+
+
+def current_version(model: str, root: Optional[str] = None) -> Optional[str]:
+    try:
+        with open(current_path(model, root), "r", encoding="utf-8") as f:
+            return f.read().strip() or None
+    except OSError:
+        return None
+
+
+def manifest(model: str, version: str, root: Optional[str] = None) -> Dict[str, Any]:
+    path = os.path.join(version_dir(model, version, root), MANIFEST_FILE)
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except OSError:
+        raise RegistryError(f"{model} {version} is not in the registry")
+
+
+def _sha256(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        while chunk := f.read(1024 * 1024):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _checksums(directory: str) -> Dict[str, Dict[str, Any]]:
+    files = {}
+    for dirpath, _, filenames in os.walk(directory):
+        for name in sorted(filenames):
+            path = os.path.join(dirpath, name)
+            rel = os.path.relpath(path, directory).replace(os.sep, "/")
+            if rel == MANIFEST_FILE:
+                continue
+            files[rel] = {"sha256": _sha256(path), "bytes": os.path.getsize(path)}
+    return dict(sorted(files.items()))
+
+
+def verify(model: str, version: str, root: Optional[str] = None) -> None:
+    """Raise :class:`RegistryError` unless every file matches the manifest."""
+    expected = manifest(model, version, root)["files"]
+    actual = _checksums(version_dir(model, version, root))
+    bad = sorted(
+        rel for rel in set(expected) | set(actual)
+        if expected.get(rel, {}).get("sha256") != actual.get(rel, {}).get("sha256")
+    )
+    if bad:
+        raise RegistryError(f"{model} {version}: checksum mismatch for {', '.join(bad)}")
+
+
+# ---------------------------------------------------------------
+# Publish / activate
+# ---------------------------------------------------------------
+def _write_current(model: str, version: str, root: Optional[str] = None) -> None:
+    path = current_path(model, root)
+    tmp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(version + "\n")
+    os.replace(tmp_path, path)
+
+
+def publish(
+    model: str,
+    source_dir: str,
+    metrics: Optional[Dict[str, Any]] = None,
+    params: Optional[Dict[str, Any]] = None,
+    activate: bool = True,
+    root: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Copy ``model``'s artifacts from ``source_dir`` into a new version.
+
+    Returns the manifest. Only the artifact files named by
+    :func:`artifact_names` are copied; at least the pickles or the compact
+    export must be present.
+    """
+    names = artifact_names(model)
+    present = {k: n for k, n in names.items() if os.path.exists(os.path.join(source_dir, n))}
+    has_pickles = "classifier" in present and "vectorizer" in present
+    if not has_pickles and "compact" not in present:
+        raise RegistryError(f"No {model} artifacts found in {source_dir}")
+
+    parent = model_dir(model, root)
+    os.makedirs(parent, exist_ok=True)
+    staging = os.path.join(parent, f".staging-{uuid.uuid4().hex}")
+    os.makedirs(staging)
+    try:
+        for name in present.values():
+            src = os.path.join(source_dir, name)
+            if os.path.isdir(src):
+                shutil.copytree(src, os.path.join(staging, name))
+            else:
+                shutil.copy2(src, os.path.join(staging, name))
+
+        info = {
+            "model": model,
+            "created_at": time.time(),
+            "metrics": metrics or {},
+            "params": params or {},
+            "files": _checksums(staging),
+        }
+
+        # Claim the next free version number; rename is atomic
+        while True:
+            existing = versions(model, root)
+            number = int(existing[-1][1:]) + 1 if existing else 1
+            info["version"] = f"v{number}"
+            with open(os.path.join(staging, MANIFEST_FILE), "w", encoding="utf-8") as f:
+                json.dump(info, f, indent=2)
+            try:
+                os.rename(staging, version_dir(model, info["version"], root))
+                break
+            except OSError:
+                if not os.path.exists(version_dir(model, info["version"], root)):
+                    raise
+    finally:
+        shutil.rmtree(staging, ignore_errors=True)
+
+    logger.info("published %s %s", model, info["version"], extra={"metrics": info["metrics"]})
+    if activate:
+        activate_version(model, info["version"], root)
+    return info
+
+
+def activate_version(model: str, version: str, root: Optional[str] = None) -> None:
+    """Point ``CURRENT`` at ``version`` (after verifying its checksums)."""
+    verify(model, version, root)
+    _write_current(model, version, root)
+    logger.info("activated %s %s", model, version)
+
+
+def rollback(model: str, root: Optional[str] = None) -> str:
+    """Activate the version published before the current one."""
+    current = current_version(model, root)
+    available = versions(model, root)
+    if current not in available or available.index(current) == 0:
+        raise RegistryError(f"No earlier {model} version to roll back to (current: {current})")
+    previous = available[available.index(current) - 1]
+    activate_version(model, previous, root)
+    return previous
+
+
+# ---------------------------------------------------------------
+# Loading
+# ---------------------------------------------------------------
+@dataclass(frozen=True)
+class ModelBundle:
+    """Vectorizer + classifier that were loaded together from one version."""
+
+    vectorizer: Any
+    model: Any
+    version: Optional[str]  # None: legacy files outside the registry
+    source: str
+
+
+def load_bundle(model: str, fallback_dir: str, version: Optional[str] = None,
+                root: Optional[str] = None, fmt: Optional[str] = None) -> ModelBundle:
+    """Load ``version`` (default: ``CURRENT``) of ``model``; without a
+    registry entry, load the legacy artifacts from ``fallback_dir``."""
+    version = version or current_version(model, root)
+    if version:
+        directory = version_dir(model, version, root)
+        if REGISTRY_VERIFY:
+            verify(model, version, root)
+    else:
+        directory = fallback_dir
+
+    names = artifact_names(model)
+    vectorizer, classifier = load_artifacts(
+        os.path.join(directory, names["compact"]),
+        os.path.join(directory, names["vectorizer"]),
+        os.path.join(directory, names["classifier"]),
+        fmt,
+    )
+    return ModelBundle(vectorizer, classifier, version, directory)
+
+
+class ModelWatcher:
+    """Poll each model's ``CURRENT`` file and call ``reloaders[model]()``
+    when it changes. One watcher per process (API or pool worker)."""
+
+    def __init__(self, reloaders: Dict[str, Callable[[], Any]], interval: float,
+                 root: Optional[str] = None) -> None:
+        self.reloaders = reloaders
+        self.interval = interval
+        self.root = root
+        self._seen = {m: self._stamp(m) for m in reloaders}
+        self._stop = Event()
+        self._thread: Optional[Thread] = None
+
+    def _stamp(self, model: str):
+        try:
+            st = os.stat(current_path(model, self.root))
+            return st.st_mtime_ns, st.st_ino
+        except OSError:
+            return None
+
+    def check(self) -> List[str]:
+        """Reload models whose ``CURRENT`` changed; returns their names."""
+        changed = []
+        for model, reload in self.reloaders.items():
+            stamp = self._stamp(model)
+            if stamp == self._seen[model]:
+                continue
+            try:
+                reload()
+            except Exception:
+                logger.exception("hot reload of %s failed; keeping the live model", model)
+                continue
+            self._seen[model] = stamp
+            changed.append(model)
+        return changed
+
+    def start(self) -> None:
+        if self.interval > 0 and (self._thread is None or not self._thread.is_alive()):
+            self._stop.clear()
+            self._thread = Thread(target=self._run, name="model-watcher", daemon=True)
+            self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.check()
+
+
+# ---------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Manage versioned model artifacts.")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("list", help="versions and the live one")
+    p.add_argument("model")
+
+    p = sub.add_parser("publish", help="copy artifacts into a new version")
+    p.add_argument("model")
+    p.add_argument("--from", dest="source", default=BASE_DIR, help="directory holding the artifacts")
+    p.add_argument("--metrics", default="{}", help="JSON object of training metrics")
+    p.add_argument("--no-activate", action="store_true")
+
+    p = sub.add_parser("activate", help="make a version live")
+    p.add_argument("model")
+    p.add_argument("version")
+
+    p = sub.add_parser("verify", help="check a version's checksums")
+    p.add_argument("model")
+    p.add_argument("version", nargs="?", help="default: the live version")
+
+    p = sub.add_parser("rollback", help="activate the previous version")
+    p.add_argument("model")
+
+    args = parser.parse_args(argv)
+    try:
+        if args.command == "list":
+            current = current_version(args.model)
+            for version in versions(args.model):
+                info = manifest(args.model, version)
+                marker = "*" if version == current else " "
+                print(f"{marker} {version}  {time.ctime(info['created_at'])}  {json.dumps(info['metrics'])}")
+        elif args.command == "publish":
+            info = publish(args.model, args.source, metrics=json.loads(args.metrics),
+                           activate=not args.no_activate)
+            print(f"✔ {args.model} {info['version']}")
+        elif args.command == "activate":
+            activate_version(args.model, args.version)
+            print(f"✔ {args.model} {args.version} is live")
+        elif args.command == "verify":
+            version = args.version or current_version(args.model)
+            if not version:
+                raise RegistryError(f"No live {args.model} version")
+            verify(args.model, version)
+            print(f"✔ {args.model} {version} checksums OK")
+        elif args.command == "rollback":
+            print(f"✔ {args.model} rolled back to {rollback(args.model)}")
+    except RegistryError as exc:
+        print(f"✘ {exc}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
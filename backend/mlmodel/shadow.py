@@ -0,0 +1,184 @@
+"""Shadow scoring: run a candidate model version next to the live one.
+
+``SHADOW_TASK_VERSION`` / ``SHADOW_NAME_VERSION`` name a registry version to
+shadow. Each live prediction batch is re-scored by the candidate on a
+background thread, so live latency is unaffected; agreement (same decision
+at the live threshold) and per-call latency of both models are exported as
+metrics and summarized by :func:`stats`. Shadow results are never served.
+
+Pool workers (``PIPELINE_WORKERS`` > 0) score their own traffic, so their
+results would never reach the API process. A worker calls
+:func:`forward_samples` at start-up; from then on each finished shadow
+batch is queued instead of counted, and the pool returns :func:`drain`-ed
+samples with each pipeline result. The API process applies them with
+:func:`merge`, the same way stage timings are merged.
+"""
+from __future__ import annotations
+
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+from typing import Any, Deque, Dict, List, Optional, Sequence
+import logging
+import os
+import time
+
+from core.lazy import LazyArtifact
+from core.metrics import Counter, Histogram
+from mlmodel import registry
+from mlmodel.online_update import class_index
+
+logger = logging.getLogger(__name__)
+
+SHADOW_MAX_PENDING = int(os.getenv("SHADOW_MAX_PENDING", "8"))
+FORWARD_MAX_SAMPLES = 10_000  # drop the oldest if nobody drains
+
+SHADOW_PREDICTIONS = Counter(
+    "shadow_predictions_total",
+    "Items scored by a shadow candidate, by model and agreement with live.",
+)
+SHADOW_SKIPPED = Counter("shadow_skipped_total", "Batches not shadowed because the shadow queue was full.")
+MODEL_CALL_SECONDS = Histogram(
+    "model_call_seconds",
+    "Latency of one scoring call, by model and variant (live / shadow).",
+)
+
+
+class ShadowScorer:
+    """Score batches with a candidate ``version`` of ``model`` off the hot path."""
+
+    def __init__(self, model: str, version: str, fallback_dir: str) -> None:
+        self.model = model
+        self.version = version
+        self._bundle = LazyArtifact(
+            f"shadow:{model}:{version}",
+            lambda: registry.load_bundle(model, fallback_dir, version=version),
+        )
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"shadow-{model}")
+        self._lock = Lock()
+        self._pending = 0
+        self.items = 0
+        self.agreed = 0
+        self.batches = 0
+        self.errors = 0
+        self.live_seconds = 0.0
+        self.shadow_seconds = 0.0
+
+    def observe(self, texts: Sequence[str], live_probs: Sequence[float],
+                live_seconds: float, threshold: float) -> None:
+        """Queue ``texts`` for candidate scoring (dropped if the queue is full)."""
+        with self._lock:
+            skipped = self._pending >= SHADOW_MAX_PENDING
+            if not skipped:
+                self._pending += 1
+        if skipped:
+            self.record({"event": "skipped", "live_seconds": live_seconds})
+            return
+        self._executor.submit(self._score, list(texts), list(live_probs), live_seconds, threshold)
+
+    def _score(self, texts, live_probs, live_seconds, threshold) -> None:
+        try:
+            bundle = self._bundle.get()
+            started = time.perf_counter()
+            X = bundle.vectorizer.transform(texts)
+            probs = bundle.model.predict_proba(X)[:, class_index(bundle.model, True)]
+            seconds = time.perf_counter() - started
+        except Exception:
+            logger.exception("shadow scoring failed", extra={"model": self.model, "version": self.version})
+            with self._lock:
+                self._pending -= 1
+            self.record({"event": "error", "live_seconds": live_seconds})
+            return
+
+        agreed = sum((live >= threshold) == (cand >= threshold) for live, cand in zip(live_probs, probs))
+        with self._lock:
+            self._pending -= 1
+        self.record({"event": "scored", "items": len(texts), "agreed": int(agreed),
+                     "live_seconds": live_seconds, "shadow_seconds": seconds})
+
+    def record(self, sample: Dict[str, Any]) -> None:
+        """Count one batch outcome here, or queue it for the API process."""
+        if _forward is not None:
+            _forward.append({"model": self.model, "version": self.version, **sample})
+            return
+
+        MODEL_CALL_SECONDS.observe(sample["live_seconds"], model=self.model, variant="live")
+        event = sample["event"]
+        if event == "skipped":
+            SHADOW_SKIPPED.inc(model=self.model)
+            return
+        if event == "scored":
+            items, agreed = sample["items"], sample["agreed"]
+            MODEL_CALL_SECONDS.observe(sample["shadow_seconds"], model=self.model, variant="shadow")
+            SHADOW_PREDICTIONS.inc(agreed, model=self.model, agree="true")
+            SHADOW_PREDICTIONS.inc(items - agreed, model=self.model, agree="false")
+        with self._lock:
+            if event == "error":
+                self.errors += 1
+                return
+            self.batches += 1
+            self.items += items
+            self.agreed += agreed
+            self.live_seconds += sample["live_seconds"]
+            self.shadow_seconds += sample["shadow_seconds"]
+
+    def stats(self) -> Dict[str, object]:
+        with self._lock:
+            return {
+                "version": self.version,
+                "items": self.items,
+                "batches": self.batches,
+                "errors": self.errors,
+                "agreement": self.agreed / self.items if self.items else None,
+                "mean_live_seconds": self.live_seconds / self.batches if self.batches else None,
+                "mean_shadow_seconds": self.shadow_seconds / self.batches if self.batches else None,
+            }
+
+
+_SCORERS: Dict[str, ShadowScorer] = {}
+_forward: Optional[Deque[Dict[str, Any]]] = None
+
+
+def configure(model: str, fallback_dir: str, version: Optional[str] = None) -> Optional[ShadowScorer]:
+    """Shadow ``version`` (default: ``SHADOW_<MODEL>_VERSION``) of ``model``;
+    an empty version turns shadowing off."""
+    if version is None:
+        version = os.getenv(f"SHADOW_{model.upper()}_VERSION", "")
+    if not version:
+        _SCORERS.pop(model, None)
+        return None
+    _SCORERS[model] = ShadowScorer(model, version, fallback_dir)
+    return _SCORERS[model]
+
+
+def get(model: str) -> Optional[ShadowScorer]:
+    return _SCORERS.get(model)
+
+
+def stats() -> Dict[str, Dict[str, object]]:
+    return {model: scorer.stats() for model, scorer in _SCORERS.items()}
+
+
+def forward_samples() -> None:
+    """Queue this process's shadow results for :func:`drain` (pool workers)."""
+    global _forward
+    if _forward is None:
+        _forward = deque(maxlen=FORWARD_MAX_SAMPLES)
+
+
+def drain() -> List[Dict[str, Any]]:
+    """Shadow results finished since the last call (empty unless forwarding)."""
+    samples = []
+    while _forward:
+        samples.append(_forward.popleft())
+    return samples
+
+
+def merge(samples: Sequence[Dict[str, Any]]) -> None:
+    """Apply samples drained in a pool worker to this process's scorers."""
+    for sample in samples:
+        scorer = _SCORERS.get(sample["model"])
+        if scorer is None or scorer.version != sample["version"]:
+            logger.debug("dropping shadow sample for %s %s", sample["model"], sample["version"])
+            continue
+        scorer.record({k: v for k, v in sample.items() if k not in ("model", "version")})
@@ -0,0 +1,153 @@
+"""Deduplicated, sharded CSV output for the synthetic dataset generators.
+
+:func:`write_deduplicated` takes any iterable of rows (a generator is fine)
+and writes each distinct row once. It makes exactly two passes and its
+memory use does not depend on the total number of rows:
+
+1. **Partition.** Stream the rows and append each one to one of ``buckets``
+   temporary files, chosen by a 64-bit blake2b digest of the row. Equal
+   rows always land in the same bucket. Rows are held in memory until
+   ``PENDING_ROWS`` are pending across all buckets. Each non-empty bucket
+   is then appended to its file, which is opened and closed again, so
+   memory and open files do not grow with ``buckets``.
+2. **Dedup.** For each bucket, keep the digests seen so far in a set and
+   write first occurrences only. Bucket ``b`` goes to output shard
+   ``b % shards``. Shards are written one after another, so one output
+   file is open at a time.
+
+Peak memory is the pending rows plus one bucket's digest set (8 bytes plus
+set overhead per distinct row), so raise ``buckets`` for larger runs.
+Output is written next to the target and renamed into place at the end, so
+the input may be the file being replaced (see
+``name_dataset.append_or_create``).
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Callable, Iterable, Iterator, List, Optional, Sequence
+import csv
+import glob
+import hashlib
+import os
+import shutil
+import tempfile
+import time
+
+WRITE_BUFFER = 1024 * 1024
+PENDING_ROWS = 100_000
+
+
+@dataclass
+class WriteStats:
+    rows_in: int = 0
+    rows_out: int = 0
+    shards: int = 1
+    seconds: float = 0.0
+
+    @property
+    def duplicates(self) -> int:
+        return self.rows_in - self.rows_out
+
+
+def row_digest(row: Sequence) -> bytes:
+    return hashlib.blake2b("\x1f".join(map(str, row)).encode("utf-8"), digest_size=8).digest()
+
+
+def shard_paths(path: str) -> List[str]:
+    """The CSV files making up ``path`` (a single CSV or a shard directory)."""
+    if os.path.isdir(path):
+        return sorted(glob.glob(os.path.join(path, "part-*.csv")))
+    return [path]
+
+
+def iter_csv(path: str, header: Sequence[str]) -> Iterator[List[str]]:
+    """Stream the data rows of a CSV (or shard directory), skipping header lines."""
+    header = list(header)
+    for part in shard_paths(path):
+        with open(part, "r", newline="", encoding="utf-8") as f:
+            for row in csv.reader(f):
+                if row and row != header:
+                    yield row
+
+
+def _flush(pending: List[List[Sequence]], paths: List[str]) -> None:
+    """Append each bucket's pending rows to its file, one file open at a time."""
+    for rows, path in zip(pending, paths):
+        if rows:
+            with open(path, "a", newline="", encoding="utf-8") as f:
+                csv.writer(f).writerows(rows)
+            rows.clear()
+
+
+def write_deduplicated(rows: Iterable[Sequence], output: str, header: Sequence[str],
+                       shards: int = 1, buckets: int = 64,
+                       on_write: Optional[Callable[[List[str]], None]] = None) -> WriteStats:
+    """Write the distinct ``rows`` to ``output``.
+
+    With ``shards == 1`` ``output`` is a single CSV. Otherwise it is a
+    directory of ``part-NNNNN.csv`` files, each with its own header.
+    ``on_write`` is called with every row that is kept (as CSV strings),
+    e.g. to count labels without reading the output again.
+    """
+    started = time.perf_counter()
+    shards = max(1, shards)
+    buckets = max(buckets, shards)
+    stats = WriteStats(shards=shards)
+
+    if shards == 1 and os.path.isdir(output):
+        raise ValueError(f"{output} is a directory; pass a CSV path or shards > 1")
+    if shards > 1 and os.path.exists(output) and not os.path.isdir(output):
+        raise ValueError(f"{output} is a file; sharded output needs a directory path")
+
+    parent = os.path.dirname(os.path.abspath(output))
+    os.makedirs(parent, exist_ok=True)
+    work = tempfile.mkdtemp(prefix=".dedup-", dir=parent)
+    try:
+        # Pass 1: partition by digest
+        bucket_paths = [os.path.join(work, f"bucket-{b:05d}.csv") for b in range(buckets)]
+        pending: List[List[Sequence]] = [[] for _ in range(buckets)]
+        pending_rows = 0
+        for row in rows:
+            digest = row_digest(row)
+            pending[int.from_bytes(digest[:4], "little") % buckets].append(row)
+            stats.rows_in += 1
+            pending_rows += 1
+            if pending_rows >= PENDING_ROWS:
+                _flush(pending, bucket_paths)
+                pending_rows = 0
+        _flush(pending, bucket_paths)
+
+        # Pass 2: dedup each bucket into its shard
+        staging = os.path.join(work, "out")
+        os.makedirs(staging)
+        for shard in range(shards):
+            with open(os.path.join(staging, f"part-{shard:05d}.csv"), "w", newline="",
+                      encoding="utf-8", buffering=WRITE_BUFFER) as out:
+                writer = csv.writer(out)
+                writer.writerow(header)
+                for path in bucket_paths[shard::shards]:
+                    if not os.path.exists(path):
+                        continue
+                    seen = set()
+                    with open(path, "r", newline="", encoding="utf-8") as f:
+                        for row in csv.reader(f):
+                            digest = row_digest(row)
+                            if digest not in seen:
+                                seen.add(digest)
+                                writer.writerow(row)
+                                stats.rows_out += 1
+                                if on_write is not None:
+                                    on_write(row)
+                    os.remove(path)
+
+        if shards == 1:
+            os.replace(os.path.join(staging, "part-00000.csv"), output)
+        else:
+            if os.path.isdir(output):
+                shutil.rmtree(output)
+            os.replace(staging, output)
+    finally:
+        shutil.rmtree(work, ignore_errors=True)
+
+    stats.seconds = time.perf_counter() - started
+    return stats
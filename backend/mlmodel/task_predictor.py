@@ -1,15 +1,68 @@
 import os
-import joblib
+import logging
 import re
+import time
+from dataclasses import replace
+from threading import Lock
 
-# Load Model & Vectorizer Once
+from core.lazy import LazyArtifact
+from mlmodel import registry, shadow
+
+logger = logging.getLogger(__name__)
+
+# Load Model & Vectorizer once, on first use (or during API warm-up).
+# The live version comes from the model registry (mlmodel/registry/task);
+# without one, the legacy files below are used.
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 
 MODEL_PATH = os.path.join(BASE_DIR, "task_classifier.pkl")
 VECTORIZER_PATH = os.path.join(BASE_DIR, "task_vectorizer.pkl")
+# sklearn-free export of the two pickles (python -m mlmodel.compact_model)
+COMPACT_DIR = os.path.join(BASE_DIR, "task_model.compact")
+
+# Probability above which a sentence counts as a task
+TASK_THRESHOLD = float(os.getenv("TASK_THRESHOLD", "0.5"))
+
+# Vectorizer + classifier are loaded and swapped as one bundle, so a
+# caller never pairs a new vectorizer with an old classifier.
+_bundle = LazyArtifact("task_model", lambda: registry.load_bundle("task", BASE_DIR))
+
+_swap_lock = Lock()
+
+shadow.configure("task", BASE_DIR)
+
+
+def get_bundle():
+    return _bundle.get()
+
+
+def get_model():
+    return _bundle.get().model
+
+
+def get_vectorizer():
+    return _bundle.get().vectorizer
+
 
-model = joblib.load(MODEL_PATH)
-vectorizer = joblib.load(VECTORIZER_PATH)
+def reload():
+    """Load the registry's current version (or the legacy files) and swap it in."""
+    with _swap_lock:
+        return _bundle.reload()
+
+
+def swap_model(model, expected=None):
+    """Replace the in-memory classifier (e.g. after an online update).
+
+    In-flight calls keep the model they already fetched. With ``expected``,
+    nothing is swapped (returns False) if another reload happened since
+    that bundle was fetched.
+    """
+    with _swap_lock:
+        current = get_bundle()
+        if expected is not None and current is not expected:
+            return False
+        _bundle.set(replace(current, model=model))
+        return True
 
 
 def preprocess(text: str) -> str:
@@ -24,11 +77,52 @@ def preprocess(text: str) -> str:
     return text.strip()
 
 
-def is_task(sentence: str) -> bool:
-    clean = preprocess(sentence)
-    print("CLEANED SENTENCE →", clean)
-    X = vectorizer.transform([clean])
-    prediction = model.predict(X)[0]
-    print("PREDICTION RAW →", prediction)
-    return prediction == "1"
+def _positive_index(model) -> int:
+    """Column of predict_proba that holds the 'task' class (label 1 / "1")."""
+    for i, label in enumerate(model.classes_):
+        if str(label) == "1":
+            return i
+    raise ValueError(f"Task classifier has no positive class: {list(model.classes_)}")
+
+
+def task_probabilities(sentences: list) -> list:
+    """
+    Probability that each sentence is a task.
+
+    The whole batch goes through ONE sparse vectorizer.transform and
+    ONE predict_proba call.
+    """
+    if not sentences:
+        return []
+
+    bundle = get_bundle()
+    cleaned = [preprocess(s) for s in sentences]
+    started = time.perf_counter()
+    X = bundle.vectorizer.transform(cleaned)
+    probs = bundle.model.predict_proba(X)[:, _positive_index(bundle.model)].tolist()
+
+    try:
+        scorer = shadow.get("task")
+        if scorer is not None:
+            scorer.observe(cleaned, probs, time.perf_counter() - started, TASK_THRESHOLD)
+    except Exception:  # shadowing must never affect live predictions
+        logger.exception("shadow observe failed", extra={"model": "task"})
+    return probs
+
+
+def is_task_batch(sentences: list, threshold: float = None) -> list:
+    """Classify many sentences at once; returns one bool per sentence."""
+    if threshold is None:
+        threshold = TASK_THRESHOLD
+
+    return [p >= threshold for p in task_probabilities(sentences)]
+
 
+def is_task(sentence: str, threshold: float = None) -> bool:
+    prob = task_probabilities([sentence])[0]
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "task classification",
+            extra={"cleaned": preprocess(sentence), "probability": prob},
+        )
+    return prob >= (TASK_THRESHOLD if threshold is None else threshold)
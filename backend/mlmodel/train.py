@@ -0,0 +1,436 @@
+"""Training CLI for the task and name classifiers.
+
+Run from ``backend/``::
+
+    python -m mlmodel.train task                       # grid search, all cores
+    python -m mlmodel.train name --search random --n-iter 20 --n-jobs 4
+    python -m mlmodel.train task --streaming --data big.csv   # out of core
+    python -m mlmodel.train task --publish             # + new registry version
+
+Steps:
+
+1. Load the CSV and keep rows labeled 0/1.
+2. Hold out the test split, then run cross-validated grid or random search
+   over the classifier hyperparameters, in parallel across ``--n-jobs``
+   cores. Vectorizer and classifier form one ``Pipeline``, so the
+   vectorizer is refit on every fold's training part and, for the final
+   model, on the training split only. The held-out split is only scored.
+3. Each fitted vectorizer and its CSR feature matrix are cached under
+   ``--cache-dir`` through the pipeline's ``joblib.Memory``, with the
+   arrays stored memory-mappable. One directory is kept per CSV sha256,
+   vectorizer parameters and preprocessing code. Inside it, entries are
+   keyed by the exact fold texts, so search candidates and re-runs reuse
+   each fold's features instead of re-tokenizing.
+4. Write the artifacts predictors load (pickles plus the compact export),
+   a JSON timing and accuracy report, and, with ``--publish``, a new live
+   registry version.
+
+``--streaming`` trains the task model with stateless hashing features and
+``SGDClassifier.partial_fit`` over CSV chunks, with memory bounded by the
+chunk size. It has no feature cache and no search.
+"""
+from __future__ import annotations
+
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple
+import argparse
+import hashlib
+import inspect
+import json
+import os
+import time
+import zlib
+
+import joblib
+import numpy as np
+import pandas as pd
+from scipy.stats import loguniform
+from sklearn.feature_extraction.text import HashingVectorizer, TfidfVectorizer
+from sklearn.linear_model import LogisticRegression, SGDClassifier
+from sklearn.model_selection import (
+    GridSearchCV,
+    RandomizedSearchCV,
+    StratifiedKFold,
+    train_test_split,
+)
+from sklearn.pipeline import Pipeline
+
+from mlmodel import name_predictor, registry, task_predictor
+from mlmodel.compact_model import export as export_compact
+from mlmodel.shard_writer import shard_paths
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+CACHE_DIR = os.getenv("FEATURE_CACHE_DIR", os.path.join(BASE_DIR, ".feature_cache"))
+CACHE_FORMAT = 2
+
+CLASSES = np.array([0, 1])
+
+
+@dataclass(frozen=True)
+class ModelSpec:
+    """What to train for one model kind."""
+
+    name: str
+    dataset: str
+    text_column: str
+    preprocess: Callable[[str], str]  # the predictor's, so train == serve
+    vectorizer_params: Dict[str, Any] = field(default_factory=dict)
+
+
+SPECS = {
+    "task": ModelSpec(
+        "task", os.path.join(BASE_DIR, "custom_500.csv"), "sentence",
+        task_predictor.preprocess, {},
+    ),
+    "name": ModelSpec(
+        "name", os.path.join(BASE_DIR, "name_dataset.csv"), "word",
+        name_predictor.preprocess, {"analyzer": "char", "ngram_range": (2, 4)},
+    ),
+}
+
+PARAM_GRID = {
+    "C": [0.1, 0.3, 1.0, 3.0, 10.0, 30.0],
+    "class_weight": [None, "balanced"],
+}
+PARAM_DISTRIBUTIONS = {
+    "C": loguniform(1e-2, 1e3),
+    "class_weight": [None, "balanced"],
+}
+
+
+class Timings:
+    """Wall-clock seconds per training step, for the report."""
+
+    def __init__(self) -> None:
+        self.seconds: Dict[str, float] = {}
+
+    @contextmanager
+    def step(self, name: str) -> Iterator[None]:
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.seconds[name] = self.seconds.get(name, 0.0) + time.perf_counter() - started
+            print(f"  {name:<12} {self.seconds[name]:8.2f}s")
+
+
+def clean_labels(df: pd.DataFrame, text_column: str) -> pd.DataFrame:
+    """Keep rows whose label is 0/1 (drops repeated header lines etc.)."""
+    labels = pd.to_numeric(df["label"], errors="coerce")
+    df = df[labels.isin(CLASSES)].copy()
+    df["label"] = labels[df.index].astype(int)
+    df[text_column] = df[text_column].astype(str)
+    return df
+
+
+def _sha256(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        while chunk := f.read(1024 * 1024):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+# ---------------------------------------------------------------
+# Feature cache
+# ---------------------------------------------------------------
+def _code_fingerprint(fn: Callable) -> str:
+    """Hash of ``fn``'s source, so any edit (regexes and other constants
+    included) invalidates the cache; bytecode + constants without source."""
+    try:
+        code = inspect.getsource(fn)
+    except (OSError, TypeError):
+        code = fn.__code__.co_code.hex() + repr(fn.__code__.co_consts)
+    return hashlib.sha256(code.encode("utf-8")).hexdigest()
+
+
+def cache_key(spec: ModelSpec, data_sha256: str) -> str:
+    preprocess = spec.preprocess
+    fingerprint = {
+        "format": CACHE_FORMAT,
+        "data": data_sha256,
+        "text_column": spec.text_column,
+        "vectorizer": {k: list(v) if isinstance(v, tuple) else v
+                       for k, v in sorted(spec.vectorizer_params.items())},
+        "preprocess": [preprocess.__module__, preprocess.__qualname__,
+                       _code_fingerprint(preprocess)],
+    }
+    blob = json.dumps(fingerprint, sort_keys=True).encode("utf-8")
+    return f"{spec.name}-{hashlib.sha256(blob).hexdigest()[:16]}"
+
+
+def feature_memory(spec: ModelSpec, data_sha256: str, cache_dir: str) -> Tuple[joblib.Memory, bool]:
+    """Disk cache for the pipeline's vectorizer step, one directory per
+    dataset/preprocessing/vectorizer combination (see :func:`cache_key`);
+    also whether that directory already existed."""
+    location = os.path.join(cache_dir, cache_key(spec, data_sha256))
+    warm = os.path.isdir(location)
+    return joblib.Memory(location, mmap_mode="r", verbose=0), warm
+
+
+def build_pipeline(spec: ModelSpec, memory: Optional[joblib.Memory] = None) -> Pipeline:
+    return Pipeline(
+        [
+            ("vectorizer", TfidfVectorizer(**spec.vectorizer_params)),
+            ("classifier", LogisticRegression(max_iter=2000)),
+        ],
+        memory=memory,
+    )
+
+
+# ---------------------------------------------------------------
+# Search
+# ---------------------------------------------------------------
+def build_search(pipeline: Pipeline, kind: str, cv: int, n_iter: int, n_jobs: int, seed: int):
+    folds = StratifiedKFold(n_splits=cv, shuffle=True, random_state=seed)
+    if kind == "grid":
+        return GridSearchCV(pipeline, _classifier_params(PARAM_GRID), cv=folds,
+                            scoring="accuracy", n_jobs=n_jobs, refit=True)
+    return RandomizedSearchCV(pipeline, _classifier_params(PARAM_DISTRIBUTIONS), n_iter=n_iter,
+                              cv=folds, scoring="accuracy", n_jobs=n_jobs, refit=True,
+                              random_state=seed)
+
+
+def _classifier_params(params: Dict[str, Any]) -> Dict[str, Any]:
+    return {f"classifier__{name}": values for name, values in params.items()}
+
+
+def _top_results(search, limit: int = 5):
+    results = search.cv_results_
+    order = np.argsort(results["rank_test_score"])[:limit]
+    return [
+        {
+            "params": {k.split("__", 1)[-1]: (v if isinstance(v, (str, type(None))) else float(v))
+                       for k, v in results["params"][i].items()},
+            "mean_score": float(results["mean_test_score"][i]),
+            "std_score": float(results["std_test_score"][i]),
+            "mean_fit_seconds": float(results["mean_fit_time"][i]),
+        }
+        for i in order
+    ]
+
+
+def train_batch(spec: ModelSpec, args, timings: Timings) -> Tuple[Any, Any, Dict[str, Any]]:
+    """
+    TF-IDF + logistic regression as one Pipeline, so the vectorizer is fit
+    on each CV fold's training part and finally on the training split only;
+    held-out rows never shape the vocabulary or IDF weights.
+    """
+    with timings.step("load_csv"):
+        data_sha256 = _sha256(args.data)
+        df = clean_labels(pd.read_csv(args.data), spec.text_column)
+        texts = np.array([spec.preprocess(t) for t in df[spec.text_column]], dtype=object)
+        y = df["label"].to_numpy()
+
+    texts_train, texts_test, y_train, y_test = train_test_split(
+        texts, y, test_size=args.test_size, random_state=args.seed, stratify=y
+    )
+
+    memory, cache_warm = None, False
+    if not args.no_cache and args.cache_dir:
+        memory, cache_warm = feature_memory(spec, data_sha256, args.cache_dir)
+        print(f"  feature cache: {memory.location} ({'warm' if cache_warm else 'cold'})")
+    pipeline = build_pipeline(spec, memory)
+
+    report: Dict[str, Any] = {
+        "dataset": {"path": args.data, "sha256": data_sha256, "rows": int(len(texts)),
+                    "train_rows": int(len(texts_train)), "test_rows": int(len(texts_test))},
+        "feature_cache": {"path": memory.location, "warm": cache_warm} if memory is not None else None,
+        "search": args.search,
+    }
+
+    if args.search == "none":
+        with timings.step("fit"):
+            pipeline.fit(texts_train, y_train)
+    else:
+        search = build_search(pipeline, args.search, args.cv, args.n_iter, args.n_jobs, args.seed)
+        with timings.step("search"):
+            search.fit(texts_train, y_train)
+        pipeline = search.best_estimator_
+        report.update({
+            "cv_folds": args.cv,
+            "n_jobs": args.n_jobs,
+            "candidates": len(search.cv_results_["params"]),
+            "best_params": _top_results(search, 1)[0]["params"],
+            "cv_best_score": float(search.best_score_),
+            "top_candidates": _top_results(search),
+        })
+
+    with timings.step("evaluate"):
+        report["metrics"] = {
+            "train_accuracy": float(pipeline.score(texts_train, y_train)),
+            "test_accuracy": float(pipeline.score(texts_test, y_test)),
+            "samples": int(len(texts)),
+        }
+
+    vectorizer = pipeline.named_steps["vectorizer"]
+    report["dataset"]["features"] = len(vectorizer.vocabulary_)
+    return pipeline.named_steps["classifier"], vectorizer, report
+
+
+# ---------------------------------------------------------------
+# Streaming (hashing + partial_fit)
+# ---------------------------------------------------------------
+def iter_chunks(path: str, chunksize: int, test_size: float, text_column: str):
+    """
+    Yield (train_df, test_df) per CSV chunk. ``path`` may be a directory of
+    ``part-*.csv`` shards (``mlmodel.dataset --shards``).
+
+    The split is a stable hash of the text, so a row lands on the same side
+    in every epoch without keeping an index in memory.
+    """
+    cutoff = int(test_size * 100)
+    for part in shard_paths(path):
+        for chunk in pd.read_csv(part, chunksize=chunksize):
+            chunk = clean_labels(chunk, text_column)
+            bucket = chunk[text_column].map(lambda s: zlib.crc32(s.encode("utf-8")) % 100)
+            yield chunk[bucket >= cutoff], chunk[bucket < cutoff]
+
+
+def train_streaming(spec: ModelSpec, args, timings: Timings) -> Tuple[Any, Any, Dict[str, Any]]:
+    vectorizer = HashingVectorizer(
+        n_features=args.n_features,
+        ngram_range=(1, args.max_ngram),
+        alternate_sign=False,
+        norm="l2",
+    )
+    model = SGDClassifier(loss="log_loss", alpha=args.alpha, random_state=args.seed)
+    rng = np.random.default_rng(args.seed)
+    column = spec.text_column
+
+    def texts(part):
+        return [spec.preprocess(t) for t in part[column]]
+
+    with timings.step("fit"):
+        for epoch in range(1, args.epochs + 1):
+            seen = 0
+            for train_df, _ in iter_chunks(args.data, args.chunksize, args.test_size, column):
+                if train_df.empty:
+                    continue
+                rows = texts(train_df)
+                order = rng.permutation(len(rows))
+                X = vectorizer.transform([rows[i] for i in order])
+                model.partial_fit(X, train_df["label"].to_numpy()[order], classes=CLASSES)
+                seen += len(train_df)
+            print(f"  epoch {epoch}/{args.epochs}: {seen} training rows")
+
+    if not hasattr(model, "coef_"):
+        raise SystemExit(f"No labeled rows found in {args.data}")
+
+    correct = {"train": 0, "test": 0}
+    total = {"train": 0, "test": 0}
+    with timings.step("evaluate"):
+        for train_df, test_df in iter_chunks(args.data, args.chunksize, args.test_size, column):
+            for split, part in (("train", train_df), ("test", test_df)):
+                if part.empty:
+                    continue
+                predicted = model.predict(vectorizer.transform(texts(part)))
+                correct[split] += int((predicted == part["label"].to_numpy()).sum())
+                total[split] += len(part)
+
+    metrics = {f"{s}_accuracy": (correct[s] / total[s] if total[s] else None) for s in total}
+    metrics["samples"] = total["train"] + total["test"]
+    report = {
+        "dataset": {"path": args.data, "rows": metrics["samples"], "features": args.n_features},
+        "search": "none",
+        "streaming": {"epochs": args.epochs, "chunksize": args.chunksize, "alpha": args.alpha},
+        "metrics": metrics,
+    }
+    return model, vectorizer, report
+
+
+# ---------------------------------------------------------------
+# Artifacts + report
+# ---------------------------------------------------------------
+def save_artifacts(spec: ModelSpec, model, vectorizer, output_dir: str) -> Dict[str, str]:
+    names = registry.artifact_names(spec.name)
+    os.makedirs(output_dir, exist_ok=True)
+    paths = {kind: os.path.join(output_dir, name) for kind, name in names.items()}
+    joblib.dump(model, paths["classifier"])
+    joblib.dump(vectorizer, paths["vectorizer"])
+    # Keep the compact export in step with the pickles (MODEL_FORMAT=auto
+    # prefers it), so a retrain never leaves a stale compact model behind.
+    export_compact(vectorizer, model, paths["compact"])
+    return paths
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Train the task or name classifier.")
+    parser.add_argument("model", choices=sorted(SPECS))
+    parser.add_argument("--data", help="CSV with text and label columns, or a shard directory "
+                                       "with --streaming (default: the bundled dataset)")
+    parser.add_argument("--output-dir", default=BASE_DIR, help="where artifacts and the report are written")
+    parser.add_argument("--test-size", type=float, default=0.20)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--search", choices=["grid", "random", "none"], default="grid")
+    parser.add_argument("--n-iter", type=int, default=20, help="candidates for --search random")
+    parser.add_argument("--cv", type=int, default=5, help="cross-validation folds")
+    parser.add_argument("--n-jobs", type=int, default=-1, help="parallel fits (-1: all cores)")
+    parser.add_argument("--cache-dir", default=CACHE_DIR, help="feature matrix cache")
+    parser.add_argument("--no-cache", action="store_true")
+    parser.add_argument("--report", help="report path (default: <output-dir>/<model>_training_report.json)")
+    parser.add_argument("--publish", action="store_true",
+                        help="also publish the artifacts as a new live registry version")
+    streaming = parser.add_argument_group("streaming (task model, out of core)")
+    streaming.add_argument("--streaming", action="store_true",
+                           help="hashing features + SGD partial_fit over CSV chunks")
+    streaming.add_argument("--chunksize", type=int, default=50_000, help="CSV rows per partial_fit batch")
+    streaming.add_argument("--epochs", type=int, default=5, help="passes over the CSV")
+    streaming.add_argument("--n-features", type=int, default=2 ** 20, help="hashing space size")
+    streaming.add_argument("--max-ngram", type=int, default=2, help="word n-grams 1..N")
+    streaming.add_argument("--alpha", type=float, default=1e-5, help="SGD regularization strength")
+    args = parser.parse_args(argv)
+
+    spec = SPECS[args.model]
+    args.data = args.data or spec.dataset
+    if args.streaming and spec.name != "task":
+        parser.error("--streaming is only available for the task model")
+    if os.path.isdir(args.data) and not args.streaming:
+        parser.error("a shard directory as --data needs --streaming")
+
+    timings = Timings()
+    started = time.perf_counter()
+    print(f"Training {spec.name} model on {args.data}")
+
+    train = train_streaming if args.streaming else train_batch
+    model, vectorizer, report = train(spec, args, timings)
+
+    with timings.step("save"):
+        paths = save_artifacts(spec, model, vectorizer, args.output_dir)
+
+    if args.publish:
+        with timings.step("publish"):
+            params = {k: v for k, v in vars(args).items()
+                      if k not in ("output_dir", "publish", "report", "cache_dir")}
+            params["best_params"] = report.get("best_params")
+            info = registry.publish(spec.name, args.output_dir, metrics=report["metrics"], params=params)
+        report["registry_version"] = info["version"]
+
+    report.update({
+        "model": spec.name,
+        "created_at": time.time(),
+        "classifier": type(model).__name__,
+        "artifacts": paths,
+        "timings": timings.seconds,
+        "total_seconds": time.perf_counter() - started,
+    })
+    report_path = args.report or os.path.join(args.output_dir, f"{spec.name}_training_report.json")
+    with open(report_path, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+
+    metrics = report["metrics"]
+    print(f"\nTrain accuracy: {metrics['train_accuracy']}")
+    print(f"Test accuracy:  {metrics['test_accuracy']}")
+    if "best_params" in report:
+        print(f"Best params:    {report['best_params']} (cv {report['cv_best_score']:.4f})")
+    for path in paths.values():
+        print(f"✔ Saved: {path}")
+    print(f"✔ Report: {report_path}")
+    if "registry_version" in report:
+        print(f"✔ Published: {spec.name} {report['registry_version']} (live)")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
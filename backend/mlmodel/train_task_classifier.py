@@ -1,57 +1,34 @@
-import joblib
-import pandas as pd
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.linear_model import LogisticRegression
-from sklearn.model_selection import train_test_split
-from sklearn.utils import shuffle
-
 # ======================================================
-# 1. Load Your Custom Dataset (500 sentences)
+# train_task_classifier.py
+#
+# Kept so existing commands keep working; training lives in
+# mlmodel/train.py (feature cache, hyperparameter search, report).
+#
+#   python -m mlmodel.train_task_classifier [--mode hashing] [...]
+#   == python -m mlmodel.train task [--streaming] [...]
 # ======================================================
 
-custom_data_path = "custom_500.csv"
-df = pd.read_csv(custom_data_path)
-
-# Shuffle dataset for randomness
-df = shuffle(df, random_state=42)
-
-print("Dataset Loaded:")
-print(df.head())
-print("\nTotal Samples:", len(df))
+import sys
 
-# ======================================================
-# 2. Preprocess + Vectorize (Convert text → numbers)
-# ======================================================
-
-vectorizer = TfidfVectorizer()
-X = vectorizer.fit_transform(df["sentence"])   # input features
-y = df["label"]                                 # target labels (1/0)
-
-# ======================================================
-# 3. Train / Test Split
-# ======================================================
+from mlmodel.train import main
 
-X_train, X_test, y_train, y_test = train_test_split(
-    X, y, test_size=0.20, random_state=42
-)
-
-# ======================================================
-# 4. Train Model (Logistic Regression)
-# ======================================================
-
-model = LogisticRegression(max_iter=2000)
-model.fit(X_train, y_train)
-
-print("\nTraining Complete.")
-print("Train Accuracy:", model.score(X_train, y_train))
-print("Test Accuracy:", model.score(X_test, y_test))
-
-# ======================================================
-# 5. Save Model + Vectorizer
-# ======================================================
 
+def _translate(argv):
+    """Map the old --mode flag onto mlmodel.train options."""
+    args = []
+    it = iter(argv)
+    for arg in it:
+        if arg == "--mode":
+            mode = next(it, "tfidf")
+        elif arg.startswith("--mode="):
+            mode = arg.split("=", 1)[1]
+        else:
+            args.append(arg)
+            continue
+        if mode == "hashing":
+            args.append("--streaming")
+    return ["task"] + args
 
-joblib.dump(model, "task_classifier.pkl")
-joblib.dump(vectorizer, "task_vectorizer.pkl")
 
-print("\n✔ Saved: task_classifier.pkl & task_vectorizer.pkl")
+if __name__ == "__main__":
+    sys.exit(main(_translate(sys.argv[1:])))
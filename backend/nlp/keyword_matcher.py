@@ -0,0 +1,84 @@
+"""Single-pass multi-keyword matching for the rule tables."""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Collection, Dict, Iterable, List, Mapping, Optional, Tuple
+import re
+
+
+@dataclass(frozen=True)
+class KeywordMatch:
+    """One keyword hit inside a scanned text."""
+
+    category: str
+    keyword: str
+    value: str
+    start: int
+    end: int
+    rank: int  # position of the keyword in its table; lower wins
+
+
+class KeywordMatcher:
+    """Find every keyword from several lookup tables in one regex scan.
+
+    All keywords are compiled into a single case-insensitive alternation,
+    longest first, so "tomorrow evening" is matched before "tomorrow" at the
+    same offset. Keywords match on word boundaries; categories listed in
+    ``prefix_categories`` only require a leading boundary so inflections
+    ("fixed", "updates") still count.
+
+    Precedence between hits of the same category follows table order, which
+    mirrors the old ``for pattern in TABLE: if pattern in text`` loops.
+    """
+
+    def __init__(
+        self,
+        tables: Mapping[str, Mapping[str, str]],
+        prefix_categories: Collection[str] = (),
+    ) -> None:
+        self._entries: Dict[str, List[Tuple[str, str, int]]] = {}
+        prefix_only = set()
+        full_word = set()
+
+        for category, table in tables.items():
+            for rank, (keyword, value) in enumerate(table.items()):
+                key = keyword.lower()
+                self._entries.setdefault(key, []).append((category, value, rank))
+                (prefix_only if category in prefix_categories else full_word).add(key)
+
+        alternatives = []
+        for key in sorted(self._entries, key=len, reverse=True):
+            pattern = r"\b" + re.escape(key)
+            if key in full_word:
+                pattern += r"\b"
+            alternatives.append(pattern)
+
+        self._regex = re.compile("|".join(alternatives), re.IGNORECASE) if alternatives else None
+
+    def scan(self, text: str) -> List[KeywordMatch]:
+        """Return every keyword hit in ``text`` with its offsets."""
+        if not text or self._regex is None:
+            return []
+
+        matches = []
+        for m in self._regex.finditer(text):
+            key = m.group(0).lower()
+            for category, value, rank in self._entries[key]:
+                matches.append(KeywordMatch(category, key, value, m.start(), m.end(), rank))
+        return matches
+
+    @staticmethod
+    def best(matches: Iterable[KeywordMatch], category: str) -> Optional[str]:
+        """Highest-precedence value for ``category`` among ``matches``."""
+        hits = [m for m in matches if m.category == category]
+        if not hits:
+            return None
+        return min(hits, key=lambda m: m.rank).value
+
+    def first(self, text: str, category: str) -> Optional[str]:
+        """Convenience: scan ``text`` and return the best value for ``category``."""
+        return self.best(self.scan(text), category)
+
+    @staticmethod
+    def has(matches: Iterable[KeywordMatch], category: str) -> bool:
+        return any(m.category == category for m in matches)
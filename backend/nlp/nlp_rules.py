@@ -14,7 +14,10 @@
 # perfect for a meeting-task extraction pipeline.
 # ================================================================
 
-import re 
+
+from nlp.keyword_matcher import KeywordMatcher
+from nlp.sentence_splitter import SentenceSplitter
+from services.roster_service import get_roster
 # ---------------------------------------------------------------
 # Task Verbs – indicators that a sentence contains work/action
 # ---------------------------------------------------------------
@@ -26,17 +29,10 @@ Task_VERBS = [
 
 # ---------------------------------------------------------------
 # Team members (names mentioned in meeting)
+#   Loaded from services/roster_service.py (model/team_member.json
+#   or an SQLite org directory), indexed by full name, alias, first
+#   and last name.
 # ---------------------------------------------------------------
-# TODO (Future Improvement):
-#   - Load team members dynamically from backend/models/team_members.json
-#   - Replace static TEAM_MEMBERS list with JSON-based list
-#   - Automatically detect names from transcript using NLP name-entity detection
-#
-# For now, using a simple static list so the system works end-to-end.
-
-
-TEAM_MEMBERS = ["Sakshi", "Mohit", "Arjun", "Lata"]
-
 
 
 # ---------------------------------------------------------------
@@ -65,24 +61,24 @@ PRIORITY_MAP = {
     "low priority": "Low"
 }
 
-# ================================================================
-# Helper: Split transcript into individual sentences
-# ================================================================
-def split_into_sentences(text: str):
-    """
-    Splits the transcript into clean sentences.
-    Handles '.', '?', '!', and newline breaks.
-    """
-    if not text or not isinstance(text, str):
-        return []
-
-    # Split on punctuation that ends a sentence
-    sentences = re.split(r'(?<=[.!?])\s+', text.strip())
-
-    # Remove empty sentences and trim whitespace
-    sentences = [s.strip() for s in sentences if s.strip()]
+# ---------------------------------------------------------------
+# Compiled matcher over all rule tables
+#   Built once; each sentence is scanned a single time for verbs,
+#   deadlines and priorities. Table order keeps precedence
+#   ("tomorrow evening" wins over "tomorrow").
+# ---------------------------------------------------------------
+RULE_MATCHER = KeywordMatcher(
+    {
+        "verb": {verb: verb for verb in Task_VERBS},
+        "deadline": DEADLINE_PATTERNS,
+        "priority": PRIORITY_MAP,
+    },
+    prefix_categories={"verb", "priority"},
+)
+
+# Punctuation / newline split, no spaCy, short sentences kept
+SPLITTER = SentenceSplitter(enforce_min_length=False, strategy="regex")
 
-    return sentences
 # ================================================================
 # MAIN FUNCTION → Extract all tasks from transcript
 # ================================================================
@@ -103,17 +99,17 @@ def extract_tasks(transcript: str) -> list:
     if not transcript:
         return []
 
-    sentences = split_into_sentences(transcript)
+    sentences = SPLITTER.split(transcript)
     extracted = []
 
     for sentence in sentences:
-        lower_sentence = sentence.lower().strip()
-
+        # One scan finds every verb / deadline / priority keyword
+        matches = RULE_MATCHER.scan(sentence)
 
         # -----------------------------------------------------------
         # Step 1: Check if the sentence contains a task verb
         # -----------------------------------------------------------
-        if not any(verb in lower_sentence for verb in Task_VERBS):
+        if not RULE_MATCHER.has(matches, "verb"):
             continue
 
         # -----------------------------------------------------------
@@ -122,8 +118,8 @@ def extract_tasks(transcript: str) -> list:
         task_obj = {
            "task" : sentence.strip(),
            "assigned_to":extract_assignee(sentence),
-           "deadline": extract_deadline(lower_sentence),
-           "priority": extract_priority(lower_sentence)
+           "deadline": RULE_MATCHER.best(matches, "deadline"),
+           "priority": RULE_MATCHER.best(matches, "priority")
         }
 
         extracted.append(task_obj)
@@ -137,10 +133,8 @@ def extract_tasks(transcript: str) -> list:
 # ================================================================
 
 def extract_assignee(sentence: str):
-    for member in TEAM_MEMBERS:
-        if member.lower() in sentence.lower():
-            return member
-    return None
+    member = get_roster().find_member(sentence)
+    return member["name"] if member else None
 
 
 
@@ -149,10 +143,7 @@ def extract_assignee(sentence: str):
 # ================================================================
 
 def extract_deadline(sentence: str):
-    for pattern, value in DEADLINE_PATTERNS.items():
-        if pattern in sentence:
-            return value
-    return None
+    return RULE_MATCHER.first(sentence, "deadline")
 
 
 
@@ -160,9 +151,6 @@ def extract_deadline(sentence: str):
 # Helper: Extract priority level
 # ================================================================
 def extract_priority(text: str):
-    for key, value in PRIORITY_MAP.items():
-        if key in text:
-            return value
-    return None
+    return RULE_MATCHER.first(text, "priority")
 
 
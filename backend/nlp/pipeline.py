@@ -7,13 +7,24 @@
 # ✔ Returns complete structured task list
 # ================================================================
 
-import re
-from mlmodel.task_predictor import is_task
-from mlmodel.name_ranker import name_score
+import os
+
+from mlmodel.task_predictor import is_task_batch
+from mlmodel.name_ranker import name_scores, name_scores_many
 from nlp.nlp_rules import (
     extract_deadline,
-    extract_priority,
-    split_into_sentences
+    extract_priority
+)
+from nlp.sentence_splitter import SentenceSplitter
+from nlp.spacy_utils import pipe as spacy_pipe
+from core.metrics import Counter, stage_timer
+
+TASKS_EXTRACTED = Counter("tasks_extracted_total", "Task objects produced by the NLP pipeline.")
+
+# Regex split for punctuated transcripts, spaCy senter for run-on STT output
+SPLITTER = SentenceSplitter(
+    enforce_min_length=False,
+    strategy=os.getenv("SENTENCE_SPLIT_STRATEGY", "auto"),
 )
 
 TASK_VERBS = [
@@ -26,11 +37,14 @@ TASK_VERBS = [
 # Step 1: Detect best name in a sentence
 # ---------------------------------------------------------------
 def extract_best_name(sentence: str):
-    words = re.findall(r"[A-Za-z]+", sentence)
-    if not words:
+    # One spaCy parse and one vectorizer call for the whole fragment
+    return _best_name(name_scores(sentence))
+
+
+def _best_name(scored):
+    if not scored:
         return None
 
-    scored = [(w, name_score(w)) for w in words]
     best_word, best_score = max(scored, key=lambda x: x[1])
 
     if best_score >= 0.4:
@@ -77,38 +91,110 @@ def split_multi_tasks(sentence: str):
 
 
 # ---------------------------------------------------------------
-# Step 2: Main Transcript → Tasks Pipeline
+# Step 2: Build task objects for one classified sentence
 # ---------------------------------------------------------------
-def process_transcript(transcript: str):
-    if not transcript:
-        return []
+def _build_task(fragment: str, assignee):
+    # C. Deadline detection
+    deadline = extract_deadline(fragment.lower())
+
+    # D. Priority detection
+    priority = extract_priority(fragment.lower())
 
-    sentences = split_into_sentences(transcript)
-    tasks = []
+    # E. Final task object
+    return {
+        "task": fragment.strip(),
+        "assigned_to": assignee,
+        "deadline": deadline,
+        "priority": priority
+    }
 
-    for sentence in sentences:
-        # A. ML task classifier
-        if not is_task(sentence):
-            continue
 
-        fragments = split_multi_tasks(sentence)
+def _sentence_tasks(sentence: str):
+    fragments = split_multi_tasks(sentence)
 
-        for fragment in fragments:
-            # B. Name detection
+    for fragment in fragments:
+        # B. Name detection
+        with stage_timer("name_scoring"):
             assignee = extract_best_name(fragment)
+        TASKS_EXTRACTED.inc()
+        yield _build_task(fragment, assignee)
 
-            # C. Deadline detection
-            deadline = extract_deadline(fragment.lower())
 
-            # D. Priority detection
-            priority = extract_priority(fragment.lower())
+# ---------------------------------------------------------------
+# Step 3: Main Transcript → Tasks Pipeline
+# ---------------------------------------------------------------
+def iter_tasks(transcript: str, batch_size: int = 32):
+    """
+    Yield task objects sentence by sentence.
 
-            # E. Final task object
-            tasks.append({
-                "task": fragment.strip(),
-                "assigned_to": assignee,
-                "deadline": deadline,
-                "priority": priority
-            })
+    Sentences are classified ``batch_size`` at a time (one vectorized
+    call per batch), so the first tasks come out after the first batch
+    instead of after the whole transcript. ``batch_size=0`` classifies
+    everything in a single pass.
+    """
+    if not transcript:
+        return
 
-    return tasks
+    with stage_timer("sentence_split"):
+        sentences = SPLITTER.split(transcript)
+    step = batch_size if batch_size and batch_size > 0 else max(len(sentences), 1)
+
+    for start in range(0, len(sentences), step):
+        batch = sentences[start:start + step]
+
+        # A. ML task classifier — one vectorized pass per batch
+        with stage_timer("classification"):
+            flags = is_task_batch(batch)
+
+        for sentence, flag in zip(batch, flags):
+            if flag:
+                yield from _sentence_tasks(sentence)
+
+
+def process_transcript(transcript: str):
+    # Whole transcript classified in one pass
+    return list(iter_tasks(transcript, batch_size=0))
+
+
+# ---------------------------------------------------------------
+# Step 4: Bulk processing (backfills / archives)
+# ---------------------------------------------------------------
+def process_transcripts(transcripts, batch_size: int = 256, n_process: int = 1):
+    """
+    Process many transcripts at once; returns one task list per transcript.
+
+    * every sentence of every transcript is classified in ONE vectorized call
+    * task fragments are parsed with ``nlp.pipe`` (``batch_size`` /
+      ``n_process``) and name-scored with one classifier call per batch
+    """
+    with stage_timer("sentence_split"):
+        sentence_lists = SPLITTER.split_each(transcripts)
+    all_sentences = [s for sentences in sentence_lists for s in sentences]
+
+    # A. ML task classifier — single pass over the whole archive
+    with stage_timer("classification"):
+        flags = iter(is_task_batch(all_sentences))
+
+    owners, fragments = [], []
+    for index, sentences in enumerate(sentence_lists):
+        for sentence in sentences:
+            if next(flags):
+                for fragment in split_multi_tasks(sentence):
+                    owners.append(index)
+                    fragments.append(fragment)
+
+    results = [[] for _ in transcripts]
+
+    # B. Name detection — batched spaCy + batched classifier
+    docs = spacy_pipe(fragments, profile="names", batch_size=batch_size, n_process=n_process)
+    for start in range(0, len(fragments), batch_size):
+        with stage_timer("name_scoring"):
+            chunk = [next(docs) for _ in range(min(batch_size, len(fragments) - start))]
+            scored_chunk = name_scores_many(chunk)
+        for offset, scored in enumerate(scored_chunk):
+            i = start + offset
+            results[owners[i]].append(_build_task(fragments[i], _best_name(scored)))
+
+    TASKS_EXTRACTED.inc(len(fragments))
+
+    return results
@@ -5,27 +5,91 @@ from dataclasses import dataclass
 from typing import Iterable, List
 import re
 
-from .spacy_utils import get_nlp
+from .spacy_utils import parse, pipe
 
 _SENTENCE_MIN_CHARS = 8
 _SPLIT_REGEX = re.compile(r"(?<=[.!?])\s+|\n")
+_TERMINATOR_REGEX = re.compile(r"[.!?](?:\s|$)")
+
+# A transcript averaging more words than this between terminators is treated
+# as unpunctuated STT output and handed to spaCy.
+_MAX_WORDS_PER_SENTENCE = 30
+
+STRATEGIES = ("auto", "spacy", "regex")
+
+
+def looks_punctuated(transcript: str, max_words_per_sentence: int = _MAX_WORDS_PER_SENTENCE) -> bool:
+    """Heuristic: does ``transcript`` carry enough sentence punctuation for the regex path?"""
+    words = len(transcript.split())
+    if words == 0:
+        return True
+    terminators = len(_TERMINATOR_REGEX.findall(transcript)) + transcript.count("\n")
+    if terminators == 0:
+        return words <= max_words_per_sentence
+    return words / terminators <= max_words_per_sentence
 
 
 @dataclass
 class SentenceSplitter:
-    """Split transcripts into clean, non-empty sentences using spaCy first."""
+    """Split transcripts into clean, non-empty sentences.
+
+    ``strategy`` picks how boundaries are found:
+
+    * ``"spacy"`` – always run the shared spaCy pipeline (senter profile).
+    * ``"regex"`` – punctuation/newline split only; fastest, for well
+      punctuated STT output.
+    * ``"auto"`` – regex when :func:`looks_punctuated`, spaCy otherwise.
+      An unpunctuated run-on of 30 words or fewer counts as punctuated,
+      so it comes back as one sentence.
+
+    ``enforce_min_length`` drops sentences shorter than 8 characters; the
+    task pipeline turns it off so short imperatives ("Fix UI.") survive.
+    """
 
     enforce_min_length: bool = True
+    strategy: str = "auto"
+    batch_size: int = 64
 
     def __post_init__(self) -> None:
-        self._nlp = get_nlp()
+        if self.strategy not in STRATEGIES:
+            raise ValueError(f"Unknown strategy '{self.strategy}' (choose from {STRATEGIES})")
+
+    def _needs_spacy(self, transcript: str) -> bool:
+        if self.strategy == "auto":
+            return not looks_punctuated(transcript)
+        return self.strategy == "spacy"
 
     def split(self, transcript: str) -> List[str]:
         if not transcript:
             return []
 
-        doc = self._nlp(transcript)
-        sentences = [sent.text.strip() for sent in doc.sents if sent.text.strip()]
+        if self._needs_spacy(transcript):
+            # Shared pipeline, senter only (no tagger / parser / NER)
+            return self._finish(transcript, parse(transcript, profile="sentences"))
+        return self._finish(transcript, None)
+
+    def split_many(self, transcripts: Iterable[str]) -> List[str]:
+        return [s for sentences in self.split_each(transcripts) for s in sentences]
+
+    def split_each(self, transcripts: Iterable[str]) -> List[List[str]]:
+        """One sentence list per transcript; spaCy parses are batched."""
+        blocks = list(transcripts)
+        spacy_indexes = [i for i, block in enumerate(blocks) if block and self._needs_spacy(block)]
+        docs = {}
+        if spacy_indexes:
+            parsed = pipe(
+                (blocks[i] for i in spacy_indexes),
+                profile="sentences",
+                batch_size=self.batch_size,
+            )
+            docs = dict(zip(spacy_indexes, parsed))
+
+        return [self._finish(block, docs.get(i)) if block else [] for i, block in enumerate(blocks)]
+
+    def _finish(self, transcript: str, doc) -> List[str]:
+        sentences: List[str] = []
+        if doc is not None:
+            sentences = [sent.text.strip() for sent in doc.sents if sent.text.strip()]
 
         if not sentences:
             sentences = [part.strip() for part in _SPLIT_REGEX.split(transcript) if part.strip()]
@@ -34,9 +98,3 @@ class SentenceSplitter:
             sentences = [s for s in sentences if len(s) >= _SENTENCE_MIN_CHARS]
 
         return sentences
-
-    def split_many(self, transcripts: Iterable[str]) -> List[str]:
-        sentences: List[str] = []
-        for block in transcripts:
-            sentences.extend(self.split(block))
-        return sentences
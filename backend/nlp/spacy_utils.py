@@ -1,25 +1,106 @@
-"""Shared spaCy utilities for the meeting task extraction pipeline."""
-from functools import lru_cache
-from typing import Optional
+"""Shared spaCy utilities for the meeting task extraction pipeline.
 
-import spacy
-from spacy.language import Language
+Every consumer goes through ONE pipeline instance per process. Callers pick a
+*profile* naming the components they actually need; everything else is
+skipped for that call, so sentence splitting does not pay for NER and name
+scoring does not pay for the dependency parser.
+"""
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, List, Optional, Tuple
 
+from core.lazy import LazyArtifact
+
+if TYPE_CHECKING:  # spaCy is imported lazily; only needed for annotations here
+    from spacy.language import Language
+    from spacy.tokens import Doc
+
+MODEL_NAME = "en_core_web_sm"
+
+# Components each profile needs. A shared ``tok2vec`` is added automatically
+# when a kept component listens to it.
+PROFILES: Dict[str, Tuple[str, ...]] = {
+    "full": ("tagger", "parser", "attribute_ruler", "lemmatizer", "ner"),
+    "sentences": ("senter",),
+    "names": ("tagger", "attribute_ruler", "ner"),
+}
+
+
+def _load_nlp() -> "Language":
+    import spacy
 
-@lru_cache(maxsize=1)
-def get_nlp() -> Language:
-    """Load the spaCy English model once and reuse it across modules."""
     try:
-        return spacy.load("en_core_web_sm")
+        nlp = spacy.load(MODEL_NAME)
     except OSError as exc:  # pragma: no cover - provides actionable error for developers
         raise RuntimeError(
-            "spaCy model 'en_core_web_sm' is not installed. "
-            "Run `python -m spacy download en_core_web_sm` before starting the API."
+            f"spaCy model '{MODEL_NAME}' is not installed. "
+            f"Run `python -m spacy download {MODEL_NAME}` before starting the API."
         ) from exc
 
+    # senter ships disabled; enable it so the "sentences" profile can use it
+    # instead of the much heavier parser. Profiles decide what actually runs.
+    if "senter" in nlp.disabled:
+        nlp.enable_pipe("senter")
+    return nlp
+
+
+_NLP = LazyArtifact(f"spacy:{MODEL_NAME}", _load_nlp)
+_DISABLED: Dict[str, List[str]] = {}
+
+
+def get_nlp() -> "Language":
+    """The shared spaCy pipeline (loaded once, timed).
+
+    Prefer :func:`parse` / :func:`pipe` with a profile over calling it
+    directly, which runs every enabled component.
+    """
+    return _NLP.get()
+
+
+def disabled_for(profile: str) -> List[str]:
+    """Component names to skip for ``profile`` on the shared pipeline."""
+    if profile not in PROFILES:
+        raise ValueError(f"Unknown spaCy profile '{profile}' (choose from {sorted(PROFILES)})")
+
+    cached = _DISABLED.get(profile)
+    if cached is not None:
+        return cached
+
+    nlp = get_nlp()
+    keep = set(PROFILES[profile])
+    if profile == "sentences" and "senter" not in nlp.pipe_names:
+        keep = {"parser"}  # model without senter: fall back to the parser
+
+    if "tok2vec" in nlp.pipe_names:
+        listeners = set(getattr(nlp.get_pipe("tok2vec"), "listening_components", []))
+        if keep & listeners:
+            keep.add("tok2vec")
+
+    disabled = [name for name in nlp.pipe_names if name not in keep]
+    _DISABLED[profile] = disabled
+    return disabled
+
+
+def parse(text: str, profile: str = "full") -> "Doc":
+    """Run the shared pipeline over ``text`` with only ``profile``'s components."""
+    return get_nlp()(text, disable=disabled_for(profile))
+
+
+def pipe(
+    texts: Iterable[str],
+    profile: str = "full",
+    batch_size: int = 256,
+    n_process: int = 1,
+) -> Iterator["Doc"]:
+    """Batched :func:`parse` via ``nlp.pipe``."""
+    return get_nlp().pipe(
+        texts,
+        batch_size=batch_size,
+        n_process=n_process,
+        disable=disabled_for(profile),
+    )
+
 
-def ensure_doc(text: str) -> Optional[Language]:
-    """Helper kept for backwards compatibility; preferred direct get_nlp usage."""
+def ensure_doc(text: str, profile: str = "full") -> Optional["Doc"]:
+    """Helper kept for backwards compatibility; preferred direct parse usage."""
     if not text or not text.strip():
         return None
-    return get_nlp()(text)
+    return parse(text, profile)
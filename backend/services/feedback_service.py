@@ -0,0 +1,310 @@
+"""User corrections → incremental model updates.
+
+Corrections are appended to a JSONL log (``FEEDBACK_LOG``). The log is the
+source of truth: every process that serves models (the API and each
+pipeline pool worker) keeps a :class:`FeedbackLog` that applies log lines
+it has not applied yet, in micro-batches of up to ``FEEDBACK_BATCH_SIZE``,
+by taking a few gradient steps on a copy of the served model and swapping
+the copy in. Readers keep whichever model they already fetched, so nothing
+blocks.
+
+* The API process applies new corrections on a background thread
+  (:class:`FeedbackWorker`), at most ``FEEDBACK_FLUSH_S`` after they
+  arrive. Pool workers catch up before each transcript they process, so
+  every process converges on the same models.
+* Reloading a model (``POST /models/reload``, the registry watcher)
+  replays the whole log onto the freshly loaded model, and so does a
+  restart, so updates are not lost. Once the corrections have been folded
+  into the training data and a retrained version is live, rotate the log
+  (move it away) to stop replaying them.
+
+Correction kinds:
+
+* ``task``     – ``text`` is a sentence, ``label`` whether it is a task.
+* ``name``     – ``text`` is a word, ``label`` whether it is a person name.
+* ``assignee`` – the assignee was wrong: ``assignee`` is the right person
+  (positive name examples), ``previous`` the wrong pick (negative).
+"""
+from __future__ import annotations
+
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from threading import Event, Lock, Thread
+from typing import Dict, Iterable, Iterator, List, Optional
+import json
+import logging
+import os
+import time
+
+from core.metrics import Counter, stage_timer
+from mlmodel import hot_reload, name_predictor, task_predictor
+from mlmodel.online_update import class_index, sgd_update
+
+logger = logging.getLogger(__name__)
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+FEEDBACK_LOG = os.getenv("FEEDBACK_LOG", os.path.join(BASE_DIR, "..", "mlmodel", "feedback.jsonl"))
+FEEDBACK_BATCH_SIZE = int(os.getenv("FEEDBACK_BATCH_SIZE", "32"))
+FEEDBACK_FLUSH_S = float(os.getenv("FEEDBACK_FLUSH_S", "2"))
+FEEDBACK_QUEUE_DEPTH = int(os.getenv("FEEDBACK_QUEUE_DEPTH", "10000"))
+FEEDBACK_LEARNING_RATE = float(os.getenv("FEEDBACK_LEARNING_RATE", "0.5"))
+FEEDBACK_EPOCHS = int(os.getenv("FEEDBACK_EPOCHS", "5"))
+FEEDBACK_SWAP_RETRIES = int(os.getenv("FEEDBACK_SWAP_RETRIES", "3"))
+
+KINDS = ("task", "name")
+
+CORRECTIONS = Counter("feedback_corrections_total", "Corrections accepted, by model.")
+UPDATES = Counter("feedback_updates_total", "Micro-batch model updates, by model and outcome.")
+
+
+class FeedbackQueueFullError(RuntimeError):
+    """Raised when corrections arrive faster than they are applied."""
+
+
+class FeedbackSwapError(RuntimeError):
+    """Raised when the served model kept changing under an update."""
+
+
+@dataclass(frozen=True)
+class Correction:
+    """One labeled example for the ``task`` or ``name`` model."""
+
+    kind: str
+    text: str
+    label: bool
+    created_at: float = 0.0
+
+
+def corrections_for(kind: str, text: str = "", label: Optional[bool] = None,
+                    assignee: str = "", previous: str = "") -> List[Correction]:
+    """Turn one API feedback item into model corrections."""
+    now = time.time()
+    if kind == "assignee":
+        items = [Correction("name", w, True, now) for w in assignee.split()]
+        items += [Correction("name", w, False, now) for w in previous.split()
+                  if w.lower() not in {a.lower() for a in assignee.split()}]
+        if not items:
+            raise ValueError("assignee feedback needs 'assignee' and/or 'previous'")
+        return items
+
+    if kind not in KINDS:
+        raise ValueError(f"Unknown feedback kind '{kind}' (expected task, name or assignee)")
+    if label is None or not text.strip():
+        raise ValueError(f"{kind} feedback needs 'text' and 'label'")
+    return [Correction(kind, text, bool(label), now)]
+
+
+# ---------------------------------------------------------------
+# Model adapters
+# ---------------------------------------------------------------
+_PREDICTORS = {"task": task_predictor, "name": name_predictor}
+
+
+def apply_batch(kind: str, corrections: List[Correction],
+                learning_rate: float = FEEDBACK_LEARNING_RATE,
+                epochs: int = FEEDBACK_EPOCHS) -> int:
+    """Update the served ``kind`` model with ``corrections``; returns how
+    many rows were used (words that clean to nothing are skipped)."""
+    predictor = _PREDICTORS[kind]
+    pairs = [(predictor.preprocess(c.text), c.label) for c in corrections]
+    pairs = [(text, label) for text, label in pairs if text]
+    if not pairs:
+        return 0
+
+    for _ in range(max(1, FEEDBACK_SWAP_RETRIES)):
+        bundle = predictor.get_bundle()
+        X = bundle.vectorizer.transform([text for text, _ in pairs])
+        y = [class_index(bundle.model, label) for _, label in pairs]
+        updated = sgd_update(bundle.model, X, y, learning_rate=learning_rate, epochs=epochs)
+        if predictor.swap_model(updated, expected=bundle):
+            return len(pairs)
+        # The model was swapped meanwhile; redo the update on the new one
+    raise FeedbackSwapError(f"{kind} model changed {FEEDBACK_SWAP_RETRIES} times during an update")
+
+
+# ---------------------------------------------------------------
+# Correction log
+# ---------------------------------------------------------------
+class FeedbackLog:
+    """The correction log plus how far this process has applied it."""
+
+    def __init__(self, path: str = FEEDBACK_LOG, batch_size: int = FEEDBACK_BATCH_SIZE) -> None:
+        self.path = path
+        self.batch_size = max(1, batch_size)
+        self._lock = Lock()            # one catch-up / replay at a time
+        self._append_lock = Lock()
+        self._offsets: Dict[str, int] = {kind: 0 for kind in KINDS}
+        self._file_id = None           # (device, inode) the offsets refer to
+        self.applied: Dict[str, int] = {kind: 0 for kind in KINDS}
+        self.failed: Dict[str, int] = {kind: 0 for kind in KINDS}
+        self.last_update_at: Optional[float] = None
+
+    def append(self, corrections: List[Correction]) -> None:
+        lines = "".join(json.dumps(asdict(c)) + "\n" for c in corrections)
+        with self._append_lock:
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(lines)
+
+    def catch_up(self) -> int:
+        """Apply corrections logged since the last call; returns how many."""
+        with self._lock:
+            return self._catch_up()
+
+    @contextmanager
+    def around_reload(self, kind: str) -> Iterator[None]:
+        """Reload hook: no catch-up runs while ``kind`` reloads, then the
+        whole log is replayed onto the freshly loaded model."""
+        with self._lock:
+            yield
+            if kind in self._offsets:
+                self._offsets[kind] = 0
+                self._catch_up()
+
+    def _lines(self) -> Iterator[tuple]:
+        """(offset after the line, correction or None) for each complete
+        line past the lowest offset; resets the offsets if the log was
+        rotated."""
+        try:
+            f = open(self.path, "rb")
+        except OSError:
+            return
+        with f:
+            stat = os.fstat(f.fileno())
+            if (stat.st_dev, stat.st_ino) != self._file_id:
+                self._file_id = (stat.st_dev, stat.st_ino)
+                self._offsets = dict.fromkeys(self._offsets, 0)
+            position = min(self._offsets.values())
+            if stat.st_size <= position:
+                return
+            f.seek(position)
+            for raw in f:
+                if not raw.endswith(b"\n"):
+                    break  # still being written
+                position += len(raw)
+                try:
+                    yield position, Correction(**json.loads(raw))
+                except (ValueError, TypeError):
+                    logger.warning("skipping malformed feedback line", extra={"log": self.path})
+                    yield position, None
+
+    def _catch_up(self) -> int:
+        pending: Dict[str, List[Correction]] = {kind: [] for kind in KINDS}
+        applied = 0
+        end = None
+        for end, correction in self._lines():
+            if correction is None or correction.kind not in pending:
+                continue
+            if end <= self._offsets[correction.kind]:
+                continue  # this model already has it
+            batch = pending[correction.kind]
+            batch.append(correction)
+            if len(batch) >= self.batch_size:
+                applied += self._apply(correction.kind, batch)
+                pending[correction.kind] = []
+        for kind, batch in pending.items():
+            if batch:
+                applied += self._apply(kind, batch)
+        if end is not None:
+            for kind in self._offsets:
+                self._offsets[kind] = max(self._offsets[kind], end)
+        return applied
+
+    def _apply(self, kind: str, batch: List[Correction]) -> int:
+        try:
+            with stage_timer(f"feedback_{kind}"):
+                used = apply_batch(kind, batch)
+        except Exception:
+            logger.exception("feedback update failed", extra={"model": kind, "corrections": len(batch)})
+            self.failed[kind] += len(batch)
+            UPDATES.inc(model=kind, status="error")
+            return len(batch)
+        self.applied[kind] += used
+        self.last_update_at = time.time()
+        UPDATES.inc(model=kind, status="ok")
+        logger.info("feedback applied", extra={"model": kind, "corrections": used})
+        return len(batch)
+
+
+feedback_log = FeedbackLog()
+hot_reload.add_reload_hook(feedback_log.around_reload)
+
+
+# ---------------------------------------------------------------
+# Background worker
+# ---------------------------------------------------------------
+class FeedbackWorker:
+    """Log corrections and apply them in micro-batches on a daemon thread."""
+
+    def __init__(self, log: Optional[FeedbackLog] = None, batch_size: int = FEEDBACK_BATCH_SIZE,
+                 flush_seconds: float = FEEDBACK_FLUSH_S, queue_depth: int = FEEDBACK_QUEUE_DEPTH) -> None:
+        self.log = log or feedback_log
+        self.batch_size = max(1, batch_size)
+        self.flush_seconds = flush_seconds
+        self.queue_depth = queue_depth
+        self._pending = 0
+        self._pending_lock = Lock()
+        self._wake = Event()
+        self._stop = Event()
+        self._thread: Optional[Thread] = None
+
+    @property
+    def pending(self) -> int:
+        return self._pending
+
+    def start(self) -> None:
+        if self._thread is None or not self._thread.is_alive():
+            self._stop.clear()
+            self._thread = Thread(target=self._run, name="feedback", daemon=True)
+            self._thread.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def submit(self, corrections: Iterable[Correction]) -> int:
+        """Log corrections for the background thread; raises
+        :class:`FeedbackQueueFullError` when too many are still pending."""
+        corrections = list(corrections)
+        with self._pending_lock:
+            if self.queue_depth and self._pending + len(corrections) > self.queue_depth:
+                raise FeedbackQueueFullError("Feedback queue is full, retry later")
+            self.log.append(corrections)
+            self._pending += len(corrections)
+        for correction in corrections:
+            CORRECTIONS.inc(kind=correction.kind)
+        self._wake.set()
+        return len(corrections)
+
+    def flush(self) -> None:
+        """Apply everything logged so far, on the calling thread."""
+        applied = self.log.catch_up()
+        with self._pending_lock:
+            self._pending = max(0, self._pending - applied)
+
+    def stats(self) -> Dict[str, object]:
+        return {
+            "running": bool(self._thread and self._thread.is_alive()),
+            "pending": self.pending,
+            "applied": dict(self.log.applied),
+            "failed": dict(self.log.failed),
+            "last_update_at": self.log.last_update_at,
+            "log": self.log.path,
+        }
+
+    def _run(self) -> None:
+        self.flush()  # replay the log onto the freshly started models
+        while not self._stop.is_set():
+            if not self._wake.wait(0.5):
+                continue
+            self._wake.clear()
+            # micro-batch: wait for a full batch or FEEDBACK_FLUSH_S
+            deadline = time.monotonic() + self.flush_seconds
+            while self.pending < self.batch_size and not self._stop.is_set():
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._stop.wait(min(remaining, 0.05))
+            self.flush()
@@ -0,0 +1,281 @@
+"""Team roster: members loaded from JSON or SQLite, indexed for O(1) lookups.
+
+``TEAM_FILE`` selects the source (default ``backend/model/team_member.json``):
+
+* ``*.json`` – a list of ``{"name", "role", "skills", "aliases"}`` objects.
+* ``*.db`` / ``*.sqlite`` / ``*.sqlite3`` – rows of the ``TEAM_TABLE`` table
+  (default ``members``) with ``name`` plus optional ``role``, ``skills`` and
+  ``aliases`` columns; list columns hold a JSON array or a comma-separated
+  string.
+
+The source is re-read whenever its mtime changes. Each load builds an
+immutable snapshot (members, name index, skill index) that is swapped in as
+a whole, so readers never see a half-built index.
+
+Name matching is conservative, since a wrong assignee is worse than none:
+
+* a name, alias, first or last name shared by several members matches
+  nobody (the full name still does, if it is unique);
+* one-word matches on common words (``Will``, ``Mark``, ``Brown`` ...) need
+  a capitalized word that does not start a sentence, so "we will ship it"
+  is not about Will Smith.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from threading import Lock
+from typing import Dict, Iterable, List, Optional, Tuple
+import json
+import logging
+import os
+import re
+import sqlite3
+
+logger = logging.getLogger(__name__)
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+TEAM_FILE = os.getenv(
+    "TEAM_FILE",
+    os.path.join(BASE_DIR, "..", "model", "team_member.json"),
+)
+TEAM_TABLE = os.getenv("TEAM_TABLE", "members")
+
+SQLITE_SUFFIXES = (".db", ".sqlite", ".sqlite3")
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+_WORD_RE = re.compile(r"[A-Za-z0-9]+")
+# Skills keep + # . so "C++", "C#", "node.js" and ".NET" stay distinct from "c"
+_SKILL_TOKEN_RE = re.compile(r"\.?[a-z0-9][a-z0-9+#.]*")
+
+# Names that are also everyday words; see the module docstring.
+COMMON_WORD_NAMES = frozenset("""
+    will may can mark bill grace hope joy faith rose summer june april august
+    art drew pat sue jack frank chase ray guy rich amber dawn eve ivy lily
+    sunny sandy penny holly jay max rob bob sky
+    brown green white black young king hill wood cook price long bell rice
+    park lane day love best little small fox hunt stone west north south
+    cross page wise case hall wall ward bush
+""".split())
+
+
+def tokens(text: str) -> List[str]:
+    """Lowercase alphanumeric tokens; the normalization used by the name index."""
+    return _TOKEN_RE.findall(text.lower())
+
+
+def skill_tokens(text: str) -> List[str]:
+    """Lowercase skill tokens; a trailing "." (end of sentence) is dropped."""
+    return [t.rstrip(".") for t in _SKILL_TOKEN_RE.findall(text.lower())]
+
+
+def _words(text: str) -> List[Tuple[str, bool]]:
+    """(lowercase token, may be a common-word name) for each word of ``text``:
+    capitalized and not the first word of a sentence."""
+    words = []
+    last = ""  # last non-space character before the current word
+    position = 0
+    for match in _WORD_RE.finditer(text):
+        word = match.group()
+        gap = text[position:match.start()].rstrip()
+        if gap:
+            last = gap[-1]
+        sentence_start = last in ("", ".", "!", "?")
+        words.append((word.lower(), word[0].isupper() and not sentence_start))
+        last, position = word[-1], match.end()
+    return words
+
+
+def _as_list(value) -> List[str]:
+    if value is None:
+        return []
+    if isinstance(value, (list, tuple)):
+        return [str(v) for v in value]
+    text = str(value).strip()
+    if text.startswith("["):
+        return [str(v) for v in json.loads(text)]
+    return [part.strip() for part in text.split(",") if part.strip()]
+
+
+# ---------------------------------------------------------------
+# Loaders
+# ---------------------------------------------------------------
+def load_json(path: str) -> List[dict]:
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def load_sqlite(path: str, table: str = TEAM_TABLE) -> List[dict]:
+    if not re.fullmatch(r"[A-Za-z_][A-Za-z0-9_]*", table):
+        raise ValueError(f"Invalid roster table name '{table}'")
+
+    # read-only: the roster service never writes the org directory
+    conn = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+    try:
+        conn.row_factory = sqlite3.Row
+        rows = conn.execute(f"SELECT * FROM {table}").fetchall()
+    finally:
+        conn.close()
+
+    members = []
+    for row in rows:
+        member = dict(row)
+        member["skills"] = _as_list(member.get("skills"))
+        member["aliases"] = _as_list(member.get("aliases"))
+        members.append(member)
+    return members
+
+
+def load_members(path: str, table: str = TEAM_TABLE) -> List[dict]:
+    if path.lower().endswith(SQLITE_SUFFIXES):
+        return load_sqlite(path, table)
+    return load_json(path)
+
+
+# ---------------------------------------------------------------
+# Index
+# ---------------------------------------------------------------
+def _phrase_index(phrases: Iterable[Tuple[str, int]],
+                  tokenize=tokens) -> Tuple[Dict[str, Tuple[int, ...]], int]:
+    """Map normalized phrase → member positions (roster order, no repeats)."""
+    index: Dict[str, List[int]] = {}
+    longest = 0
+    for text, position in phrases:
+        words = tokenize(text)
+        if not words:
+            continue
+        holders = index.setdefault(" ".join(words), [])
+        if not holders or holders[-1] != position:
+            holders.append(position)
+        longest = max(longest, len(words))
+    return {phrase: tuple(holders) for phrase, holders in index.items()}, longest
+
+
+def _ngrams(words: List[str], longest: int):
+    """Every phrase of up to ``longest`` consecutive words, with its start."""
+    for start in range(len(words)):
+        for size in range(1, min(longest, len(words) - start) + 1):
+            yield start, " ".join(words[start:start + size])
+
+
+@dataclass(frozen=True)
+class RosterSnapshot:
+    """One loaded roster. ``names`` maps full names and aliases to their
+    members, then first and last names that are not already taken by one of
+    those; a key with more than one member is ambiguous."""
+
+    mtime: Optional[int] = None
+    members: List[dict] = field(default_factory=list)
+    names: Dict[str, Tuple[int, ...]] = field(default_factory=dict)
+    max_name_tokens: int = 0
+    skills: Dict[str, Tuple[int, ...]] = field(default_factory=dict)
+    max_skill_tokens: int = 0
+
+    @classmethod
+    def build(cls, members: List[dict], mtime: Optional[int] = None) -> "RosterSnapshot":
+        names, longest = _phrase_index(
+            (key, position)
+            for position, member in enumerate(members)
+            for key in [member.get("name", "")] + list(member.get("aliases", []))
+        )
+        partial, _ = _phrase_index(
+            (word, position)
+            for position, member in enumerate(members)
+            for full in [tokens(member.get("name", ""))] if len(full) > 1
+            for word in (full[0], full[-1])
+        )
+        for key, positions in partial.items():
+            names.setdefault(key, positions)
+
+        skills, max_skill_tokens = _phrase_index(
+            ((skill, position)
+             for position, member in enumerate(members)
+             for skill in member.get("skills", [])),
+            tokenize=skill_tokens,
+        )
+        return cls(mtime, members, names, longest, skills, max_skill_tokens)
+
+    def unique(self, key: str) -> Optional[int]:
+        """Position of the only member known as ``key``, else None."""
+        positions = self.names.get(key, ())
+        return positions[0] if len(positions) == 1 else None
+
+
+class Roster:
+    """Hot-reloading roster backed by a JSON file or SQLite database."""
+
+    def __init__(self, path: str = TEAM_FILE, table: str = TEAM_TABLE) -> None:
+        self.path = path
+        self.table = table
+        self._snapshot = RosterSnapshot()
+        self._lock = Lock()
+
+    def snapshot(self) -> RosterSnapshot:
+        """Current index, reloaded first if the source changed on disk."""
+        try:
+            mtime = os.stat(self.path).st_mtime_ns
+        except OSError:
+            mtime = None
+
+        if mtime != self._snapshot.mtime:
+            with self._lock:
+                if mtime != self._snapshot.mtime:
+                    members = load_members(self.path, self.table) if mtime is not None else []
+                    self._snapshot = RosterSnapshot.build(members, mtime)
+                    logger.info("roster loaded", extra={"path": self.path, "members": len(members)})
+        return self._snapshot
+
+    @property
+    def members(self) -> List[dict]:
+        return self.snapshot().members
+
+    def resolve(self, name: str) -> Optional[dict]:
+        """Member for a name, alias, first or last name (case-insensitive);
+        None when several members share it."""
+        state = self.snapshot()
+        position = state.unique(" ".join(tokens(name)))
+        return None if position is None else state.members[position]
+
+    def find_member(self, text: str) -> Optional[dict]:
+        """Member mentioned in ``text``; the earliest roster entry wins when
+        several are mentioned. O(tokens in text)."""
+        state = self.snapshot()
+        words = _words(text)
+        best = None
+        for start, phrase in _ngrams([word for word, _ in words], state.max_name_tokens):
+            position = state.unique(phrase)
+            if position is None or (best is not None and position >= best):
+                continue
+            if phrase in COMMON_WORD_NAMES and not words[start][1]:
+                continue
+            best = position
+        return None if best is None else state.members[best]
+
+    def best_for_skills(self, text: str) -> Optional[dict]:
+        """Member whose skills appear most often in ``text`` (each distinct
+        skill counts once; ties go to the earlier roster entry).
+        O(tokens in text), independent of roster size."""
+        state = self.snapshot()
+        if not state.skills:
+            return None
+
+        matched = {phrase for _, phrase in _ngrams(skill_tokens(text), state.max_skill_tokens)
+                   if phrase in state.skills}
+
+        scores: Dict[int, int] = {}
+        for phrase in matched:
+            for position in state.skills[phrase]:
+                scores[position] = scores.get(position, 0) + 1
+
+        if not scores:
+            return None
+
+        best = min(scores, key=lambda position: (-scores[position], position))
+        return state.members[best]
+
+
+_ROSTER = Roster()
+
+
+def get_roster() -> Roster:
+    """Roster selected by ``TEAM_FILE``; loaded on first use."""
+    return _ROSTER
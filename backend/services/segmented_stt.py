@@ -0,0 +1,180 @@
+"""Segmented transcription: split long audio into overlapping windows,
+transcribe them concurrently and stitch the text back together.
+
+WAV is split with the standard library. Other formats (MP3, M4A, ...) need
+``pydub`` (in requirements.txt) and an ``ffmpeg`` binary on the PATH; if
+either is missing, segmenting fails up front with a RuntimeError saying so.
+"""
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, replace
+from typing import Callable, List, Optional, Sequence
+import os
+import re
+import shutil
+import tempfile
+import wave
+
+
+@dataclass(frozen=True)
+class AudioSegment:
+    """One time window of the source audio, written to its own file."""
+
+    index: int
+    path: str
+    start: float  # seconds
+    end: float
+    source: str = ""        # the audio file the window was cut from
+    duration: float = 0.0   # length of ``source`` in seconds
+
+
+def plan_windows(duration: float, window: float, overlap: float) -> List[tuple]:
+    """(start, end) windows of ``window`` seconds that overlap by ``overlap``."""
+    if window <= 0:
+        raise ValueError("window must be > 0")
+    if not 0 <= overlap < window:
+        raise ValueError("overlap must be >= 0 and smaller than window")
+
+    if duration <= window:
+        return [(0.0, duration)]
+
+    step = window - overlap
+    windows = []
+    start = 0.0
+    while True:
+        end = min(start + window, duration)
+        windows.append((start, end))
+        if end >= duration:
+            return windows
+        start += step
+
+
+def _split_wav(path: str, windows: Sequence[tuple], out_dir: str) -> List[AudioSegment]:
+    segments = []
+    with wave.open(path, "rb") as src:
+        params = src.getparams()
+        rate = src.getframerate()
+        duration = src.getnframes() / float(rate)
+        for i, (start, end) in enumerate(windows):
+            src.setpos(int(start * rate))
+            frames = src.readframes(int((end - start) * rate))
+            seg_path = os.path.join(out_dir, f"segment_{i:04d}.wav")
+            with wave.open(seg_path, "wb") as dst:
+                dst.setparams(params)
+                dst.writeframes(frames)
+            segments.append(AudioSegment(i, seg_path, start, end, path, duration))
+    return segments
+
+
+def _split_with_pydub(path: str, window: float, overlap: float, out_dir: str) -> List[AudioSegment]:
+    try:
+        from pydub import AudioSegment as PydubSegment
+    except ImportError as exc:
+        raise RuntimeError(
+            "Segmenting non-WAV audio needs pydub (and ffmpeg). "
+            "Install it with `pip install -r requirements.txt`, upload WAV "
+            "files or set STT_SEGMENT_SECONDS=0."
+        ) from exc
+    if shutil.which("ffmpeg") is None and shutil.which("avconv") is None:
+        raise RuntimeError(
+            "Segmenting non-WAV audio needs an ffmpeg binary on the PATH. "
+            "Install ffmpeg, upload WAV files or set STT_SEGMENT_SECONDS=0."
+        )
+
+    audio = PydubSegment.from_file(path)
+    duration = len(audio) / 1000.0
+    ext = os.path.splitext(path)[1].lstrip(".").lower() or "mp3"
+    segments = []
+    for i, (start, end) in enumerate(plan_windows(duration, window, overlap)):
+        seg_path = os.path.join(out_dir, f"segment_{i:04d}.{ext}")
+        audio[int(start * 1000):int(end * 1000)].export(seg_path, format=ext)
+        segments.append(AudioSegment(i, seg_path, start, end, path, duration))
+    return segments
+
+
+def split_audio(path: str, window: float, overlap: float, out_dir: str) -> List[AudioSegment]:
+    """Write overlapping windows of ``path`` into ``out_dir``.
+
+    WAV is handled with the standard library; other formats use pydub.
+    """
+    if path.lower().endswith(".wav"):
+        with wave.open(path, "rb") as src:
+            duration = src.getnframes() / float(src.getframerate())
+        return _split_wav(path, plan_windows(duration, window, overlap), out_dir)
+    return _split_with_pydub(path, window, overlap, out_dir)
+
+
+# ---------------------------------------------------------------
+# Stitching
+# ---------------------------------------------------------------
+_WORD_RE = re.compile(r"[a-z0-9']+")
+
+
+def _norm(word: str) -> str:
+    match = _WORD_RE.findall(word.lower())
+    return "".join(match)
+
+
+def merge_overlap(left: str, right: str, max_words: int = 40, min_words: int = 2) -> str:
+    """Join two transcripts whose audio windows overlapped.
+
+    The longest run of words (``min_words``..``max_words``) that ends
+    ``left`` and also starts ``right`` is treated as the overlap and kept
+    once. Comparison ignores case and punctuation.
+    """
+    left_words = left.split()
+    right_words = right.split()
+    if not left_words:
+        return right.strip()
+    if not right_words:
+        return left.strip()
+
+    left_norm = [_norm(w) for w in left_words[-max_words:]]
+    right_norm = [_norm(w) for w in right_words[:max_words]]
+
+    for size in range(min(len(left_norm), len(right_norm)), min_words - 1, -1):
+        if left_norm[-size:] == right_norm[:size]:
+            return " ".join(left_words + right_words[size:])
+
+    return " ".join(left_words + right_words)
+
+
+def stitch(texts: Sequence[str], max_words: int = 40) -> str:
+    """Merge per-window transcripts (in window order) into one transcript."""
+    merged = ""
+    for text in texts:
+        merged = merge_overlap(merged, text or "", max_words=max_words)
+    return merged.strip()
+
+
+# ---------------------------------------------------------------
+# Segmented transcription
+# ---------------------------------------------------------------
+def transcribe_segmented(
+    audio_path: str,
+    transcribe: Callable[[AudioSegment], str],
+    window: float = 120.0,
+    overlap: float = 5.0,
+    max_workers: int = 4,
+    work_dir: Optional[str] = None,
+) -> str:
+    """Transcribe ``audio_path`` window by window with bounded parallelism.
+
+    ``transcribe`` turns one :class:`AudioSegment` into text (usually by
+    sending ``segment.path`` to the STT backend). A single window is passed
+    with ``path`` set to ``audio_path`` itself.
+    """
+    tmp_dir = tempfile.mkdtemp(prefix="stt_segments_", dir=work_dir)
+    try:
+        segments = split_audio(audio_path, window, overlap, tmp_dir)
+        if len(segments) == 1:
+            return transcribe(replace(segments[0], path=audio_path))
+
+        with ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix="stt") as pool:
+            # map() preserves window order regardless of completion order
+            texts = list(pool.map(transcribe, segments))
+
+        return stitch(texts)
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
@@ -0,0 +1,188 @@
+"""Speech-to-text backends.
+
+``STT_BACKEND`` selects the implementation used by ``stt_service``:
+
+* ``gemini`` (default) – Gemini API, configured lazily on first use.
+* ``local`` – deterministic offline stand-in for tests, benchmarks and
+  load tests; no network or credentials needed.
+"""
+from __future__ import annotations
+
+from typing import Dict, Optional, Protocol
+import json
+import logging
+import math
+import mimetypes
+import os
+
+from core.lazy import LazyArtifact
+from services.transcript_cache import file_sha256
+
+logger = logging.getLogger(__name__)
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+ENV_FILE = os.path.join(BASE_DIR, "..", ".env")
+
+
+def _load_env() -> None:
+    from dotenv import load_dotenv
+
+    load_dotenv(ENV_FILE)
+
+
+class STTBackend(Protocol):
+    """Anything that turns an audio file into text."""
+
+    @property
+    def name(self) -> str:
+        """Model identifier; part of the transcript cache key."""
+        ...
+
+    def transcribe(self, audio_path: str) -> str:
+        ...
+
+
+class GeminiBackend:
+    """Gemini transcription. The SDK, ``.env`` and API key are only touched
+    on the first :meth:`transcribe` call, so importing never needs network
+    credentials."""
+
+    def __init__(self, model_name: str = "gemini-2.5-flash", api_key: Optional[str] = None) -> None:
+        self._model_name = model_name
+        self._api_key = api_key
+        self._model = LazyArtifact(f"stt:{model_name}", self._create_model)
+
+    @property
+    def name(self) -> str:
+        return self._model_name
+
+    def _create_model(self):
+        import google.generativeai as genai
+
+        _load_env()
+        api_key = self._api_key or os.getenv("GEMINI_API_KEY")
+        if not api_key:
+            raise RuntimeError(
+                "Gemini API key missing. Add GEMINI_API_KEY to backend/.env "
+                "or set STT_BACKEND=local."
+            )
+        genai.configure(api_key=api_key)
+        return genai.GenerativeModel(self._model_name)
+
+    def transcribe(self, audio_path: str) -> str:
+        """Convert an audio file into a transcript using the Gemini API."""
+        model = self._model.get()
+        try:
+            # Detect MIME type
+            mime_type, _ = mimetypes.guess_type(audio_path)
+            if mime_type is None:
+                mime_type = "audio/mpeg"  # fallback
+
+            # Read audio bytes
+            with open(audio_path, "rb") as f:
+                audio_bytes = f.read()
+
+            logger.debug(
+                "stt request",
+                extra={"backend": self._model_name, "mime_type": mime_type, "bytes": len(audio_bytes)},
+            )
+
+            # Call Gemini
+            response = model.generate_content(
+                [
+                    {
+                        "mime_type": mime_type,
+                        "data": audio_bytes
+                    },
+                    "Please transcribe this audio to text accurately."
+                ]
+            )
+
+            transcript = response.text.strip()
+
+            if not transcript:
+                raise ValueError("❌ Empty transcript returned from Gemini API")
+
+            logger.debug("stt response", extra={"backend": self._model_name, "chars": len(transcript)})
+            return transcript
+
+        except Exception as exc:
+            logger.error("stt failed: %s", exc, extra={"backend": self._model_name})
+            raise RuntimeError("Failed to transcribe audio with Gemini API") from exc
+
+
+class LocalBackend:
+    """Offline, deterministic transcripts.
+
+    Lookup order for an audio file:
+
+    1. ``transcripts_file`` – JSON object keyed by the audio SHA-256 or by
+       file name (keys by hash also work for uploads, which are renamed).
+    2. A sidecar text file next to the audio (``meeting.mp3.txt`` or
+       ``meeting.txt``).
+    3. ``default`` transcript, if configured.
+
+    In segmented mode (``STT_SEGMENT_SECONDS``) each window gets the share
+    of the source transcript's words that falls inside its time range,
+    with words spread evenly over the recording, so overlapping windows
+    overlap in text just like a real backend's would.
+    """
+
+    name = "local"
+
+    def __init__(self, transcripts_file: Optional[str] = None, default: Optional[str] = None) -> None:
+        self.default = default
+        self._mapping: Dict[str, str] = {}
+        if transcripts_file:
+            with open(transcripts_file, "r", encoding="utf-8") as f:
+                self._mapping = json.load(f)
+
+    def transcribe_window(self, segment) -> str:
+        """Words of ``segment.source``'s transcript within the window."""
+        words = self.transcribe(segment.source or segment.path).split()
+        if not segment.duration or not words:
+            return " ".join(words)
+        first = int(len(words) * segment.start / segment.duration)
+        last = math.ceil(len(words) * segment.end / segment.duration)
+        return " ".join(words[first:last])
+
+    def transcribe(self, audio_path: str) -> str:
+        if self._mapping:
+            digest = file_sha256(audio_path)
+            for key in (digest, os.path.basename(audio_path)):
+                if key in self._mapping:
+                    return self._mapping[key]
+
+        stem, _ = os.path.splitext(audio_path)
+        for sidecar in (f"{audio_path}.txt", f"{stem}.txt"):
+            if os.path.exists(sidecar):
+                with open(sidecar, "r", encoding="utf-8") as f:
+                    return f.read().strip()
+
+        if self.default is not None:
+            return self.default
+
+        raise RuntimeError(f"No local transcript configured for {os.path.basename(audio_path)}")
+
+
+def _create_backend() -> STTBackend:
+    _load_env()
+    kind = os.getenv("STT_BACKEND", "gemini").lower()
+
+    if kind == "gemini":
+        return GeminiBackend(os.getenv("STT_MODEL", "gemini-2.5-flash"))
+    if kind == "local":
+        return LocalBackend(
+            transcripts_file=os.getenv("STT_LOCAL_TRANSCRIPTS"),
+            default=os.getenv("STT_LOCAL_DEFAULT"),
+        )
+
+    raise ValueError(f"Unknown STT_BACKEND '{kind}' (expected 'gemini' or 'local')")
+
+
+_BACKEND = LazyArtifact("stt_backend", _create_backend)
+
+
+def get_backend() -> STTBackend:
+    """Backend selected by ``STT_BACKEND``; created once, on first use."""
+    return _BACKEND.get()
@@ -6,6 +6,7 @@
 # Responsibilities:
 #   ✔ Convert uploaded audio file → text transcript
 #   ✔ Use Gemini API for transcription (allowed)
+#   ✔ Swap in an offline backend via STT_BACKEND=local
 #   ✔ Return raw transcript back to app.py
 #
 # IMPORTANT:
@@ -13,79 +14,85 @@
 #   - Task extraction is done using our own rule-based NLP logic.
 # ===============================================================
 
-import google.generativeai as genai 
-import os 
-from dotenv import load_dotenv 
-import mimetypes
+import os
 
-print("WORKING DIR:", os.getcwd())
-
-load_dotenv(r"C:\Users\Admin\Desktop\task-python\backend\.env")
-
-print("sumit debug",os.getenv("GEMINI_API_KEY"))
-GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
-
-
-if not GEMINI_API_KEY:
-    raise Exception("❌ ERROR: Gemini API key missing. Add GEMINI_API_KEY to backend/.env")
-
-genai.configure(api_key= GEMINI_API_KEY)
-
-# Create Model Instance
-model = genai.GenerativeModel("gemini-2.5-flash")
+from core.metrics import Counter, stage_timer
+from services.stt_backends import get_backend
+from services.transcript_cache import TranscriptCache, file_sha256
+from services.segmented_stt import transcribe_segmented
 
 # ---------------------------------------------------------------
-# Function: Convert Audio → Text using Gemini
-# --------------------------------------------------------------
-
-# def speech_to_text(audio_path: str) -> str:
-#     """Convert an audio file into a transcript using the Gemini API."""
-#     try:
-#         audio_file = genai.upload_file(path=audio_path)
-#         response = genai.generate_text(
-#             model="models/gemini-1.5-flash",
-#             audio=audio_file,
-#         )
-#         transcript = response.text.strip()
-#         if not transcript:
-#             raise ValueError("Empty transcript returned from Gemini API")
-#         return transcript
-#     except Exception as exc:
-#         raise RuntimeError("Failed to transcribe audio with Gemini API") from exc
-def speech_to_text(audio_path: str) -> str:
-    """Convert an audio file into a transcript using the Gemini API."""
-    try:
-        # Detect MIME type
-        mime_type, _ = mimetypes.guess_type(audio_path)
-        if mime_type is None:
-            mime_type = "audio/mpeg"  # fallback
-
-        # Read audio bytes
-        with open(audio_path, "rb") as f:
-            audio_bytes = f.read()
-
-        print("🔊 STT DEBUG: Sending audio to Gemini...")
-        print("MIME TYPE:", mime_type)
-
-        # Call Gemini
-        response = model.generate_content(
-            [
-                {
-                    "mime_type": mime_type,
-                    "data": audio_bytes
-                },
-                "Please transcribe this audio to text accurately."
-            ]
-        )
-
-        transcript = response.text.strip()
+# Transcript cache (content-addressed: audio SHA-256 + model name)
+#   TRANSCRIPT_CACHE_MAX_MB   size cap on disk, 0 disables
+#   TRANSCRIPT_CACHE_TTL_S    entry lifetime
+# ---------------------------------------------------------------
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+transcript_cache = TranscriptCache(
+    directory=os.getenv(
+        "TRANSCRIPT_CACHE_DIR",
+        os.path.join(BASE_DIR, "..", "temp", "transcript_cache"),
+    ),
+    max_bytes=int(float(os.getenv("TRANSCRIPT_CACHE_MAX_MB", "256")) * 1024 * 1024),
+    ttl_seconds=float(os.getenv("TRANSCRIPT_CACHE_TTL_S", str(7 * 24 * 3600))),
+)
+
+STT_REQUESTS = Counter(
+    "stt_requests_total",
+    "Transcriptions served, by source (cache or backend).",
+)
 
-        if not transcript:
-            raise ValueError("❌ Empty transcript returned from Gemini API")
+# ---------------------------------------------------------------
+# Segmented mode for long meetings
+#   STT_SEGMENT_SECONDS   window length, 0 sends the whole file
+#   STT_SEGMENT_OVERLAP_S overlap between windows (de-duplicated)
+#   STT_MAX_PARALLEL      concurrent window requests
+# ---------------------------------------------------------------
+SEGMENT_SECONDS = float(os.getenv("STT_SEGMENT_SECONDS", "0"))
+SEGMENT_OVERLAP = float(os.getenv("STT_SEGMENT_OVERLAP_S", "5"))
+MAX_PARALLEL = int(os.getenv("STT_MAX_PARALLEL", "4"))
 
-        print("🔊 STT SUCCESS: Transcript received.")
+# ---------------------------------------------------------------
+# Function: Convert Audio → Text using the configured backend
+# ---------------------------------------------------------------
+def speech_to_text(audio_path: str, audio_sha256: str = None) -> str:
+    """
+    Convert an audio file into a transcript, reusing a cached transcript
+    when the same audio was already transcribed by the same model.
+
+    Pass ``audio_sha256`` when the digest is already known (e.g. computed
+    while streaming the upload) to avoid re-reading the file.
+    """
+    with stage_timer("stt"):
+        if not transcript_cache.enabled:
+            STT_REQUESTS.inc(source="backend")
+            return _transcribe(audio_path)
+
+        digest = audio_sha256 or file_sha256(audio_path)
+        cached = transcript_cache.get(digest, get_backend().name)
+        if cached is not None:
+            STT_REQUESTS.inc(source="cache")
+            return cached
+
+        STT_REQUESTS.inc(source="backend")
+        transcript = _transcribe(audio_path)
+        transcript_cache.put(digest, get_backend().name, transcript)
         return transcript
 
-    except Exception as exc:
-        print("❌ STT ERROR:", exc)
-        raise RuntimeError("Failed to transcribe audio with Gemini API") from exc
\ No newline at end of file
+
+def _transcribe(audio_path: str) -> str:
+    """Whole-file request, or overlapping windows in parallel when enabled."""
+    backend = get_backend()
+    if SEGMENT_SECONDS <= 0:
+        return backend.transcribe(audio_path)
+
+    # Backends that can transcribe a time window of the source directly
+    # (LocalBackend) get the window; the rest get the cut-out audio file.
+    transcribe_window = getattr(backend, "transcribe_window", None)
+    return transcribe_segmented(
+        audio_path,
+        transcribe_window or (lambda segment: backend.transcribe(segment.path)),
+        window=SEGMENT_SECONDS,
+        overlap=SEGMENT_OVERLAP,
+        max_workers=MAX_PARALLEL,
+    )
@@ -0,0 +1,173 @@
+"""Content-addressed on-disk cache of STT transcripts."""
+from __future__ import annotations
+
+from collections import OrderedDict
+from threading import Lock, get_ident
+from typing import Dict, Optional
+import hashlib
+import json
+import os
+import time
+
+_HASH_CHUNK = 1024 * 1024
+
+
+def file_sha256(path: str) -> str:
+    """SHA-256 of a file, read in chunks."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        while chunk := f.read(_HASH_CHUNK):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class TranscriptCache:
+    """Map (audio SHA-256, STT model) → transcript, stored as small JSON files.
+
+    Entries expire ``ttl_seconds`` after they were written. Total size on
+    disk is capped at ``max_bytes``; when exceeded, the least recently used
+    entries are evicted first. A ``max_bytes`` of ``0`` disables the cache.
+
+    Recency and the total size are tracked in memory, seeded once from the
+    directory (oldest mtime first), so a write costs O(evicted entries)
+    rather than a directory scan. Hits also refresh the file mtime, which
+    keeps the order across restarts.
+    """
+
+    def __init__(self, directory: str, max_bytes: int, ttl_seconds: float) -> None:
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self._lock = Lock()
+        self._lru: "OrderedDict[str, int]" = OrderedDict()  # path → size, oldest first
+        self._total_bytes = 0
+        if self.enabled:
+            os.makedirs(directory, exist_ok=True)
+            self._load_index()
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_bytes > 0
+
+    @property
+    def total_bytes(self) -> int:
+        return self._total_bytes
+
+    def _path(self, audio_sha256: str, model_name: str) -> str:
+        key = hashlib.sha256(f"{model_name}\0{audio_sha256}".encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, f"{key}.json")
+
+    def get(self, audio_sha256: str, model_name: str) -> Optional[str]:
+        if not self.enabled:
+            return None
+
+        path = self._path(audio_sha256, model_name)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            self._forget(path)
+            self.misses += 1
+            return None
+
+        if time.time() - entry.get("created_at", 0) > self.ttl_seconds:
+            with self._lock:
+                self._discard(path)
+            self.misses += 1
+            return None
+
+        try:
+            os.utime(path)  # mark as recently used (survives restarts)
+            size = os.path.getsize(path)
+        except OSError:
+            size = None
+        if size is not None:
+            with self._lock:
+                self._track(path, size)
+        self.hits += 1
+        return entry["transcript"]
+
+    def put(self, audio_sha256: str, model_name: str, transcript: str) -> None:
+        if not self.enabled:
+            return
+
+        path = self._path(audio_sha256, model_name)
+        entry = {
+            "audio_sha256": audio_sha256,
+            "model": model_name,
+            "created_at": time.time(),
+            "transcript": transcript,
+        }
+        data = json.dumps(entry).encode("utf-8")
+        tmp_path = f"{path}.{os.getpid()}.{get_ident()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)  # readers never see a partial entry
+
+        with self._lock:
+            self._track(path, len(data))
+            self._evict()
+
+    def clear(self) -> None:
+        with self._lock:
+            for name in self._entry_names():
+                self._remove(os.path.join(self.directory, name))
+            self._lru.clear()
+            self._total_bytes = 0
+
+    def stats(self) -> Dict[str, float]:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._lru),
+            "bytes": self._total_bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": (self.hits / lookups) if lookups else None,
+        }
+
+    def _entry_names(self):
+        try:
+            return [n for n in os.listdir(self.directory) if n.endswith(".json")]
+        except OSError:
+            return []
+
+    def _load_index(self) -> None:
+        entries = []
+        for name in self._entry_names():
+            path = os.path.join(self.directory, name)
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            entries.append((st.st_mtime, path, st.st_size))
+        with self._lock:
+            for _, path, size in sorted(entries):
+                self._track(path, size)
+            self._evict()
+
+    def _track(self, path: str, size: int) -> None:
+        """Record ``path`` as the most recently used entry (lock held)."""
+        self._total_bytes += size - self._lru.pop(path, 0)
+        self._lru[path] = size
+
+    def _forget(self, path: str) -> None:
+        with self._lock:
+            self._total_bytes -= self._lru.pop(path, 0)
+
+    def _discard(self, path: str) -> None:
+        self._total_bytes -= self._lru.pop(path, 0)
+        self._remove(path)
+
+    def _evict(self) -> None:
+        while self._total_bytes > self.max_bytes and self._lru:
+            self._discard(next(iter(self._lru)))
+
+    @staticmethod
+    def _remove(path: str) -> None:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
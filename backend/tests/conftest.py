@@ -0,0 +1,37 @@
+"""Shared test setup. Run from ``backend/``: ``python -m pytest tests``."""
+import os
+import sys
+
+import pytest
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if BACKEND_DIR not in sys.path:
+    sys.path.insert(0, BACKEND_DIR)
+
+
+def _spacy_model_installed() -> bool:
+    try:
+        import spacy
+    except ImportError:
+        return False
+    from nlp.spacy_utils import MODEL_NAME
+
+    return spacy.util.is_package(MODEL_NAME)
+
+
+requires_spacy_model = pytest.mark.skipif(
+    not _spacy_model_installed(),
+    reason="spaCy model en_core_web_sm is not installed",
+)
+
+
+@pytest.fixture
+def api_client(monkeypatch):
+    """TestClient for the API without its startup hooks (warm-up, pool,
+    watcher), so endpoint tests do not load the models up front."""
+    from fastapi.testclient import TestClient
+
+    from api import app as app_module
+
+    monkeypatch.setattr(app_module, "WARMUP_MODE", "lazy")
+    return TestClient(app_module.app)
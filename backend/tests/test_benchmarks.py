@@ -0,0 +1,42 @@
+import json
+
+from benchmarks import run_benchmarks
+from conftest import requires_spacy_model
+
+NO_SPACY_STAGES = "is_task_batch,split_multi_tasks,extract_deadline_priority,assign_tasks"
+
+
+def test_smoke_run_writes_results(tmp_path, capsys):
+    output = tmp_path / "bench.json"
+    assert run_benchmarks.main(["--sizes", "3,5", "--repeat", "1", "--stages", NO_SPACY_STAGES,
+                                "--output", str(output)]) == 0
+
+    results = json.loads(output.read_text())["results"]
+    assert sorted(results) == ["3", "5"]
+    assert sorted(results["5"]) == sorted(NO_SPACY_STAGES.split(","))
+    assert all(stat["seconds"] >= 0 for stat in results["5"].values())
+    assert "is_task_batch" in capsys.readouterr().out
+
+
+def test_baseline_comparison(tmp_path):
+    baseline = tmp_path / "baseline.json"
+    args = ["--sizes", "3", "--repeat", "1", "--stages", "split_multi_tasks"]
+    assert run_benchmarks.main(args + ["--output", str(baseline)]) == 0
+    assert run_benchmarks.main(args + ["--baseline", str(baseline), "--threshold", "1000"]) == 0
+
+    data = json.loads(baseline.read_text())
+    data["results"]["3"]["split_multi_tasks"]["seconds"] = 0.0
+    baseline.write_text(json.dumps(data))
+    assert run_benchmarks.main(args + ["--baseline", str(baseline)]) == 1
+
+
+def test_find_regressions_ignores_unknown_stages():
+    current = {"results": {"10": {"a": {"seconds": 2.0}, "b": {"seconds": 1.0}}}}
+    baseline = {"results": {"10": {"a": {"seconds": 1.0}}}}
+    assert len(run_benchmarks.find_regressions(current, baseline, 0.5)) == 1
+    assert run_benchmarks.find_regressions(current, baseline, 1.5) == []
+
+
+@requires_spacy_model
+def test_smoke_run_all_stages():
+    assert run_benchmarks.main(["--sizes", "3", "--repeat", "1"]) == 0
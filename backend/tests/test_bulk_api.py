@@ -0,0 +1,70 @@
+import json
+
+import pytest
+
+from api import app as app_module
+
+
+@pytest.fixture(autouse=True)
+def fake_pipeline(monkeypatch):
+    """One task per transcript, echoing the text."""
+    calls = []
+
+    def process_transcripts(transcripts, batch_size, n_process):
+        calls.append(list(transcripts))
+        return [[{"task": t, "assigned_to": None, "deadline": None, "priority": None}] for t in transcripts]
+
+    monkeypatch.setattr(app_module, "process_transcripts", process_transcripts)
+    return calls
+
+
+def tasks(response):
+    return [(r["id"], [t["task"] for t in r["tasks"]]) for r in response.json()["results"]]
+
+
+def test_json_array_with_ids(api_client, fake_pipeline):
+    body = ["first meeting", {"id": "m-2", "transcript": "second meeting"}, {"transcript": "third"}]
+    response = api_client.post("/transcripts/bulk?auto_assign=false", json=body)
+    assert response.status_code == 200
+    assert response.json()["count"] == 3
+    assert tasks(response) == [(0, ["first meeting"]), ("m-2", ["second meeting"]), (2, ["third"])]
+    assert fake_pipeline == [["first meeting", "second meeting", "third"]]
+
+
+def test_transcripts_object(api_client):
+    response = api_client.post("/transcripts/bulk?auto_assign=false", json={"transcripts": ["a", "b"]})
+    assert tasks(response) == [(0, ["a"]), (1, ["b"])]
+
+
+def test_ndjson(api_client):
+    body = "\n".join(json.dumps(item) for item in ["a", {"id": 7, "transcript": "b"}]) + "\n\n"
+    response = api_client.post("/transcripts/bulk?auto_assign=false", content=body,
+                               headers={"content-type": "application/x-ndjson"})
+    assert response.status_code == 200
+    assert tasks(response) == [(0, ["a"]), (7, ["b"])]
+
+
+@pytest.mark.parametrize("body", [
+    {"transcript": "one meeting"},
+    {"transcript": 5},
+    {"transcripts": "not a list"},
+    [{"id": 1}],
+    [5],
+    "just a string",
+])
+def test_bad_bodies_are_client_errors(api_client, fake_pipeline, body):
+    response = api_client.post("/transcripts/bulk", json=body)
+    assert response.status_code == 400
+    assert fake_pipeline == []
+
+
+def test_invalid_json_and_encoding(api_client):
+    assert api_client.post("/transcripts/bulk", content=b"[not json").status_code == 400
+    assert api_client.post("/transcripts/bulk", content=b"\xff\xfe").status_code == 400
+
+
+def test_too_many_transcripts(api_client, fake_pipeline, monkeypatch):
+    monkeypatch.setattr(app_module, "BULK_MAX_TRANSCRIPTS", 2)
+    response = api_client.post("/transcripts/bulk", json=["a", "b", "c"])
+    assert response.status_code == 413
+    assert fake_pipeline == []
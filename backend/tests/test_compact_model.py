@@ -0,0 +1,70 @@
+import random
+
+import joblib
+import numpy as np
+import pytest
+from sklearn.feature_extraction.text import CountVectorizer, HashingVectorizer, TfidfVectorizer
+from sklearn.linear_model import LogisticRegression
+from sklearn.utils import murmurhash3_32 as sk_murmurhash3_32
+
+from mlmodel import compact_model, name_predictor, task_predictor
+from mlmodel.compact_model import CompactClassifier, CompactVectorizer
+
+WORDS = ["fix", "the", "login", "bug", "by", "friday", "Mohit", "café", "naïve", "deploy",
+         "great", "demo", "update", "docs", "tomorrow", "urgent", "ship", "it", "C++", "ui"]
+
+
+def random_docs(n, seed=0):
+    rng = random.Random(seed)
+    return [" ".join(rng.choice(WORDS) for _ in range(rng.randint(0, 10))) for _ in range(n)]
+
+
+def dense(rows):
+    out = np.zeros(rows.shape)
+    for i in range(rows.shape[0]):
+        for j in range(rows.indptr[i], rows.indptr[i + 1]):
+            out[i, rows.indices[j]] += rows.data[j]
+    return out
+
+
+def test_murmurhash_matches_sklearn():
+    rng = random.Random(0)
+    for _ in range(2000):
+        text = "".join(rng.choice("abcXYZ é✓ 0123") for _ in range(rng.randint(0, 20)))
+        seed = rng.choice([0, 1, 42, 2 ** 31 - 1])
+        assert compact_model.murmurhash3_32(text.encode("utf-8"), seed) == sk_murmurhash3_32(text, seed)
+
+
+@pytest.mark.parametrize("vectorizer", [
+    TfidfVectorizer(ngram_range=(1, 2)),
+    TfidfVectorizer(analyzer="char_wb", ngram_range=(2, 4), sublinear_tf=True, strip_accents="unicode"),
+    TfidfVectorizer(analyzer="char", ngram_range=(1, 3), norm="l1", strip_accents="ascii"),
+    CountVectorizer(binary=True, stop_words="english"),
+    HashingVectorizer(n_features=2 ** 10, ngram_range=(1, 2)),
+    HashingVectorizer(n_features=2 ** 8, analyzer="char_wb", ngram_range=(2, 3), alternate_sign=False),
+], ids=["word", "char_wb", "char", "count", "hashing", "hashing_char_wb"])
+@pytest.mark.parametrize("n_classes", [2, 3])
+def test_vectorizer_and_classifier_match_sklearn(tmp_path, vectorizer, n_classes):
+    train = random_docs(200, seed=1)
+    y = [i % n_classes for i in range(len(train))]
+    X = vectorizer.fit_transform(train)
+    model = LogisticRegression(max_iter=500).fit(X, y)
+    compact_model.export(vectorizer, model, str(tmp_path))
+
+    docs = random_docs(300, seed=2) + ["", "unseen words only"]
+    compact_vectorizer = CompactVectorizer(str(tmp_path))
+    compact_classifier = CompactClassifier(str(tmp_path))
+    rows = compact_vectorizer.transform(docs)
+
+    np.testing.assert_allclose(dense(rows), vectorizer.transform(docs).toarray(), atol=1e-12)
+    np.testing.assert_allclose(compact_classifier.predict_proba(rows),
+                               model.predict_proba(vectorizer.transform(docs)), atol=1e-12)
+    assert list(compact_classifier.predict(rows)) == list(model.predict(vectorizer.transform(docs)))
+
+
+@pytest.mark.parametrize("module", [task_predictor, name_predictor], ids=["task", "name"])
+def test_shipped_exports_match_the_pickles(module):
+    vectorizer = joblib.load(module.VECTORIZER_PATH)
+    model = joblib.load(module.MODEL_PATH)
+    docs = compact_model.PARITY_SAMPLES["task"] + compact_model.PARITY_SAMPLES["name"] + random_docs(100)
+    assert compact_model.max_difference(vectorizer, model, module.COMPACT_DIR, docs) < 1e-9
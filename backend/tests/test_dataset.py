@@ -0,0 +1,27 @@
+from mlmodel import dataset
+from mlmodel.shard_writer import iter_csv
+
+
+def test_default_draw_reports_and_warns_about_imbalance(tmp_path):
+    output = tmp_path / "tasks.csv"
+    stats, counts = dataset.write_dataset(str(output), seed=7)
+
+    rows = list(iter_csv(str(output), dataset.HEADER))
+    assert counts == {"task": sum(r[1] == "1" for r in rows), "non_task": sum(r[1] == "0" for r in rows)}
+    assert counts["task"] + counts["non_task"] == stats.rows_out
+    assert counts["non_task"] <= dataset.NON_TASK_CAPACITY < counts["task"]
+    assert "pass --balance" in dataset.imbalance_warning(counts)
+
+
+def test_balance_caps_the_task_rows(tmp_path):
+    _, counts = dataset.write_dataset(str(tmp_path / "tasks.csv"), seed=7, balance=True)
+    assert counts["task"] <= dataset.NON_TASK_CAPACITY
+    assert dataset.imbalance_warning(counts) is None
+
+
+def test_imbalance_warning_threshold():
+    assert dataset.imbalance_warning({"task": 150, "non_task": 100}) is None
+    assert dataset.imbalance_warning({"task": 100, "non_task": 151}) is not None
+    assert dataset.imbalance_warning({"task": 0, "non_task": 5}) is not None
+    assert dataset.balanced_action_count(900, 600) == dataset.NON_TASK_CAPACITY
+    assert dataset.balanced_action_count(50, 600) == 50
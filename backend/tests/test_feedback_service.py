@@ -0,0 +1,82 @@
+import pytest
+
+from mlmodel import hot_reload, name_predictor
+from services import feedback_service
+from services.feedback_service import Correction, FeedbackLog, FeedbackSwapError, apply_batch
+
+WORD = "Zorblax"
+
+
+def name_prob(word):
+    bundle = name_predictor.get_bundle()
+    X = bundle.vectorizer.transform([word])
+    return bundle.model.predict_proba(X)[0][list(bundle.model.classes_).index(1)]
+
+
+@pytest.fixture
+def log(tmp_path):
+    log = FeedbackLog(str(tmp_path / "feedback.jsonl"), batch_size=4)
+    hot_reload.add_reload_hook(log.around_reload)
+    yield log
+    hot_reload._reload_hooks.remove(log.around_reload)
+    name_predictor.reload()
+
+
+def corrections(n=8):
+    return [Correction("name", WORD, False) for _ in range(n)]
+
+
+def test_swap_retries_are_bounded(monkeypatch):
+    calls = []
+
+    def always_stale(model, expected=None):
+        calls.append(model)
+        return False
+
+    monkeypatch.setattr(name_predictor, "swap_model", always_stale)
+    with pytest.raises(FeedbackSwapError):
+        apply_batch("name", corrections(1))
+    assert len(calls) == feedback_service.FEEDBACK_SWAP_RETRIES
+
+
+def test_catch_up_applies_each_line_once(log):
+    before = name_prob(WORD)
+    log.append(corrections())
+    assert log.catch_up() == 8
+    after = name_prob(WORD)
+    assert after < before
+    assert log.catch_up() == 0
+    assert name_prob(WORD) == after
+
+
+def test_reload_replays_the_log(log):
+    before = name_prob(WORD)
+    log.append(corrections())
+    log.catch_up()
+    updated = name_prob(WORD)
+
+    hot_reload.reload_model("name")
+    assert name_prob(WORD) == pytest.approx(updated)
+    assert name_prob(WORD) < before
+
+
+def test_new_process_catches_up_from_existing_log(log):
+    log.append(corrections())
+    log.catch_up()
+    updated = name_prob(WORD)
+
+    name_predictor.reload()  # a restarted API process or a fresh pool worker
+    fresh = FeedbackLog(log.path, batch_size=4)
+    assert fresh.catch_up() == 8
+    assert name_prob(WORD) == pytest.approx(updated)
+
+
+def test_incomplete_and_malformed_lines_are_handled(log):
+    log.append(corrections(2))
+    with open(log.path, "a", encoding="utf-8") as f:
+        f.write("not json\n")
+        f.write('{"kind": "name", "text": "Zorb')
+    assert log.catch_up() == 2
+    with open(log.path, "a", encoding="utf-8") as f:
+        f.write('lax", "label": false}\n')
+    assert log.catch_up() == 1
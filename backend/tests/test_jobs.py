@@ -0,0 +1,115 @@
+import threading
+import time
+
+import pytest
+
+from api import app as app_module
+from api.jobs import JobManager, QueueFullError
+
+
+def wait_for(predicate, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.01)
+
+
+@pytest.fixture
+def jobs(monkeypatch, tmp_path):
+    """One worker, two slots; STT blocks until ``release`` is set."""
+    manager = JobManager(max_workers=1, queue_depth=2)
+    release = threading.Event()
+
+    def speech_to_text(path, sha256):
+        release.wait(5)
+        with open(path, "rb") as f:
+            if f.read() == b"broken":
+                raise RuntimeError("STT failed")
+        return "fix the login bug"
+
+    monkeypatch.setattr(app_module, "job_manager", manager)
+    monkeypatch.setattr(app_module, "TEMP_DIR", str(tmp_path))
+    monkeypatch.setattr(app_module, "speech_to_text", speech_to_text)
+    monkeypatch.setattr(app_module, "run_pipeline_sync",
+                        lambda transcript, auto_assign: [{"task": transcript, "assigned_to": None}])
+    monkeypatch.setattr(app_module, "assign_tasks", lambda tasks: tasks)
+    yield manager, release
+    release.set()
+    manager.shutdown()
+
+
+def submit(client, data=b"audio"):
+    return client.post("/jobs", files={"file": ("meeting.wav", data, "audio/wav")})
+
+
+def status(client, job_id):
+    return client.get(f"/jobs/{job_id}").json()
+
+
+def test_lifecycle_and_backpressure(api_client, jobs, tmp_path):
+    manager, release = jobs
+    first = submit(api_client)
+    second = submit(api_client)
+    assert first.status_code == second.status_code == 202
+    first, second = first.json()["job_id"], second.json()["job_id"]
+
+    wait_for(lambda: status(api_client, first)["stage"] == "transcribing")
+    assert status(api_client, first)["status"] == "running"
+    assert status(api_client, second)["status"] == "queued"
+
+    full = submit(api_client)
+    assert full.status_code == 429
+    assert full.headers["Retry-After"] == "5"
+    assert len(list(tmp_path.iterdir())) == 2  # the rejected upload never hit disk
+
+    release.set()
+    wait_for(lambda: status(api_client, second)["status"] == "succeeded")
+    job = status(api_client, first)
+    assert job["status"] == "succeeded"
+    assert job["stage"] == "done"
+    assert job["result"] == {"transcript": "fix the login bug",
+                             "tasks": [{"task": "fix the login bug", "assigned_to": None}]}
+    assert job["started_at"] <= job["finished_at"]
+    assert list(tmp_path.iterdir()) == []
+    assert manager.active == 0
+    assert submit(api_client).status_code == 202
+
+
+def test_failed_job(api_client, jobs, tmp_path):
+    _, release = jobs
+    release.set()
+    job_id = submit(api_client, b"broken").json()["job_id"]
+    wait_for(lambda: status(api_client, job_id)["status"] == "failed")
+
+    job = status(api_client, job_id)
+    assert job["error"] == "STT failed"
+    assert job["stage"] == "transcribing"
+    assert job["result"] is None
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_unknown_job(api_client):
+    assert api_client.get("/jobs/nope").status_code == 404
+
+
+def test_submit_raises_when_full_and_history_keeps_active_jobs():
+    manager = JobManager(max_workers=1, queue_depth=2, history=2)
+    release = threading.Event()
+    try:
+        done = [manager.submit(lambda job: {"n": 1}) for _ in range(2)]
+        wait_for(lambda: manager.active == 0)
+
+        blocked = manager.submit(lambda job: release.wait(5) and {})
+        queued = manager.submit(lambda job: {})
+        with pytest.raises(QueueFullError):
+            manager.submit(lambda job: {})
+
+        # over history: finished jobs go first, oldest first; active ones stay
+        assert manager.get(done[0].id) is None
+        assert manager.get(done[1].id) is None
+        assert manager.get(blocked.id) is blocked
+        assert manager.get(queued.id) is queued
+    finally:
+        release.set()
+        manager.shutdown()
+    assert queued.status == "succeeded"
@@ -0,0 +1,70 @@
+import random
+
+from nlp import nlp_rules
+from nlp.keyword_matcher import KeywordMatcher
+from nlp.nlp_rules import DEADLINE_PATTERNS, PRIORITY_MAP, extract_deadline, extract_priority
+
+FILLER = ["mohit", "please", "the", "login", "bug", "and", "report", "on", "by",
+          "end", "of", "next", "this", "high", "low", "can", "week", "evening"]
+PUNCTUATION = ["", "", "", ",", ".", "!", "?"]
+
+
+def old_extract_deadline(sentence):
+    # the substring loop KeywordMatcher replaced
+    for pattern, value in DEADLINE_PATTERNS.items():
+        if pattern in sentence:
+            return value
+    return None
+
+
+def old_extract_priority(text):
+    for key, value in PRIORITY_MAP.items():
+        if key in text:
+            return value
+    return None
+
+
+def random_sentence(rng):
+    """Whole words only: fillers plus keywords, adjacent and overlapping.
+
+    The old loops also matched inside longer words ("fridays"); the matcher
+    requires word boundaries on purpose, so such inputs are not generated.
+    """
+    vocabulary = FILLER + list(DEADLINE_PATTERNS) + list(PRIORITY_MAP)
+    words = [rng.choice(vocabulary) + rng.choice(PUNCTUATION) for _ in range(rng.randint(0, 12))]
+    return " ".join(words)
+
+
+def test_matches_the_old_loops_on_random_sentences():
+    rng = random.Random(0)
+    for _ in range(20000):
+        sentence = random_sentence(rng)
+        assert extract_deadline(sentence) == old_extract_deadline(sentence), sentence
+        assert extract_priority(sentence) == old_extract_priority(sentence), sentence
+
+
+def test_table_order_decides_precedence():
+    assert extract_deadline("ship it tomorrow evening or tomorrow") == "Tomorrow evening"
+    assert extract_deadline("next week, or by the end of this week") == "End of this week"
+    assert extract_deadline("next week, or friday") == "Friday"
+    assert extract_priority("low priority but urgent") == "High"
+
+
+def test_word_boundaries():
+    matcher = KeywordMatcher({"skill": {"ui": "ui"}, "verb": {"fix": "fix"}}, prefix_categories={"verb"})
+    assert matcher.first("build the ui", "skill") == "ui"
+    assert matcher.first("rebuild everything", "skill") is None
+    assert matcher.first("Mohit fixed it", "verb") == "fix"
+    assert matcher.first("prefix handling", "verb") is None
+
+
+def test_extract_tasks_uses_one_scan_per_sentence(monkeypatch):
+    scanned = []
+    scan = nlp_rules.RULE_MATCHER.scan
+    monkeypatch.setattr(nlp_rules.RULE_MATCHER, "scan", lambda text: scanned.append(text) or scan(text))
+    monkeypatch.setattr(nlp_rules, "extract_assignee", lambda sentence: None)
+
+    tasks = nlp_rules.extract_tasks("Fix the login bug by friday, it is urgent. Great demo everyone.")
+    assert len(scanned) == 2
+    assert tasks == [{"task": "Fix the login bug by friday, it is urgent.", "assigned_to": None,
+                      "deadline": "Friday", "priority": "High"}]
@@ -0,0 +1,27 @@
+from core.metrics import Counter, capture_counters, merge_counters, render_prometheus
+from mlmodel import name_ranker
+
+
+def test_counter_increments_are_captured_and_merged():
+    counter = Counter("test_captured_total", "Test counter.")
+    with capture_counters() as samples:
+        counter.inc(2, kind="a")
+    assert samples == [("test_captured_total", 2, (("kind", "a"),))]
+
+    merge_counters(samples)  # what the parent does with a worker's samples
+    assert counter.value(kind="a") == 4
+
+
+def test_ml_prob_cache_lookups_are_exported():
+    name_ranker.clear_cache()
+    hits = name_ranker.CACHE_HITS.value(cache="ml_prob")
+    misses = name_ranker.CACHE_MISSES.value(cache="ml_prob")
+
+    name_ranker._ml_probs(["Rahul", "login"])
+    name_ranker._ml_probs(["Rahul", "login", "Priya"])
+
+    assert name_ranker.CACHE_HITS.value(cache="ml_prob") - hits == 2
+    assert name_ranker.CACHE_MISSES.value(cache="ml_prob") - misses == 3
+    text = render_prometheus()
+    assert "# TYPE name_score_cache_hits_total counter" in text
+    assert 'name_score_cache_misses_total{cache="ml_prob"}' in text
@@ -0,0 +1,92 @@
+from types import SimpleNamespace
+
+import pytest
+
+from conftest import requires_spacy_model
+from mlmodel import name_predictor, name_ranker, shadow
+
+
+@pytest.fixture(autouse=True)
+def _clean_cache():
+    name_ranker.clear_cache()
+    yield
+    name_ranker.clear_cache()
+
+
+def test_scoring_failure_is_not_cached(monkeypatch):
+    def broken():
+        raise RuntimeError("model unavailable")
+
+    monkeypatch.setattr(name_predictor, "get_bundle", broken)
+    assert name_ranker._ml_probs(["Priya"]) == [0.0]
+    assert "Priya" not in name_ranker._ml_cache
+
+    monkeypatch.undo()
+    assert name_ranker._ml_probs(["Priya"])[0] > 0.5
+
+
+def test_shadow_errors_do_not_touch_live_scores(monkeypatch):
+    class BrokenScorer:
+        def observe(self, *args):
+            raise RuntimeError("shadow down")
+
+    monkeypatch.setattr(shadow, "get", lambda model: BrokenScorer())
+    prob = name_ranker._ml_probs(["Priya"])[0]
+    assert prob > 0.5
+    assert name_ranker._ml_cache.get("Priya") == prob
+
+
+SENTENCES = [
+    "Priya will fix the login bug by Friday",
+    "Mohit and Arjun should deploy the API tomorrow",
+    "great demo everyone, thanks Sakshi!",
+]
+
+
+def fake_doc(sentence):
+    """Parsed-doc stand-in: capitalized words tagged PROPN, the first one PERSON."""
+    return [
+        SimpleNamespace(text=word, pos_="PROPN" if word[:1].isupper() else "NOUN",
+                        ent_type_="PERSON" if i == 0 else "", is_stop=word.lower() in {"the", "and", "by"})
+        for i, word in enumerate(sentence.split())
+    ]
+
+
+def per_word(doc):
+    """The unbatched reference: one ml_prob call per word."""
+    scores = []
+    for token in doc:
+        word = name_ranker.preprocess(token.text)
+        if word:
+            name_ranker.clear_cache()
+            ml = name_ranker.ml_prob(word)
+            scores.append((word, name_ranker._combine(word, ml, token.pos_, token.ent_type_, token.is_stop)))
+    return scores
+
+
+def test_batched_ml_probs_match_per_word_calls():
+    words = [w for s in SENTENCES for w in map(name_ranker.preprocess, s.split()) if w]
+    batched = name_ranker._ml_probs(words)
+    name_ranker.clear_cache()
+    assert batched == pytest.approx([name_ranker.ml_prob(w) for w in words])
+
+
+def test_name_scores_many_matches_per_word_scoring():
+    docs = [fake_doc(s) for s in SENTENCES]
+    expected = [per_word(doc) for doc in docs]
+    name_ranker.clear_cache()
+
+    batched = name_ranker.name_scores_many(docs)
+    assert [[w for w, _ in doc] for doc in batched] == [[w for w, _ in doc] for doc in expected]
+    for got, want in zip(batched, expected):
+        assert [s for _, s in got] == pytest.approx([s for _, s in want])
+    assert name_ranker.name_scores(docs[0]) == batched[0]
+
+
+@requires_spacy_model
+def test_single_word_name_scores_match_name_score():
+    for word in ["Priya", "deploy", "tomorrow", "Sakshi", "the"]:
+        name_ranker.clear_cache()
+        expected = name_ranker.name_score(word)
+        name_ranker.clear_cache()
+        assert name_ranker.name_scores(word) == [(word, pytest.approx(expected))]
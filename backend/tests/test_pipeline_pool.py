@@ -0,0 +1,87 @@
+from concurrent.futures import ProcessPoolExecutor
+import asyncio
+import multiprocessing
+import os
+import time
+
+from fastapi.testclient import TestClient
+
+from conftest import requires_spacy_model
+from core import pipeline_pool
+from mlmodel.name_ranker import CACHE_HITS, CACHE_MISSES
+
+TRANSCRIPT = (
+    "Rahul will fix the login bug by Friday. "
+    "We will revisit this topic later. "
+    "Priya should update the API documentation urgently."
+)
+
+
+@requires_spacy_model
+def test_app_starts_with_pool_and_runs_pipeline(monkeypatch):
+    from api import app as app_module
+
+    monkeypatch.setattr(pipeline_pool, "PIPELINE_WORKERS", 2)
+    monkeypatch.setattr(app_module, "WARMUP_MODE", "startup")
+    lookups = CACHE_HITS.value(cache="ml_prob") + CACHE_MISSES.value(cache="ml_prob")
+    try:
+        with TestClient(app_module.app):
+            workers = app_module.startup_report["pipeline_workers"]
+            assert len(set(workers)) == 2 and os.getpid() not in workers
+
+            tasks = asyncio.run(pipeline_pool.run_pipeline(TRANSCRIPT, auto_assign=False))
+    finally:
+        pipeline_pool.shutdown_pool()
+
+    assert [t["task"] for t in tasks] == [
+        "Rahul will fix the login bug by Friday.",
+        "Priya should update the API documentation urgently.",
+    ]
+    assert tasks[0]["deadline"] == "Friday"
+    # worker-side counter increments are merged into this process
+    assert CACHE_HITS.value(cache="ml_prob") + CACHE_MISSES.value(cache="ml_prob") > lookups
+
+
+@requires_spacy_model
+def test_worker_shadow_stats_reach_the_api_process(tmp_path, monkeypatch):
+    from api import app as app_module
+    from mlmodel import registry, shadow, task_predictor
+
+    # candidate v1 (same artifacts as live); workers shadow it via the env
+    monkeypatch.setattr(registry, "REGISTRY_DIR", str(tmp_path))
+    registry.publish("task", task_predictor.BASE_DIR, activate=False)
+    monkeypatch.setenv("REGISTRY_DIR", str(tmp_path))
+    monkeypatch.setenv("SHADOW_TASK_VERSION", "v1")
+    monkeypatch.setattr(shadow, "_SCORERS", {})
+    shadow.configure("task", task_predictor.BASE_DIR)
+
+    monkeypatch.setattr(pipeline_pool, "PIPELINE_WORKERS", 1)
+    monkeypatch.setattr(app_module, "WARMUP_MODE", "startup")
+    try:
+        with TestClient(app_module.app) as client:
+            # shadow batches finish after the result is sent and ride along
+            # with the next one
+            for _ in range(20):
+                asyncio.run(pipeline_pool.run_pipeline(TRANSCRIPT, auto_assign=False))
+                stats = client.get("/models").json()["task"]["shadow"]
+                if stats["items"]:
+                    break
+                time.sleep(0.05)
+    finally:
+        pipeline_pool.shutdown_pool()
+
+    assert stats["version"] == "v1"
+    assert stats["items"] > 0 and stats["agreement"] == 1.0
+
+
+def test_start_pool_reaches_every_worker(monkeypatch):
+    # no initializer: this only checks that each worker takes one ping
+    monkeypatch.setattr(pipeline_pool, "PIPELINE_WORKERS", 3)
+    monkeypatch.setattr(pipeline_pool, "POOL_START_TIMEOUT_S", 60)
+    monkeypatch.setattr(pipeline_pool, "_pool", ProcessPoolExecutor(
+        max_workers=3, mp_context=multiprocessing.get_context("spawn")))
+    try:
+        workers = pipeline_pool.start_pool()
+    finally:
+        pipeline_pool.shutdown_pool()
+    assert len(workers) == len(set(workers)) == 3
@@ -0,0 +1,100 @@
+import json
+import os
+
+import pytest
+
+from services.roster_service import Roster
+
+
+@pytest.fixture
+def roster(tmp_path):
+    members = [
+        {"name": "Rahul Sharma", "skills": ["C++", "embedded"]},
+        {"name": "Rahul Verma", "skills": ["C", "firmware"]},
+        {"name": "Will Smith", "skills": ["node.js"]},
+        {"name": "Priya Nair", "aliases": ["PN"], "skills": ["react", "ui"]},
+    ]
+    path = tmp_path / "team.json"
+    path.write_text(json.dumps(members))
+    return Roster(str(path))
+
+
+def test_skills_keep_symbols(roster):
+    assert roster.best_for_skills("write a c program")["name"] == "Rahul Verma"
+    assert roster.best_for_skills("port the driver to C++.")["name"] == "Rahul Sharma"
+    assert roster.best_for_skills("upgrade node.js")["name"] == "Will Smith"
+    assert roster.best_for_skills("upgrade node") is None
+
+
+def test_shared_first_name_is_ambiguous(roster):
+    assert roster.find_member("Rahul will fix the login bug") is None
+    assert roster.resolve("rahul") is None
+    assert roster.find_member("Rahul Verma will fix the login bug")["name"] == "Rahul Verma"
+    assert roster.resolve("Sharma")["name"] == "Rahul Sharma"
+
+
+def test_common_word_names_need_a_capitalized_mention(roster):
+    assert roster.find_member("we will ship it on Friday") is None
+    assert roster.find_member("Will you review this?") is None
+    assert roster.find_member("Ask Will to update the docs")["name"] == "Will Smith"
+    assert roster.find_member("will smith should update the docs")["name"] == "Will Smith"
+    assert roster.find_member("pn should review the UI")["name"] == "Priya Nair"
+
+
+def test_words_flags_capitalized_mid_sentence_words():
+    from services.roster_service import _words
+
+    assert _words("Will said we will ship. Then Will left!  Will?") == [
+        ("will", False), ("said", False), ("we", False), ("will", False), ("ship", False),
+        ("then", False), ("will", True), ("left", False), ("will", False),
+    ]
+    assert _words("  ") == []
+
+
+def test_best_for_skills_ties_and_counts(tmp_path):
+    members = [
+        {"name": "Ana Costa", "skills": ["python", "api"]},
+        {"name": "Ben Okafor", "skills": ["python", "machine learning", "sql"]},
+        {"name": "Cara Diaz", "skills": ["sql"]},
+    ]
+    path = tmp_path / "team.json"
+    path.write_text(json.dumps(members))
+    roster = Roster(str(path))
+
+    # one skill each: the earlier roster entry wins
+    assert roster.best_for_skills("write the python script")["name"] == "Ana Costa"
+    assert roster.best_for_skills("tune the sql query")["name"] == "Ben Okafor"
+    # more distinct skills win; repeating a skill does not count twice
+    assert roster.best_for_skills("python and sql for the machine learning job")["name"] == "Ben Okafor"
+    assert roster.best_for_skills("sql, sql and more sql in the python api")["name"] == "Ana Costa"
+    # multi-word skills match as a phrase only
+    assert roster.best_for_skills("the machine is learning") is None
+    assert roster.best_for_skills("plan the offsite") is None
+
+
+def test_index_rebuilds_when_the_file_changes(tmp_path, monkeypatch):
+    from services import roster_service
+
+    path = tmp_path / "team.json"
+    path.write_text(json.dumps([{"name": "Ana Costa", "skills": ["python"]}]))
+    loads = []
+    load_members = roster_service.load_members
+    monkeypatch.setattr(roster_service, "load_members", lambda *a: loads.append(a) or load_members(*a))
+    roster = Roster(str(path))
+
+    assert roster.best_for_skills("fix the python bug")["name"] == "Ana Costa"
+    assert roster.find_member("Ana will do it")["name"] == "Ana Costa"
+    first = roster.snapshot()
+    assert roster.snapshot() is first and len(loads) == 1  # unchanged file: no reload
+
+    path.write_text(json.dumps([{"name": "Ben Okafor", "skills": ["python", "go"]}]))
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, first.mtime + 1_000_000_000))
+
+    assert roster.best_for_skills("fix the python bug")["name"] == "Ben Okafor"
+    assert roster.find_member("Ana will do it") is None
+    assert len(loads) == 2
+
+    path.unlink()
+    assert roster.members == []
+    assert roster.best_for_skills("fix the python bug") is None
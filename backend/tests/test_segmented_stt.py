@@ -0,0 +1,54 @@
+import sys
+import wave
+
+import pytest
+
+from services.segmented_stt import transcribe_segmented
+from services.stt_backends import LocalBackend
+
+WORDS = [f"word{i}" for i in range(60)]
+
+
+@pytest.fixture
+def recording(tmp_path):
+    """30 s of silence with a 60-word sidecar transcript."""
+    path = tmp_path / "meeting.wav"
+    with wave.open(str(path), "wb") as f:
+        f.setnchannels(1)
+        f.setsampwidth(2)
+        f.setframerate(8000)
+        f.writeframes(b"\0\0" * 8000 * 30)
+    (tmp_path / "meeting.txt").write_text(" ".join(WORDS), encoding="utf-8")
+    return str(path)
+
+
+def test_local_backend_returns_each_windows_words(recording):
+    backend = LocalBackend()
+    texts = []
+
+    def transcribe(segment):
+        text = backend.transcribe_window(segment)
+        texts.append((segment.index, text))
+        return text
+
+    transcript = transcribe_segmented(recording, transcribe, window=10, overlap=2, max_workers=1)
+
+    texts = [text for _, text in sorted(texts)]
+    assert len(texts) == 4
+    assert len(set(texts)) == 4
+    assert texts[0].split() == WORDS[:20]
+    assert texts[1].split()[:4] == WORDS[16:20]  # the 2 s overlap
+    assert transcript == " ".join(WORDS)
+
+
+def test_single_window_gets_the_whole_file(recording):
+    transcript = transcribe_segmented(recording, LocalBackend().transcribe_window, window=60, overlap=2)
+    assert transcript == " ".join(WORDS)
+
+
+def test_non_wav_without_pydub_fails_clearly(tmp_path, monkeypatch):
+    monkeypatch.setitem(sys.modules, "pydub", None)
+    path = tmp_path / "meeting.mp3"
+    path.write_bytes(b"\0" * 16)
+    with pytest.raises(RuntimeError, match="pydub"):
+        transcribe_segmented(str(path), LocalBackend(default="x").transcribe_window, window=10, overlap=2)
@@ -0,0 +1,136 @@
+from types import SimpleNamespace
+
+import pytest
+
+from conftest import requires_spacy_model
+from nlp import sentence_splitter
+from nlp.sentence_splitter import SentenceSplitter, looks_punctuated
+
+TRANSCRIPTS = [
+    "Priya will fix the login bug by Friday. Mohit should update the docs.",
+    "",
+    "Deploy the release tomorrow\nWrite the incident report this week",
+]
+RUN_ON = " ".join(["fix the login bug and then update the docs"] * 4)  # 36 words, no punctuation
+
+
+def fake_doc(text):
+    """A spaCy-like doc whose sentences are groups of four words."""
+    words = text.split()
+    return SimpleNamespace(sents=[SimpleNamespace(text=" ".join(words[i:i + 4]))
+                                  for i in range(0, len(words), 4)])
+
+
+@pytest.fixture
+def spacy_calls(monkeypatch):
+    calls = []
+
+    def parse(text, profile):
+        calls.append(text)
+        return fake_doc(text)
+
+    def pipe(texts, profile, batch_size):
+        for text in texts:
+            yield parse(text, profile)
+
+    monkeypatch.setattr(sentence_splitter, "parse", parse)
+    monkeypatch.setattr(sentence_splitter, "pipe", pipe)
+    return calls
+
+
+def test_looks_punctuated():
+    assert looks_punctuated(TRANSCRIPTS[0])
+    assert looks_punctuated("")
+    assert looks_punctuated(" ".join(["word"] * 30))
+    assert not looks_punctuated(RUN_ON)
+
+
+def test_strategy_selection(spacy_calls):
+    assert SentenceSplitter(strategy="regex").split(RUN_ON) == [RUN_ON]
+    assert spacy_calls == []
+
+    assert len(SentenceSplitter(strategy="auto").split(RUN_ON)) == 9
+    assert spacy_calls == [RUN_ON]
+
+    assert SentenceSplitter(strategy="auto").split(TRANSCRIPTS[0]) == [
+        "Priya will fix the login bug by Friday.", "Mohit should update the docs."]
+    assert spacy_calls == [RUN_ON]
+
+    SentenceSplitter(strategy="spacy").split(TRANSCRIPTS[0])
+    assert spacy_calls == [RUN_ON, TRANSCRIPTS[0]]
+
+
+def test_short_run_on_is_not_split(spacy_calls):
+    short = " ".join(RUN_ON.split()[:30])
+    assert SentenceSplitter(strategy="auto").split(short) == [short]
+    assert spacy_calls == []
+
+
+def test_unknown_strategy():
+    with pytest.raises(ValueError, match="Unknown strategy"):
+        SentenceSplitter(strategy="nltk")
+
+
+def test_min_length():
+    text = "Fix UI. Great demo everyone."
+    assert SentenceSplitter(strategy="regex").split(text) == ["Great demo everyone."]
+    assert SentenceSplitter(strategy="regex", enforce_min_length=False).split(text) == [
+        "Fix UI.", "Great demo everyone."]
+
+
+def test_split_each_keeps_order_and_empty_blocks(spacy_calls):
+    blocks = [TRANSCRIPTS[0], "", RUN_ON, None, TRANSCRIPTS[2]]
+    splitter = SentenceSplitter(strategy="auto")
+    sentences = splitter.split_each(blocks)
+
+    assert spacy_calls == [RUN_ON]
+    assert sentences[0] == ["Priya will fix the login bug by Friday.", "Mohit should update the docs."]
+    assert sentences[1] == []
+    assert sentences[2] == splitter.split(RUN_ON)
+    assert sentences[3] == []
+    assert sentences[4] == ["Deploy the release tomorrow", "Write the incident report this week"]
+    assert splitter.split_many(blocks) == [s for block in sentences for s in block]
+
+
+def test_pipeline_keeps_short_sentences():
+    from nlp import pipeline
+
+    assert pipeline.SPLITTER.split(
+        "Mohit please fix the login bug by friday. Fix UI. Great demo everyone."
+    ) == ["Mohit please fix the login bug by friday.", "Fix UI.", "Great demo everyone."]
+
+
+@requires_spacy_model
+def test_pipeline_extracts_short_imperatives():
+    from nlp import pipeline
+
+    transcript = "Mohit please fix the login bug by friday. Fix UI. Great demo everyone."
+    tasks = [t["task"] for t in pipeline.process_transcript(transcript)]
+    assert "Fix UI." in tasks
+    assert "Fix UI." in [t["task"] for t in pipeline.process_transcripts([transcript])[0]]
+
+
+@requires_spacy_model
+def test_pipeline_splits_with_the_sentence_splitter(monkeypatch):
+    from nlp import pipeline
+
+    calls = []
+
+    class Recording(SentenceSplitter):
+        def split(self, transcript):
+            calls.append("split")
+            return super().split(transcript)
+
+        def split_each(self, transcripts):
+            calls.append("split_each")
+            return super().split_each(transcripts)
+
+    monkeypatch.setattr(pipeline, "SPLITTER", Recording(enforce_min_length=False))
+    single = pipeline.process_transcript(TRANSCRIPTS[2])
+    many = pipeline.process_transcripts(TRANSCRIPTS)
+
+    assert calls == ["split", "split_each"]
+    # newline-separated STT lines are separate sentences, so separate tasks
+    assert [t["task"] for t in single] == [t["task"] for t in many[2]]
+    assert len(single) == 2
+    assert many[1] == []
@@ -0,0 +1,40 @@
+import pytest
+
+from mlmodel import hot_reload, registry, shadow, task_predictor
+
+
+@pytest.fixture
+def scorer(monkeypatch):
+    monkeypatch.setattr(shadow, "_SCORERS", {})
+    monkeypatch.setattr(shadow, "_forward", None)
+    return shadow.configure("task", task_predictor.BASE_DIR, version="v7")
+
+
+def test_worker_samples_are_forwarded_and_merged(scorer, monkeypatch):
+    # worker side: results are queued, not counted
+    shadow.forward_samples()
+    scorer.record({"event": "scored", "items": 4, "agreed": 3,
+                   "live_seconds": 0.01, "shadow_seconds": 0.02})
+    scorer.record({"event": "error", "live_seconds": 0.01})
+    samples = shadow.drain()
+    assert len(samples) == 2 and shadow.drain() == []
+    assert scorer.stats()["items"] == 0
+
+    # API side
+    monkeypatch.setattr(shadow, "_forward", None)
+    shadow.merge(samples + [dict(samples[0], version="v8")])  # other version: ignored
+    stats = shadow.stats()["task"]
+    assert (stats["items"], stats["batches"], stats["errors"]) == (4, 1, 1)
+    assert stats["agreement"] == 0.75
+
+
+def test_status_reports_missing_current_version(tmp_path, monkeypatch):
+    monkeypatch.setattr(registry, "REGISTRY_DIR", str(tmp_path))
+    (tmp_path / "task").mkdir()
+    (tmp_path / "task" / registry.CURRENT_FILE).write_text("v9")
+
+    report = hot_reload.status()
+    assert report["task"]["registry_current"] == "v9"
+    assert report["task"]["registry_status"] == "missing"
+    assert report["task"]["metrics"] is None
+    assert report["name"]["registry_status"] == "empty"
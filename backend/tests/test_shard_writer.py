@@ -0,0 +1,45 @@
+import csv
+import os
+
+import pytest
+
+from mlmodel import shard_writer
+from mlmodel.shard_writer import iter_csv, write_deduplicated
+
+HEADER = ["word", "label"]
+
+
+def _rows(n):
+    return ((f"w{i % 97}", i % 2) for i in range(n))
+
+
+def test_dedup_across_flushes_and_shards(tmp_path, monkeypatch):
+    monkeypatch.setattr(shard_writer, "PENDING_ROWS", 10)
+    output = tmp_path / "out"
+
+    stats = write_deduplicated(_rows(1000), str(output), HEADER, shards=3, buckets=512)
+
+    parts = sorted(os.listdir(output))
+    assert parts == ["part-00000.csv", "part-00001.csv", "part-00002.csv"]
+    rows = [tuple(r) for r in iter_csv(str(output), HEADER)]
+    assert len(rows) == len(set(rows)) == stats.rows_out == 194
+    assert stats.rows_in == 1000
+
+
+def test_single_csv_can_replace_its_input(tmp_path):
+    path = tmp_path / "data.csv"
+    write_deduplicated(_rows(50), str(path), HEADER)
+    stats = write_deduplicated(iter_csv(str(path), HEADER), str(path), HEADER)
+    with open(path, newline="") as f:
+        assert next(csv.reader(f)) == HEADER
+    assert stats.rows_out == stats.rows_in == 50
+
+
+def test_output_kind_is_validated_before_writing(tmp_path):
+    existing = tmp_path / "data.csv"
+    existing.write_text("word,label\n")
+    with pytest.raises(ValueError):
+        write_deduplicated(_rows(5), str(existing), HEADER, shards=2)
+    with pytest.raises(ValueError):
+        write_deduplicated(_rows(5), str(tmp_path), HEADER)
+    assert existing.read_text() == "word,label\n"
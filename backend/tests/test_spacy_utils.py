@@ -0,0 +1,93 @@
+from types import SimpleNamespace
+
+import pytest
+
+from conftest import requires_spacy_model
+from nlp import spacy_utils
+
+# en_core_web_sm's pipeline: tagger and parser listen to the shared tok2vec
+SM_PIPES = ["tok2vec", "tagger", "parser", "senter", "attribute_ruler", "lemmatizer", "ner"]
+
+
+class FakeNLP:
+    def __init__(self, pipe_names, listeners=("tagger", "parser")):
+        self.pipe_names = list(pipe_names)
+        self._tok2vec = SimpleNamespace(listening_components=list(listeners))
+        self.calls = []
+
+    def get_pipe(self, name):
+        assert name == "tok2vec"
+        return self._tok2vec
+
+    def __call__(self, text, disable):
+        self.calls.append(("call", text, disable))
+        return text
+
+    def pipe(self, texts, batch_size, n_process, disable):
+        self.calls.append(("pipe", list(texts), disable))
+        return iter(())
+
+
+@pytest.fixture
+def fake_nlp(monkeypatch):
+    def install(pipe_names=SM_PIPES, **kwargs):
+        nlp = FakeNLP(pipe_names, **kwargs)
+        monkeypatch.setattr(spacy_utils, "get_nlp", lambda: nlp)
+        monkeypatch.setattr(spacy_utils, "_DISABLED", {})
+        return nlp
+
+    return install
+
+
+def test_profiles_disable_unneeded_components(fake_nlp):
+    fake_nlp()
+    assert spacy_utils.disabled_for("full") == ["senter"]
+    assert spacy_utils.disabled_for("sentences") == [
+        "tok2vec", "tagger", "parser", "attribute_ruler", "lemmatizer", "ner"]
+    assert spacy_utils.disabled_for("names") == ["parser", "senter", "lemmatizer"]
+
+
+def test_tok2vec_kept_only_for_listeners(fake_nlp):
+    fake_nlp(listeners=["parser"])
+    assert "tok2vec" in spacy_utils.disabled_for("names")
+    assert "tok2vec" not in spacy_utils.disabled_for("full")
+
+
+def test_sentences_fall_back_to_the_parser(fake_nlp):
+    fake_nlp([p for p in SM_PIPES if p != "senter"])
+    assert spacy_utils.disabled_for("sentences") == ["tagger", "attribute_ruler", "lemmatizer", "ner"]
+
+
+def test_unknown_profile(fake_nlp):
+    fake_nlp()
+    with pytest.raises(ValueError, match="Unknown spaCy profile"):
+        spacy_utils.disabled_for("everything")
+
+
+def test_disabled_list_is_computed_once(fake_nlp, monkeypatch):
+    fake_nlp()
+    first = spacy_utils.disabled_for("names")
+    monkeypatch.setattr(spacy_utils, "get_nlp", lambda: pytest.fail("recomputed"))
+    assert spacy_utils.disabled_for("names") is first
+
+
+def test_parse_and_pipe_pass_the_profile(fake_nlp):
+    nlp = fake_nlp()
+    spacy_utils.parse("Fix the bug", profile="names")
+    list(spacy_utils.pipe(["a", "b"], profile="sentences"))
+    assert nlp.calls == [
+        ("call", "Fix the bug", spacy_utils.disabled_for("names")),
+        ("pipe", ["a", "b"], spacy_utils.disabled_for("sentences")),
+    ]
+    assert spacy_utils.ensure_doc("   ") is None
+
+
+@requires_spacy_model
+def test_profiles_on_the_real_model():
+    doc = spacy_utils.parse("Priya will fix the bug. Mohit updates the docs.", profile="sentences")
+    assert len(list(doc.sents)) == 2
+    nlp = spacy_utils.get_nlp()
+    for profile, needed in spacy_utils.PROFILES.items():
+        disabled = spacy_utils.disabled_for(profile)
+        assert set(disabled) <= set(nlp.pipe_names)
+        assert not set(needed) & set(disabled)
@@ -0,0 +1,66 @@
+import json
+
+import pytest
+
+from api import app as app_module
+
+TASKS = [
+    {"task": "Fix the login bug", "assigned_to": None, "deadline": "Friday", "priority": None},
+    {"task": "Update the docs", "assigned_to": None, "deadline": None, "priority": "High"},
+]
+
+
+@pytest.fixture(autouse=True)
+def fake_pipeline(monkeypatch):
+    def iter_tasks(transcript):
+        yield from (TASKS if transcript else [])
+
+    monkeypatch.setattr(app_module, "iter_tasks", iter_tasks)
+
+
+def stream(client, transcript="meeting", **kwargs):
+    return client.post("/transcript/stream", json={"transcript": transcript, "auto_assign": False}, **kwargs)
+
+
+def sse_events(body):
+    events = []
+    for block in body.strip().split("\n\n"):
+        lines = dict(line.split(": ", 1) for line in block.splitlines())
+        events.append((lines["event"], json.loads(lines["data"])))
+    return events
+
+
+def test_ndjson_is_the_default(api_client):
+    response = stream(api_client)
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    assert response.text.endswith("\n")
+    assert [json.loads(line) for line in response.text.splitlines()] == TASKS
+
+
+@pytest.mark.parametrize("kwargs", [
+    {"params": {"format": "sse"}},
+    {"headers": {"accept": "text/event-stream"}},
+], ids=["query", "accept"])
+def test_sse_framing(api_client, kwargs):
+    response = stream(api_client, **kwargs)
+    assert response.headers["content-type"].startswith("text/event-stream")
+    assert response.headers["cache-control"] == "no-cache"
+    assert sse_events(response.text) == [("task", TASKS[0]), ("task", TASKS[1]), ("done", {"count": 2})]
+
+
+def test_sse_without_tasks_still_says_done(api_client):
+    response = stream(api_client, transcript="", params={"format": "sse"})
+    assert sse_events(response.text) == [("done", {"count": 0})]
+
+
+def test_explicit_format_beats_accept_header(api_client):
+    response = stream(api_client, params={"format": "ndjson"}, headers={"accept": "text/event-stream"})
+    assert [json.loads(line) for line in response.text.splitlines()] == TASKS
+
+
+def test_auto_assign_assigns_each_task(api_client, monkeypatch):
+    monkeypatch.setattr(app_module, "assign_tasks",
+                        lambda tasks: [dict(t, assigned_to="Priya") for t in tasks])
+    response = api_client.post("/transcript/stream", json={"transcript": "meeting"})
+    assert [json.loads(line)["assigned_to"] for line in response.text.splitlines()] == ["Priya", "Priya"]
@@ -0,0 +1,82 @@
+import json
+
+import pytest
+
+from services import stt_backends, stt_service
+from services.stt_backends import GeminiBackend, LocalBackend
+from services.transcript_cache import TranscriptCache, file_sha256
+
+
+@pytest.fixture(autouse=True)
+def fresh_backend(monkeypatch):
+    for name in ("STT_BACKEND", "STT_MODEL", "STT_LOCAL_TRANSCRIPTS", "STT_LOCAL_DEFAULT"):
+        monkeypatch.delenv(name, raising=False)
+    stt_backends._BACKEND.reset()
+    yield
+    stt_backends._BACKEND.reset()
+
+
+@pytest.fixture
+def audio(tmp_path):
+    path = tmp_path / "meeting.mp3"
+    path.write_bytes(b"fake audio")
+    return path
+
+
+def test_gemini_is_the_default_and_stays_lazy(monkeypatch):
+    backend = stt_backends.get_backend()
+    assert isinstance(backend, GeminiBackend)
+    assert backend.name == "gemini-2.5-flash"
+    assert not backend._model.loaded  # no SDK import, key lookup or network yet
+
+    stt_backends._BACKEND.reset()
+    monkeypatch.setenv("STT_MODEL", "gemini-2.5-pro")
+    assert stt_backends.get_backend().name == "gemini-2.5-pro"
+
+
+def test_local_backend_is_selected_and_cached(monkeypatch):
+    monkeypatch.setenv("STT_BACKEND", "LOCAL")
+    monkeypatch.setenv("STT_LOCAL_DEFAULT", "fix the login bug")
+    backend = stt_backends.get_backend()
+    assert isinstance(backend, LocalBackend)
+    assert backend.name == "local"
+    assert stt_backends.get_backend() is backend
+
+
+def test_unknown_backend(monkeypatch):
+    monkeypatch.setenv("STT_BACKEND", "whisper")
+    with pytest.raises(ValueError, match="Unknown STT_BACKEND"):
+        stt_backends.get_backend()
+
+
+def test_local_lookup_order(tmp_path, audio):
+    assert LocalBackend(default="default text").transcribe(str(audio)) == "default text"
+
+    (tmp_path / "meeting.txt").write_text("stem sidecar\n", encoding="utf-8")
+    assert LocalBackend(default="default text").transcribe(str(audio)) == "stem sidecar"
+    (tmp_path / "meeting.mp3.txt").write_text("full sidecar", encoding="utf-8")
+    assert LocalBackend().transcribe(str(audio)) == "full sidecar"
+
+    mapping = tmp_path / "transcripts.json"
+    mapping.write_text(json.dumps({"meeting.mp3": "by name"}), encoding="utf-8")
+    assert LocalBackend(str(mapping)).transcribe(str(audio)) == "by name"
+    mapping.write_text(json.dumps({file_sha256(str(audio)): "by hash", "meeting.mp3": "by name"}),
+                       encoding="utf-8")
+    assert LocalBackend(str(mapping)).transcribe(str(audio)) == "by hash"
+
+
+def test_local_without_transcript_fails(audio):
+    with pytest.raises(RuntimeError, match="No local transcript"):
+        LocalBackend().transcribe(str(audio))
+
+
+def test_speech_to_text_runs_offline(monkeypatch, tmp_path, audio):
+    monkeypatch.setenv("STT_BACKEND", "local")
+    monkeypatch.setenv("STT_LOCAL_DEFAULT", "fix the login bug")
+    monkeypatch.setattr(stt_service, "SEGMENT_SECONDS", 0)
+    cache = TranscriptCache(str(tmp_path / "cache"), max_bytes=10_000, ttl_seconds=60)
+    monkeypatch.setattr(stt_service, "transcript_cache", cache)
+
+    assert stt_service.speech_to_text(str(audio)) == "fix the login bug"
+    assert stt_service.speech_to_text(str(audio)) == "fix the login bug"
+    assert (cache.stats()["hits"], cache.stats()["misses"]) == (1, 1)
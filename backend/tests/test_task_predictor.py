@@ -0,0 +1,39 @@
+import pytest
+
+from mlmodel import task_predictor
+
+SENTENCES = [
+    "Mohit please fix the login bug by friday.",
+    "Fix UI.",
+    "Great demo everyone.",
+    "Priya should update the API documentation urgently.",
+    "We will revisit this topic later.",
+    "",
+]
+
+
+def test_batch_matches_single_sentence_calls():
+    assert task_predictor.is_task_batch(SENTENCES) == [task_predictor.is_task(s) for s in SENTENCES]
+    assert task_predictor.is_task_batch([]) == []
+
+
+def test_threshold_is_respected(monkeypatch):
+    probs = task_predictor.task_probabilities(SENTENCES)
+    assert all(0.0 <= p <= 1.0 for p in probs)
+    for threshold in sorted(set(probs)) + [0.0, 1.01]:
+        expected = [p >= threshold for p in probs]
+        assert task_predictor.is_task_batch(SENTENCES, threshold) == expected
+        assert [task_predictor.is_task(s, threshold) for s in SENTENCES] == expected
+
+    monkeypatch.setattr(task_predictor, "TASK_THRESHOLD", 1.01)
+    assert task_predictor.is_task_batch(SENTENCES) == [False] * len(SENTENCES)
+    monkeypatch.setattr(task_predictor, "TASK_THRESHOLD", 0.0)
+    assert task_predictor.is_task_batch(SENTENCES) == [True] * len(SENTENCES)
+
+
+def test_probabilities_match_the_model_directly():
+    bundle = task_predictor.get_bundle()
+    X = bundle.vectorizer.transform([task_predictor.preprocess(s) for s in SENTENCES])
+    column = [str(c) for c in bundle.model.classes_].index("1")
+    assert task_predictor.task_probabilities(SENTENCES) == pytest.approx(
+        bundle.model.predict_proba(X)[:, column].tolist())
@@ -0,0 +1,68 @@
+import dataclasses
+import json
+
+import joblib
+import pytest
+
+from mlmodel import train
+
+
+def _preprocess_with(pattern):
+    namespace = {}
+    exec(f"import re\ndef preprocess(text):\n    return re.sub(r'{pattern}', ' ', text)\n", namespace)
+    return namespace["preprocess"]
+
+
+def test_cache_key_changes_with_preprocess_constants():
+    spec = train.SPECS["task"]
+    keys = {
+        train.cache_key(dataclasses.replace(spec, preprocess=_preprocess_with(p)), "sha")
+        for p in ("[^a-z]", "[^a-z0-9]")
+    }
+    assert len(keys) == 2
+
+
+def test_cache_key_changes_with_vectorizer_params():
+    spec = train.SPECS["task"]
+    changed = dataclasses.replace(spec, vectorizer_params={"min_df": 2})
+    assert train.cache_key(spec, "sha") != train.cache_key(changed, "sha")
+
+
+def test_vectorizer_is_fit_on_the_training_split_only(tmp_path):
+    # every row has its own token, so any test-split leakage shows up in the vocabulary
+    rows = [(f"please fix widget{i}", 1) if i % 2 else (f"we discussed gadget{i}", 0) for i in range(80)]
+    data = tmp_path / "data.csv"
+    data.write_text("sentence,label\n" + "".join(f"{s},{y}\n" for s, y in rows))
+
+    assert train.main(["task", "--data", str(data), "--output-dir", str(tmp_path),
+                       "--cache-dir", str(tmp_path / "cache"), "--cv", "2", "--n-jobs", "1",
+                       "--test-size", "0.25", "--seed", "3"]) == 0
+
+    vectorizer = joblib.load(tmp_path / "task_vectorizer.pkl")
+    unique = {w for w in vectorizer.vocabulary_ if w.startswith(("widget", "gadget"))}
+    assert len(unique) == 60
+    report = json.loads((tmp_path / "task_training_report.json").read_text())
+    assert report["dataset"]["test_rows"] == 20
+
+
+def test_streaming_training_on_the_bundled_data(tmp_path):
+    from mlmodel.compact_model import CompactClassifier, CompactVectorizer
+    from mlmodel.task_predictor import preprocess
+
+    assert train.main(["task", "--streaming", "--output-dir", str(tmp_path), "--chunksize", "400",
+                       "--epochs", "3", "--n-features", str(2 ** 16)]) == 0
+
+    report = json.loads((tmp_path / "task_training_report.json").read_text())
+    assert report["dataset"]["rows"] > 2000
+    assert report["metrics"]["test_accuracy"] > 0.8
+
+    model = joblib.load(tmp_path / "task_classifier.pkl")
+    vectorizer = joblib.load(tmp_path / "task_vectorizer.pkl")
+    sentences = ["Rahul please fix the login bug by friday", "that was a great demo everyone"]
+    X = vectorizer.transform([preprocess(s) for s in sentences])
+    assert list(model.predict(X)) == [1, 0]
+
+    # the compact export of a hashed model serves the same probabilities
+    compact = str(tmp_path / "task_model.compact")
+    rows = CompactVectorizer(compact).transform([preprocess(s) for s in sentences])
+    assert CompactClassifier(compact).predict_proba(rows) == pytest.approx(model.predict_proba(X))
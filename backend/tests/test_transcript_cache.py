@@ -0,0 +1,104 @@
+import hashlib
+import os
+
+import pytest
+
+from services import transcript_cache
+from services.transcript_cache import TranscriptCache, file_sha256
+
+SHA_A, SHA_B, SHA_C = (hashlib.sha256(x).hexdigest() for x in (b"a", b"b", b"c"))
+
+
+def entry_size(cache, sha):
+    return os.path.getsize(cache._path(sha, "m"))
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1_000_000.0]
+    monkeypatch.setattr(transcript_cache.time, "time", lambda: now[0])
+    return now
+
+
+def test_keyed_by_audio_sha256_and_model(tmp_path):
+    first, second = tmp_path / "one.wav", tmp_path / "renamed.mp3"
+    first.write_bytes(b"same audio")
+    second.write_bytes(b"same audio")
+    assert file_sha256(str(first)) == file_sha256(str(second)) == hashlib.sha256(b"same audio").hexdigest()
+
+    cache = TranscriptCache(str(tmp_path / "cache"), max_bytes=10_000, ttl_seconds=60)
+    cache.put(file_sha256(str(first)), "gemini", "hello")
+    assert cache.get(file_sha256(str(second)), "gemini") == "hello"
+    assert cache.get(file_sha256(str(second)), "local") is None
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+def test_ttl_expiry(tmp_path, clock):
+    cache = TranscriptCache(str(tmp_path), max_bytes=10_000, ttl_seconds=60)
+    cache.put(SHA_A, "m", "hello")
+    clock[0] += 59
+    assert cache.get(SHA_A, "m") == "hello"
+    clock[0] += 2
+    assert cache.get(SHA_A, "m") is None
+    assert not os.path.exists(cache._path(SHA_A, "m"))
+    assert cache.stats()["entries"] == 0
+    assert cache.total_bytes == 0
+
+
+def test_lru_eviction_without_rescanning(tmp_path, monkeypatch, clock):
+    probe = TranscriptCache(str(tmp_path / "probe"), max_bytes=10_000, ttl_seconds=60)
+    probe.put(SHA_A, "m", "x" * 100)
+    size = entry_size(probe, SHA_A)
+
+    cache = TranscriptCache(str(tmp_path / "cache"), max_bytes=2 * size, ttl_seconds=60)
+    monkeypatch.setattr(transcript_cache.os, "listdir", lambda path: pytest.fail("put rescanned the directory"))
+    cache.put(SHA_A, "m", "a" * 100)
+    cache.put(SHA_B, "m", "b" * 100)
+    assert cache.get(SHA_A, "m") == "a" * 100  # A is now the most recently used
+    cache.put(SHA_C, "m", "c" * 100)
+
+    assert cache.get(SHA_B, "m") is None
+    assert cache.get(SHA_A, "m") == "a" * 100
+    assert cache.get(SHA_C, "m") == "c" * 100
+    assert cache.total_bytes == 2 * size
+
+
+def test_overwrite_does_not_double_count(tmp_path):
+    cache = TranscriptCache(str(tmp_path), max_bytes=10_000, ttl_seconds=60)
+    cache.put(SHA_A, "m", "first")
+    cache.put(SHA_A, "m", "second")
+    assert cache.stats()["entries"] == 1
+    assert cache.total_bytes == entry_size(cache, SHA_A)
+
+
+def test_index_is_seeded_from_disk_in_mtime_order(tmp_path, clock):
+    cache = TranscriptCache(str(tmp_path), max_bytes=10_000, ttl_seconds=60)
+    for age, sha in ((30, SHA_A), (10, SHA_B), (20, SHA_C)):
+        cache.put(sha, "m", "x" * 100)
+        stamp = os.path.getmtime(cache._path(sha, "m")) - age
+        os.utime(cache._path(sha, "m"), (stamp, stamp))
+    size = entry_size(cache, SHA_A)
+
+    restarted = TranscriptCache(str(tmp_path), max_bytes=10_000, ttl_seconds=60)
+    assert restarted.stats()["entries"] == 3
+    assert restarted.total_bytes == 3 * size
+    assert list(restarted._lru) == [cache._path(s, "m") for s in (SHA_A, SHA_C, SHA_B)]
+
+    # a smaller budget evicts the oldest entries while seeding
+    smaller = TranscriptCache(str(tmp_path), max_bytes=size, ttl_seconds=60)
+    assert list(smaller._lru) == [cache._path(SHA_B, "m")]
+    assert sorted(os.listdir(tmp_path)) == [os.path.basename(cache._path(SHA_B, "m"))]
+
+
+def test_clear_and_disabled(tmp_path):
+    cache = TranscriptCache(str(tmp_path), max_bytes=10_000, ttl_seconds=60)
+    cache.put(SHA_A, "m", "hello")
+    cache.clear()
+    assert cache.get(SHA_A, "m") is None
+    assert cache.total_bytes == 0
+
+    disabled = TranscriptCache(str(tmp_path / "off"), max_bytes=0, ttl_seconds=60)
+    disabled.put(SHA_A, "m", "hello")
+    assert disabled.get(SHA_A, "m") is None
+    assert not os.path.exists(tmp_path / "off")
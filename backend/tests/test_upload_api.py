@@ -0,0 +1,63 @@
+import hashlib
+import os
+
+import pytest
+
+from api import app as app_module
+
+AUDIO = b"RIFF fake audio bytes" * 1000
+
+
+@pytest.fixture
+def upload(monkeypatch, tmp_path):
+    """Fake STT/NLP that record what they were given."""
+    seen = []
+
+    def speech_to_text(path, sha256):
+        with open(path, "rb") as f:
+            data = f.read()
+        seen.append((path, sha256, data))
+        if data == b"broken":
+            raise RuntimeError("STT failed")
+        return "fix the login bug"
+
+    async def run_pipeline(transcript, auto_assign):
+        return [{"task": transcript, "assigned_to": None, "deadline": None, "priority": None}]
+
+    monkeypatch.setattr(app_module, "TEMP_DIR", str(tmp_path))
+    monkeypatch.setattr(app_module, "UPLOAD_CHUNK_SIZE", 4096)
+    monkeypatch.setattr(app_module, "speech_to_text", speech_to_text)
+    monkeypatch.setattr(app_module, "run_pipeline", run_pipeline)
+    return seen
+
+
+def post(client, data=AUDIO, name="meeting.WAV"):
+    return client.post("/upload-audio", files={"file": (name, data, "audio/wav")})
+
+
+def test_response_shape_and_cleanup(api_client, upload, tmp_path):
+    response = post(api_client)
+    assert response.status_code == 200
+    assert response.json() == {
+        "transcript": "fix the login bug",
+        "tasks": [{"task": "fix the login bug", "assigned_to": None, "deadline": None, "priority": None}],
+    }
+
+    path, sha256, data = upload[0]
+    assert data == AUDIO  # streamed in chunks, written completely
+    assert sha256 == hashlib.sha256(AUDIO).hexdigest()
+    assert os.path.dirname(path) == str(tmp_path)
+    assert path.endswith(".wav") and "meeting" not in path
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_same_name_uploads_get_unique_paths(api_client, upload):
+    post(api_client)
+    post(api_client)
+    assert upload[0][0] != upload[1][0]
+
+
+def test_temp_file_removed_when_stt_fails(api_client, upload, tmp_path):
+    with pytest.raises(RuntimeError, match="STT failed"):
+        post(api_client, b"broken")
+    assert list(tmp_path.iterdir()) == []